@@ -0,0 +1,3 @@
+-- Index bill_debates.bill_id for per-bill debate lookups and counts.
+
+CREATE INDEX IF NOT EXISTS "idx_bill_debates_bill_id" ON "bill_debates" USING btree ("bill_id");
@@ -0,0 +1,4 @@
+-- Hash of the summarized input so identical debates reuse a completed summary.
+
+ALTER TABLE "bill_debate_summary" ADD COLUMN IF NOT EXISTS "input_hash" text;
+CREATE INDEX IF NOT EXISTS "idx_bill_debate_summary_input_hash" ON "bill_debate_summary" USING btree ("input_hash");
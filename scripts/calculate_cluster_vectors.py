@@ -13,14 +13,55 @@ This script implements the following algorithm:
 import os
 import json
 import argparse
+import hashlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from scipy.linalg import svd as sp_svd
+from sklearn.utils.extmath import randomized_svd
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 import psycopg2
 from dotenv import load_dotenv
 
+try:
+    import ijson
+except ImportError:
+    # Fall back to loading the whole file with json.load
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange, set_num_threads
+except ImportError:
+    njit = None
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
 # Load environment variables
 load_dotenv()
 
+# Importance weight per bill.result; any other value (null) means the bill
+# is still in deliberation
+BILL_RESULT_WEIGHTS = {"可決": 1.0, "否決": 0.6, "撤回": 0.3, "未了": 0.2}
+DELIBERATION_WEIGHT = 0.8
+
+# Extra random projections used by the truncated SVD beyond n_components
+RANDOMIZED_SVD_OVERSAMPLES = 10
+
+# Voting matrices cached per cluster (see voting_matrix_cache_path)
+VOTING_MATRIX_CACHE_DIR = "data/cache/voting_matrices"
+
+# EM imputation: max refits and relative change at which the fill has converged
+DEFAULT_IMPUTE_ITERATIONS = 5
+IMPUTE_TOLERANCE = 1e-4
+
 
 def get_db_connection():
     """Create database connection."""
@@ -30,10 +71,20 @@ def get_db_connection():
     return psycopg2.connect(database_url)
 
 
-def load_legislation_scores(filepath: str) -> List[Dict]:
-    """Load legislation scores from JSON file."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+def load_legislation_scores(
+    filepath: str, bill_ids: Optional[Set[int]] = None
+) -> Iterator[Dict]:
+    """
+    Stream legislation scores from JSON file.
+
+    If bill_ids is given, only records for those bills are yielded, so
+    records for other bills are never kept in memory.
+    """
+    with open(filepath, "rb") as f:
+        records = ijson.items(f, "item", use_float=True) if ijson else json.load(f)
+        for record in records:
+            if bill_ids is None or record["billId"] in bill_ids:
+                yield record
 
 
 def load_bill_cluster_assignments(conn, cluster_id: int) -> Dict[int, int]:
@@ -57,7 +108,9 @@ def load_bill_cluster_assignments(conn, cluster_id: int) -> Dict[int, int]:
 
 def load_bill_info(conn) -> Dict[int, Dict]:
     """Load bill information including result status."""
-    cursor = conn.cursor()
+    # Server-side cursor: rows are streamed in batches, not fetched at once
+    cursor = conn.cursor(name="load_bill_info")
+    cursor.itersize = 5000
     cursor.execute(
         """
         SELECT b.id, b.result, b.title
@@ -66,7 +119,7 @@ def load_bill_info(conn) -> Dict[int, Dict]:
     )
 
     bills = {}
-    for row in cursor.fetchall():
+    for row in cursor:
         bills[row[0]] = {
             "id": row[0],
             "result": row[1],
@@ -80,43 +133,33 @@ def get_bill_weight(bill_info: Dict, title: str = "") -> float:
     """
     Calculate importance weight for a bill based on its result status.
 
-    Weights based on bill.result:
+    Weights based on bill.result (see BILL_RESULT_WEIGHTS):
     - '可決' (passed): 1.0
     - '否決' (rejected): 0.6
-    - '撤回' (withdrawn): 0.5
-    - '未了' (expired/unfinished): 0.7
+    - '撤回' (withdrawn): 0.3
+    - '未了' (expired/unfinished): 0.2
     - null (still in deliberation): 0.8
     """
-    result = bill_info.get("result")
-
-    if result == "可決":
-        return 1.0
-    elif result == "否決":
-        return 0.6
-    elif result == "撤回":
-        return 0.3
-    elif result == "未了":
-        return 0.2
-    else:
-        # null means still in deliberation
-        return 0.8
+    return BILL_RESULT_WEIGHTS.get(bill_info.get("result"), DELIBERATION_WEIGHT)
 
 
-def normalize_score(score: float, min_score: float = 0, max_score: float = 0) -> float:
-    """Normalize score to [-1, 1] preserving sign.
+def normalize_scores(
+    scores: np.ndarray, min_scores: np.ndarray, max_scores: np.ndarray
+) -> np.ndarray:
+    """Normalize scores to [-1, 1] preserving sign.
 
-    Positive scores are divided by max_score, negative by abs(min_score).
-    This ensures a positive raw score always maps to a positive normalized value.
+    Positive scores are divided by their bill's max score, negative by
+    abs(min score). This ensures a positive raw score always maps to a
+    positive normalized value.
     """
-    if score > 0 and max_score > 0:
-        return score / max_score
-    elif score < 0 and min_score < 0:
-        return score / abs(min_score)
-    return 0.0
+    scale = np.where(scores > 0, max_scores, -min_scores)
+    return np.divide(scores, scale, out=np.zeros_like(scores), where=scores != 0)
 
 
 def build_voting_matrix(
-    legislation_scores: List[Dict], cluster_bills: List[int], bill_info: Dict[int, Dict]
+    legislation_scores: Iterable[Dict],
+    cluster_bills: List[int],
+    bill_info: Dict[int, Dict],
 ) -> Tuple[np.ndarray, List[int], List[int], List[float], List[Dict]]:
     """
     Build member x bill voting matrix for a specific cluster.
@@ -128,48 +171,62 @@ def build_voting_matrix(
         - weights: List of weights for each bill
         - bill_details: List of bill detail dicts for representative bills
     """
-    # Get all members who participated in any of the cluster bills
-    # member_id -> bill_id -> score
-    member_scores_map: Dict[int, Dict[int, float]] = {}
-    member_names: Dict[int, str] = {}
+    cluster_bill_set = set(cluster_bills)
+    bill_ids = sorted(cluster_bill_set)
+    bill_idx = {bill_id: j for j, bill_id in enumerate(bill_ids)}
+
+    # Struct-of-arrays buffers: one flat column per field, one segment per bill
+    member_col = array("q")
+    score_col = array("f")
+    seg_cols: List[int] = []
+    seg_lengths: List[int] = []
 
     for leg_score in legislation_scores:
         bill_id = leg_score["billId"]
-        if bill_id not in cluster_bills:
+        if bill_id not in cluster_bill_set:
             continue
 
-        # Compute per-bill min/max for normalization
-        all_scores = [ms["score"] for ms in leg_score["memberScores"]]
-        bill_max = max(all_scores) if all_scores else 0
-        bill_min = min(all_scores) if all_scores else 0
+        member_scores = leg_score["memberScores"]
+        if not member_scores:
+            continue
 
-        for member_score in leg_score["memberScores"]:
-            member_id = member_score["memberId"]
-            score = member_score["score"]
+        for ms in member_scores:
+            member_col.append(ms["memberId"])
+            score_col.append(ms["score"])
+        seg_cols.append(bill_idx[bill_id])
+        seg_lengths.append(len(member_scores))
 
-            if member_id not in member_scores_map:
-                member_scores_map[member_id] = {}
-            member_scores_map[member_id][bill_id] = normalize_score(
-                score, bill_min, bill_max
-            )
-            member_names[member_id] = member_score["memberName"]
+    if not seg_cols or len(bill_ids) == 0:
+        return np.array([]), [], [], [], []
 
-    # Build matrix
-    member_ids = sorted(member_scores_map.keys())
-    bill_ids = sorted(cluster_bills)
+    members = np.frombuffer(member_col, dtype=np.int64)
+    scores = np.frombuffer(score_col, dtype=np.float32)
+    lengths = np.asarray(seg_lengths)
+    cols = np.repeat(np.asarray(seg_cols, dtype=np.intp), lengths)
 
-    if len(member_ids) == 0 or len(bill_ids) == 0:
-        return np.array([]), [], [], [], []
+    # Per-bill min/max normalization over all segments at once
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    seg_max = np.repeat(np.maximum.reduceat(scores, starts), lengths)
+    seg_min = np.repeat(np.minimum.reduceat(scores, starts), lengths)
+    normalized = normalize_scores(scores, seg_min, seg_max)
 
-    # Initialize matrix with NaN for missing values
-    matrix = np.full((len(member_ids), len(bill_ids)), np.nan)
+    unique_members = np.unique(members)
+    member_ids = unique_members.tolist()
 
-    for i, member_id in enumerate(member_ids):
-        for j, bill_id in enumerate(bill_ids):
-            if bill_id in member_scores_map.get(member_id, {}):
-                matrix[i, j] = member_scores_map[member_id][bill_id]
+    # Initialize matrix with NaN for missing values, then scatter all scores at once
+    matrix = np.full((len(member_ids), len(bill_ids)), np.nan, dtype=np.float32)
+    rows = np.searchsorted(unique_members, members)
+    matrix[rows, cols] = normalized
 
-    # Calculate weights for each bill
+    weights, bill_details = get_bill_weights_and_details(bill_ids, bill_info)
+
+    return matrix, member_ids, bill_ids, weights, bill_details
+
+
+def get_bill_weights_and_details(
+    bill_ids: List[int], bill_info: Dict[int, Dict]
+) -> Tuple[List[float], List[Dict]]:
+    """Calculate the weight and detail dict for each bill column."""
     weights = []
     bill_details = []
     for bill_id in bill_ids:
@@ -185,7 +242,50 @@ def build_voting_matrix(
             }
         )
 
-    return matrix, member_ids, bill_ids, weights, bill_details
+    return weights, bill_details
+
+
+def voting_matrix_cache_path(scores_path: str, cluster_bills: List[int]) -> str:
+    """
+    Cache file for a cluster's voting matrix, keyed by the legislation scores
+    file (path, mtime, size) and the cluster's bill ids.
+    """
+    stat = os.stat(scores_path)
+    key = hashlib.blake2b(digest_size=16)
+    key.update(
+        f"{os.path.abspath(scores_path)}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+    )
+    key.update(np.asarray(sorted(cluster_bills), dtype=np.int64).tobytes())
+    return os.path.join(VOTING_MATRIX_CACHE_DIR, f"{key.hexdigest()}.npz")
+
+
+def load_cached_voting_matrix(
+    cache_path: str,
+) -> Optional[Tuple[np.ndarray, List[int], List[int]]]:
+    """Load (matrix, member_ids, bill_ids) from cache, or None if missing."""
+    if not os.path.exists(cache_path):
+        return None
+    with np.load(cache_path) as cached:
+        return (
+            cached["matrix"],
+            cached["member_ids"].tolist(),
+            cached["bill_ids"].tolist(),
+        )
+
+
+def save_cached_voting_matrix(
+    cache_path: str, matrix: np.ndarray, member_ids: List[int], bill_ids: List[int]
+):
+    """Save a voting matrix to cache (written atomically via rename)."""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp.npz"
+    np.savez(
+        tmp_path,
+        matrix=matrix,
+        member_ids=np.asarray(member_ids, dtype=np.int64),
+        bill_ids=np.asarray(bill_ids, dtype=np.int64),
+    )
+    os.replace(tmp_path, cache_path)
 
 
 def impute_missing_values(matrix: np.ndarray) -> np.ndarray:
@@ -194,22 +294,183 @@ def impute_missing_values(matrix: np.ndarray) -> np.ndarray:
     Replace NaN with column mean (average vote for that bill).
     """
     result = matrix.copy()
-    col_means = np.nanmean(result, axis=0)
+    mask = np.isnan(result)
+    if not mask.any():
+        return result
 
-    # Replace NaN in each column with its mean
-    for j in range(result.shape[1]):
-        mask = np.isnan(result[:, j])
-        if np.any(mask):
-            fill = col_means[j]
-            if np.isnan(fill):
-                fill = 0.0
-            result[mask, j] = fill
+    # Column means over observed votes; columns with no votes fall back to 0
+    counts = np.count_nonzero(~mask, axis=0)
+    sums = np.where(mask, 0, result).sum(axis=0)
+    col_means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+    np.copyto(result, col_means[np.newaxis, :], where=mask)
 
     return result
 
 
+def gram_svd(matrix: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Top-k SVD of a tall/skinny or short/fat matrix via eigendecomposition
+    of the small Gram matrix (A^T A or A A^T).
+    """
+    tall = matrix.shape[0] >= matrix.shape[1]
+    gram = matrix.T @ matrix if tall else matrix @ matrix.T
+
+    eigvals, eigvecs = np.linalg.eigh(gram)
+    top = np.argsort(eigvals)[::-1][:k]
+    S_k = np.sqrt(np.maximum(eigvals[top], 0))
+    small_vecs = eigvecs[:, top]
+
+    # Back out the singular vectors of the large side, guarding zero singular values
+    large_vecs = matrix @ small_vecs if tall else matrix.T @ small_vecs
+    np.divide(large_vecs, S_k, out=large_vecs, where=S_k > 0)
+    large_vecs[:, S_k == 0] = 0
+
+    if tall:
+        return large_vecs, S_k, small_vecs.T
+    return small_vecs, S_k, large_vecs.T
+
+
+def truncated_svd(
+    matrix: np.ndarray, k: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the top-k singular triplets (U_k, S_k, Vt_k), picking the
+    cheapest method for the matrix shape.
+    """
+    n_rows, n_cols = matrix.shape
+
+    if n_rows > 2 * n_cols or n_cols > 2 * n_rows:
+        # Skewed shape: the Gram matrix is small, eigh on it is cheapest
+        return gram_svd(matrix, k)
+
+    if k + RANDOMIZED_SVD_OVERSAMPLES < min(n_rows, n_cols):
+        # Only the top components are kept, so a truncated randomized SVD suffices
+        return randomized_svd(
+            matrix,
+            n_components=k,
+            n_oversamples=RANDOMIZED_SVD_OVERSAMPLES,
+            n_iter=4,
+            random_state=0,
+        )
+
+    # Small matrix: exact SVD (divide-and-conquer driver, reusing the buffer)
+    U, S, Vt = sp_svd(
+        np.asfortranarray(matrix),
+        full_matrices=False,
+        lapack_driver="gesdd",
+        overwrite_a=True,
+        check_finite=False,
+    )
+    return U[:, :k], S[:k], Vt[:k, :]
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def impute_weight_center_kernel(matrix, weights, out, row_means):
+        """Fused column-mean imputation, column weighting and row centering."""
+        n_rows, n_cols = matrix.shape
+
+        col_means = np.zeros(n_cols, dtype=np.float64)
+        for j in prange(n_cols):
+            total = 0.0
+            count = 0
+            for i in range(n_rows):
+                v = matrix[i, j]
+                if not np.isnan(v):
+                    total += v
+                    count += 1
+            if count > 0:
+                col_means[j] = total / count
+
+        for i in prange(n_rows):
+            row_total = 0.0
+            for j in range(n_cols):
+                v = matrix[i, j]
+                if np.isnan(v):
+                    v = col_means[j]
+                v *= weights[j]
+                out[i, j] = v
+                row_total += out[i, j]
+            row_mean = row_total / n_cols
+            row_means[i] = row_mean
+            for j in range(n_cols):
+                out[i, j] -= row_mean
+
+else:
+    impute_weight_center_kernel = None
+
+
+def weight_and_center(
+    matrix: np.ndarray, weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fill missing values with column means, apply bill weights to columns
+    and subtract row means. Runs as a single fused pass when Numba is
+    available.
+
+    Returns the centered matrix and the row means that were subtracted.
+    """
+    if impute_weight_center_kernel is not None:
+        centered_matrix = np.empty_like(matrix)
+        row_means = np.empty(matrix.shape[0], dtype=matrix.dtype)
+        impute_weight_center_kernel(matrix, weights, centered_matrix, row_means)
+        return centered_matrix, row_means[:, np.newaxis]
+
+    weighted_matrix = impute_missing_values(matrix)
+    weighted_matrix *= weights
+    row_means = weighted_matrix.mean(axis=1, keepdims=True)
+    weighted_matrix -= row_means
+    return weighted_matrix, row_means
+
+
+def iterative_impute(
+    voting_matrix: np.ndarray,
+    weights: np.ndarray,
+    n_components: int,
+    max_iter: int = DEFAULT_IMPUTE_ITERATIONS,
+) -> np.ndarray:
+    """
+    Impute missing values with rank-k SVD (EM / gappy SVD).
+
+    Starts from column-mean imputation, then repeatedly refits the weighted,
+    centered rank-k SVD and refills only the missing entries from its
+    reconstruction until the refilled values stop changing.
+    """
+    matrix = impute_missing_values(voting_matrix)
+    missing = np.isnan(voting_matrix)
+    if max_iter <= 0 or not missing.any():
+        return matrix
+
+    k = min(n_components, matrix.shape[0], matrix.shape[1])
+    if k == 0:
+        return matrix
+
+    for _ in range(max_iter):
+        centered_matrix, row_means = weight_and_center(matrix, weights)
+        U_k, S_k, Vt_k = truncated_svd(centered_matrix, k)
+
+        # Undo centering and weighting to get the reconstruction in vote space
+        reconstruction = (U_k * S_k) @ Vt_k
+        reconstruction += row_means
+        reconstruction /= weights
+
+        previous = matrix[missing]
+        updated = reconstruction[missing]
+        matrix[missing] = updated
+
+        change = np.linalg.norm(updated - previous)
+        if change <= IMPUTE_TOLERANCE * max(np.linalg.norm(previous), 1.0):
+            break
+
+    return matrix
+
+
 def calculate_cluster_latent_vectors(
-    voting_matrix: np.ndarray, weights: List[float], n_components: int = 3
+    voting_matrix: np.ndarray,
+    weights: List[float],
+    n_components: int = 3,
+    impute_iterations: int = DEFAULT_IMPUTE_ITERATIONS,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[float]]:
     """
     Calculate latent vectors using weighted PCA/SVD.
@@ -218,6 +479,8 @@ def calculate_cluster_latent_vectors(
         voting_matrix: M x n_bills matrix
         weights: List of weights for each bill
         n_components: Number of latent dimensions to keep
+        impute_iterations: Max EM iterations for missing value imputation
+          (0 = column-mean imputation only)
 
     Returns:
         - member_latent_vectors: M x n_components matrix (U * Sigma)
@@ -229,16 +492,21 @@ def calculate_cluster_latent_vectors(
     if voting_matrix.size == 0:
         return np.array([]), np.array([]), np.array([]), []
 
-    # Impute missing values
-    matrix = impute_missing_values(voting_matrix)
-
-    # Apply weights to bills (columns)
-    weight_matrix = np.diag(weights)
-    weighted_matrix = matrix @ weight_matrix
+    # Scores are normalized to [-1, 1]; float32 halves memory traffic and lets
+    # LAPACK use the single-precision drivers (sgesdd / ssyevd)
+    voting_matrix = np.asarray(voting_matrix, dtype=np.float32)
+    w = np.asarray(weights, dtype=np.float32)
+
+    # Refine missing values with EM; column-mean imputation alone is
+    # handled inside weight_and_center
+    matrix = (
+        iterative_impute(voting_matrix, w, n_components, impute_iterations)
+        if impute_iterations > 0
+        else voting_matrix
+    )
 
-    # Center the matrix (subtract row means)
-    row_means = np.mean(weighted_matrix, axis=1, keepdims=True)
-    centered_matrix = weighted_matrix - row_means
+    # Apply weights to bills (columns) and center the matrix (subtract row means)
+    centered_matrix, _ = weight_and_center(matrix, w)
 
     # Limit components to min of n_components and matrix dimensions
     max_components = min(
@@ -248,19 +516,16 @@ def calculate_cluster_latent_vectors(
     if max_components == 0:
         return np.array([]), np.array([]), np.array([]), []
 
-    # Apply SVD
-    U, S, Vt = np.linalg.svd(centered_matrix, full_matrices=False)
+    # Total variance via the Frobenius norm (sum of all squared singular values)
+    total_variance = float(np.linalg.norm(centered_matrix) ** 2)
 
-    # Keep top n_components
-    U_k = U[:, :max_components]
-    S_k = S[:max_components]
-    V_k = Vt[:max_components, :].T  # n_bills x n_components
+    U_k, S_k, Vt_k = truncated_svd(centered_matrix, max_components)
+    V_k = Vt_k.T  # n_bills x n_components
 
     # Member latent vectors: U * Sigma
-    member_latent_vectors = U_k @ np.diag(S_k)
+    member_latent_vectors = U_k * S_k
 
     # Calculate explained variance ratio
-    total_variance = np.sum(S**2)
     explained_variance_ratio = (
         (S_k**2 / total_variance).tolist() if total_variance > 0 else []
     )
@@ -285,14 +550,21 @@ def find_representative_bills(
     if bill_loadings.size == 0:
         return representative_bills
 
-    n_components = bill_loadings.shape[1]
+    n_bills, n_components = bill_loadings.shape
+    top_n = min(top_n, n_bills)
+    if top_n == 0:
+        return representative_bills
+
+    # Absolute loadings for all dimensions at once
+    abs_loadings = np.abs(bill_loadings)
 
     for dim in range(n_components):
-        # Get absolute loadings for this dimension
-        loadings = np.abs(bill_loadings[:, dim])
+        loadings = abs_loadings[:, dim]
 
-        # Get top N bills
-        top_indices = np.argsort(loadings)[-top_n:][::-1]
+        # Get top N bills: partial selection, then order just those N
+        kth = n_bills - top_n
+        part = np.argpartition(loadings, kth)[kth:]
+        top_indices = part[np.argsort(-loadings[part])]
 
         dim_representatives = []
         for idx in top_indices:
@@ -310,25 +582,38 @@ def find_representative_bills(
 
 
 def calculate_vectors_for_cluster(
-    legislation_scores: List[Dict],
+    legislation_scores: Iterable[Dict],
     cluster_bills: List[int],
     bill_info: Dict[int, Dict],
     member_ids_filter: Optional[List[int]] = None,
     n_components: int = 3,
+    impute_iterations: int = DEFAULT_IMPUTE_ITERATIONS,
+    cache_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Calculate latent vectors for a single cluster.
 
+    If cache_path is given, the voting matrix is read from it when present
+    and written to it after being built otherwise.
+
     Returns a dictionary containing:
     - member_vectors: Dict of member_id -> latent vector
     - bill_loadings: Loading matrix for bills
     - representative_bills: Representative bills for each dimension
     - explained_variance: Variance explained by each component
     """
-    # Build voting matrix
-    (voting_matrix, member_ids, bill_ids, weights, bill_details) = build_voting_matrix(
-        legislation_scores, cluster_bills, bill_info
-    )
+    cached = load_cached_voting_matrix(cache_path) if cache_path else None
+
+    if cached is not None:
+        voting_matrix, member_ids, bill_ids = cached
+        weights, bill_details = get_bill_weights_and_details(bill_ids, bill_info)
+    else:
+        # Build voting matrix
+        (voting_matrix, member_ids, bill_ids, weights, bill_details) = (
+            build_voting_matrix(legislation_scores, cluster_bills, bill_info)
+        )
+        if cache_path and voting_matrix.size > 0:
+            save_cached_voting_matrix(cache_path, voting_matrix, member_ids, bill_ids)
 
     if voting_matrix.size == 0:
         return {
@@ -343,7 +628,9 @@ def calculate_vectors_for_cluster(
 
     # Calculate latent vectors
     member_latent, bill_loadings, singular_values, explained_variance = (
-        calculate_cluster_latent_vectors(voting_matrix, weights, n_components)
+        calculate_cluster_latent_vectors(
+            voting_matrix, weights, n_components, impute_iterations
+        )
     )
 
     if member_latent.size == 0:
@@ -357,10 +644,12 @@ def calculate_vectors_for_cluster(
             "billCount": len(bill_ids),
         }
 
+    # Keep vectors as float32 ndarrays; encode_output serializes them natively
+    member_latent = np.ascontiguousarray(member_latent)
+    bill_loadings = np.ascontiguousarray(bill_loadings)
+
     # Build member vectors dict
-    member_vectors = {}
-    for i, member_id in enumerate(member_ids):
-        member_vectors[member_id] = member_latent[i].tolist()
+    member_vectors = dict(zip(member_ids, member_latent))
 
     # Find representative bills
     representative_bills = find_representative_bills(
@@ -369,7 +658,7 @@ def calculate_vectors_for_cluster(
 
     return {
         "memberVectors": member_vectors,
-        "billLoadings": (bill_loadings.tolist() if bill_loadings.size > 0 else []),
+        "billLoadings": bill_loadings if bill_loadings.size > 0 else [],
         "representativeBills": representative_bills,
         "explainedVariance": explained_variance,
         "dimensions": member_latent.shape[1] if member_latent.ndim > 1 else 0,
@@ -379,6 +668,29 @@ def calculate_vectors_for_cluster(
     }
 
 
+def encode_output(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize output as indented UTF-8 JSON.
+
+    numpy arrays are encoded directly by orjson when it is installed,
+    otherwise converted with .tolist() for the stdlib encoder.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option | orjson.OPT_INDENT_2)
+    return json.dumps(
+        data, ensure_ascii=False, indent=2, default=lambda o: o.tolist()
+    ).encode("utf-8")
+
+
+def limit_worker_threads():
+    """Pin BLAS and Numba to one thread per worker process to avoid oversubscription."""
+    if threadpool_limits is not None:
+        threadpool_limits(limits=1)
+    if njit is not None:
+        set_num_threads(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Calculate cluster-specific member vectors"
@@ -392,6 +704,23 @@ def main():
     parser.add_argument(
         "--n-components", type=int, default=3, help="Number of latent dimensions"
     )
+    parser.add_argument(
+        "--impute-iterations",
+        type=int,
+        default=DEFAULT_IMPUTE_ITERATIONS,
+        help="Max SVD refits for missing vote imputation (0 = column mean only)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for per-cluster SVD (1 = run serially)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rebuild voting matrices instead of reading/writing the on-disk cache",
+    )
     parser.add_argument("--output", type=str, help="Output JSON file path")
     parser.add_argument(
         "--legislation-scores",
@@ -401,10 +730,6 @@ def main():
     )
     args = parser.parse_args()
 
-    print(f"Loading legislation scores from {args.legislation_scores}...")
-    legislation_scores = load_legislation_scores(args.legislation_scores)
-    print(f"Loaded {len(legislation_scores)} legislation records")
-
     print("Connecting to database...")
     conn = get_db_connection()
 
@@ -417,28 +742,96 @@ def main():
     print(f"Loaded info for {len(bill_info)} bills")
 
     # Group bills by cluster label
-    cluster_labels = set(assignments.values())
+    bills_by_label: Dict[int, List[int]] = {}
+    for bill_id, lbl in assignments.items():
+        bills_by_label.setdefault(lbl, []).append(bill_id)
+    cluster_labels = set(bills_by_label)
 
     # Filter to specific cluster label if provided
     if args.cluster_label is not None:
         cluster_labels = {args.cluster_label}
 
+    labels = sorted(cluster_labels)
+    cache_paths: Dict[int, Optional[str]] = {
+        label: (
+            None
+            if args.no_cache
+            else voting_matrix_cache_path(
+                args.legislation_scores, bills_by_label.get(label, [])
+            )
+        )
+        for label in labels
+    }
+
+    # Only clusters without a cached voting matrix need the scores file
+    uncached_labels = {
+        label
+        for label in labels
+        if cache_paths[label] is None or not os.path.exists(cache_paths[label])
+    }
+    if len(uncached_labels) < len(labels):
+        print(
+            f"Using cached voting matrices for {len(labels) - len(uncached_labels)} clusters"
+        )
+
+    # Single pass over the scores file, bucketing records by cluster label
+    records_by_label: Dict[int, List[Dict]] = {label: [] for label in cluster_labels}
+    wanted_bills = {
+        bill_id
+        for label in uncached_labels
+        for bill_id in bills_by_label.get(label, [])
+    }
+
+    if wanted_bills:
+        print(f"Loading legislation scores from {args.legislation_scores}...")
+        n_records = 0
+        for record in load_legislation_scores(args.legislation_scores, wanted_bills):
+            records_by_label[assignments[record["billId"]]].append(record)
+            n_records += 1
+        print(f"Loaded {n_records} legislation records")
+
     print(f"Processing {len(cluster_labels)} cluster labels...")
 
-    results = {}
-    for label in sorted(cluster_labels):
-        cluster_bills = [
-            bill_id for bill_id, lbl in assignments.items() if lbl == label
-        ]
-        print(f"  Cluster {label}: {len(cluster_bills)} bills")
-
-        result = calculate_vectors_for_cluster(
-            legislation_scores, cluster_bills, bill_info, n_components=args.n_components
+    for label in labels:
+        print(f"  Cluster {label}: {len(bills_by_label.get(label, []))} bills")
+
+    def cluster_args(label: int) -> Tuple:
+        return (
+            records_by_label[label],
+            bills_by_label.get(label, []),
+            bill_info,
+            None,
+            args.n_components,
+            args.impute_iterations,
+            cache_paths[label],
         )
+
+    # Each cluster's SVD is independent, so run them across worker processes
+    workers = min(args.workers, len(labels))
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=limit_worker_threads
+        ) as executor:
+            futures = {
+                label: executor.submit(
+                    calculate_vectors_for_cluster, *cluster_args(label)
+                )
+                for label in labels
+            }
+            cluster_results = {label: futures[label].result() for label in labels}
+    else:
+        cluster_results = {
+            label: calculate_vectors_for_cluster(*cluster_args(label))
+            for label in labels
+        }
+
+    results = {}
+    for label in labels:
+        result = cluster_results[label]
         results[str(label)] = result
 
         print(
-            f"    Members: {result['memberCount']}, "
+            f"  Cluster {label}: Members: {result['memberCount']}, "
             f"Dimensions: {result['dimensions']}"
         )
         if result["explainedVariance"]:
@@ -457,11 +850,11 @@ def main():
     }
 
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        with open(args.output, "wb") as f:
+            f.write(encode_output(output_data))
         print(f"Results saved to {args.output}")
     else:
-        print(json.dumps(output_data, ensure_ascii=False, indent=2))
+        print(encode_output(output_data).decode("utf-8"))
 
     return output_data
 
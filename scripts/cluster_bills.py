@@ -6,12 +6,13 @@ Supports multiple clustering algorithms:
 - HDBSCAN (density-based, automatically determines number of clusters)
 """
 
+import io
 import os
 import sys
 import json
+import struct
 import numpy as np
 import psycopg2
-from psycopg2.extras import execute_values
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 from dotenv import load_dotenv
@@ -20,13 +21,20 @@ from dotenv import load_dotenv
 load_dotenv()
 
 try:
-    from sklearn.cluster import KMeans
+    from sklearn.cluster import KMeans, MiniBatchKMeans
+    from sklearn.metrics import pairwise_distances_argmin_min
     from sklearn.decomposition import PCA
-    from sklearn.manifold import TSNE
 except ImportError:
     print("scikit-learn not installed. Run: pip install scikit-learn")
     sys.exit(1)
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 try:
     import hdbscan
 except ImportError:
@@ -34,12 +42,60 @@ except ImportError:
     print("To install: pip install hdbscan")
     hdbscan = None
 
+try:
+    import cuml
+except ImportError:
+    # Optional GPU backend (RAPIDS cuML)
+    cuml = None
+
+
+# Above this many embeddings, K-Means switches to MiniBatchKMeans
+MINIBATCH_KMEANS_THRESHOLD = 10_000
+
+# PostgreSQL binary COPY framing: signature, flags, header extension length
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+PGCOPY_TRAILER = struct.pack(">h", -1)
+
+
+def build_assignments_copy_buffer(
+    cluster_id: int,
+    bill_ids: List[int],
+    cluster_labels: np.ndarray,
+    distances: np.ndarray,
+) -> io.BytesIO:
+    """
+    Encode cluster assignment rows in PostgreSQL binary COPY format.
+
+    Row layout: cluster_id int4, bill_id int4, cluster_label int4,
+    distance text (the column is TEXT, so the float's repr is sent).
+    """
+    row_prefix = struct.Struct(">hiiiiii")
+    buf = io.BytesIO()
+    buf.write(PGCOPY_HEADER)
+
+    for bill_id, label, dist in zip(
+        bill_ids, cluster_labels.tolist(), distances.tolist()
+    ):
+        dist_text = repr(float(dist)).encode()
+        buf.write(row_prefix.pack(4, 4, cluster_id, 4, bill_id, 4, int(label)))
+        buf.write(struct.pack(">i", len(dist_text)))
+        buf.write(dist_text)
+
+    buf.write(PGCOPY_TRAILER)
+    buf.seek(0)
+    return buf
+
 
 class BillClusterer:
-    def __init__(self, database_url: str):
-        """Initialize with database connection."""
+    def __init__(self, database_url: str, backend: str = "cpu"):
+        """Initialize with database connection and compute backend."""
         self.conn = psycopg2.connect(database_url)
 
+        if backend == "gpu" and cuml is None:
+            print("Note: cuml not installed. Falling back to CPU backend.")
+            backend = "cpu"
+        self.backend = backend
+
     def load_embeddings(
         self, embedding_model: Optional[str] = None
     ) -> Tuple[List[int], np.ndarray, str]:
@@ -49,7 +105,9 @@ class BillClusterer:
         Returns:
             Tuple of (bill_ids, embeddings_matrix, model_name)
         """
-        cursor = self.conn.cursor()
+        # Server-side cursor: rows are streamed in batches, not fetched at once
+        cursor = self.conn.cursor(name="load_embeddings")
+        cursor.itersize = 5000
 
         if embedding_model:
             cursor.execute(
@@ -70,21 +128,22 @@ class BillClusterer:
             """
             )
 
-        rows = cursor.fetchall()
-        cursor.close()
-
-        if not rows:
-            raise ValueError("No embeddings found in database")
-
         bill_ids = []
         embeddings = []
-        model_name = rows[0][2]
+        model_name = None
 
-        for bill_id, embedding_json, _ in rows:
+        for bill_id, embedding_json, row_model in cursor:
+            if model_name is None:
+                model_name = row_model
             bill_ids.append(bill_id)
-            embeddings.append(json.loads(embedding_json))
+            embeddings.append(np.asarray(json_loads(embedding_json), dtype=np.float32))
+
+        cursor.close()
+
+        if not bill_ids:
+            raise ValueError("No embeddings found in database")
 
-        embeddings_matrix = np.array(embeddings)
+        embeddings_matrix = np.stack(embeddings)
 
         print(f"Loaded {len(bill_ids)} embeddings")
         print(f"Embedding dimension: {embeddings_matrix.shape[1]}")
@@ -106,15 +165,35 @@ class BillClusterer:
         """
         print(f"\nPerforming K-Means clustering" f" with {n_clusters} clusters...")
 
-        kmeans = KMeans(
-            n_clusters=n_clusters,
-            random_state=random_state,
-            n_init=10,
-        )
-        cluster_labels = kmeans.fit_predict(embeddings)
+        if self.backend == "gpu":
+            kmeans = cuml.cluster.KMeans(
+                n_clusters=n_clusters,
+                random_state=random_state,
+                n_init=10,
+                output_type="numpy",
+            )
+        elif len(embeddings) > MINIBATCH_KMEANS_THRESHOLD:
+            # Large sets: mini-batch updates instead of full Lloyd passes
+            kmeans = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                random_state=random_state,
+                batch_size=1024,
+                n_init=3,
+            )
+        else:
+            # A single k-means++ seeded run instead of 10 restarts
+            kmeans = KMeans(
+                n_clusters=n_clusters,
+                random_state=random_state,
+                init="k-means++",
+                n_init=1,
+            )
+        kmeans.fit(embeddings)
 
-        # Calculate distances to cluster centers
-        distances = np.min(kmeans.transform(embeddings), axis=1)
+        # Assign labels and distances to cluster centers in one GEMM-based pass
+        cluster_labels, distances = pairwise_distances_argmin_min(
+            embeddings, np.asarray(kmeans.cluster_centers_, dtype=embeddings.dtype)
+        )
 
         # Print cluster distribution
         unique, counts = np.unique(cluster_labels, return_counts=True)
@@ -137,7 +216,7 @@ class BillClusterer:
         Returns:
             Tuple of (cluster_labels, probabilities)
         """
-        if hdbscan is None:
+        if self.backend != "gpu" and hdbscan is None:
             raise ImportError("hdbscan package is not installed")
 
         print(
@@ -146,9 +225,16 @@ class BillClusterer:
             f" min_samples={min_samples})..."
         )
 
-        clusterer = hdbscan.HDBSCAN(
-            min_cluster_size=min_cluster_size, min_samples=min_samples
-        )
+        if self.backend == "gpu":
+            clusterer = cuml.cluster.hdbscan.HDBSCAN(
+                min_cluster_size=min_cluster_size,
+                min_samples=min_samples,
+                output_type="numpy",
+            )
+        else:
+            clusterer = hdbscan.HDBSCAN(
+                min_cluster_size=min_cluster_size, min_samples=min_samples
+            )
         cluster_labels = clusterer.fit_predict(embeddings)
         probabilities = clusterer.probabilities_
 
@@ -175,20 +261,41 @@ class BillClusterer:
         print("Explained variance ratio:" f" {pca.explained_variance_ratio_}")
         return reduced
 
-    def reduce_dimensions_tsne(
+    def reduce_dimensions_umap(
         self,
         embeddings: np.ndarray,
         n_components: int = 2,
-        perplexity: int = 30,
+        n_neighbors: int = 15,
     ) -> np.ndarray:
-        """Reduce dimensionality using t-SNE for visualization."""
-        print(f"\nReducing dimensions to {n_components}D" " using t-SNE...")
-        tsne = TSNE(
-            n_components=n_components,
-            perplexity=perplexity,
-            random_state=42,
-        )
-        reduced = tsne.fit_transform(embeddings)
+        """
+        Reduce dimensionality using UMAP for visualization.
+        Uses an approximate nearest-neighbor graph, so it scales to large
+        bill counts where exact t-SNE does not.
+        """
+        print(f"\nReducing dimensions to {n_components}D" " using UMAP...")
+        if self.backend == "gpu":
+            reducer = cuml.manifold.UMAP(
+                n_components=n_components,
+                n_neighbors=n_neighbors,
+                metric="cosine",
+                random_state=42,
+                output_type="numpy",
+            )
+        else:
+            # Imported lazily: umap pulls in numba, which is slow to load
+            try:
+                import umap
+            except ImportError:
+                raise ImportError("umap-learn package is not installed")
+
+            reducer = umap.UMAP(
+                n_components=n_components,
+                n_neighbors=n_neighbors,
+                metric="cosine",
+                low_memory=True,
+                random_state=42,
+            )
+        reduced = reducer.fit_transform(embeddings)
         return reduced
 
     def store_clustering_result(
@@ -230,20 +337,17 @@ class BillClusterer:
 
             cluster_id = cursor.fetchone()[0]
 
-            # Insert cluster assignments
-            assignments = []
-            for bill_id, label, dist in zip(bill_ids, cluster_labels, distances):
-                assignments.append((cluster_id, bill_id, int(label), float(dist)))
-
-            execute_values(
-                cursor,
+            # Bulk load cluster assignments with binary COPY
+            cursor.copy_expert(
                 """
-                INSERT INTO bill_cluster_assignments
+                COPY bill_cluster_assignments
                     (cluster_id, bill_id,
                      cluster_label, distance)
-                VALUES %s
+                FROM STDIN WITH BINARY
             """,
-                assignments,
+                build_assignments_copy_buffer(
+                    cluster_id, bill_ids, cluster_labels, distances
+                ),
             )
 
             self.conn.commit()
@@ -272,11 +376,26 @@ def main():
         sys.exit(1)
 
     # Parse command line arguments
+    backend = "cpu"
+    if "--backend" in sys.argv:
+        idx = sys.argv.index("--backend")
+        backend = sys.argv[idx + 1].lower() if idx + 1 < len(sys.argv) else ""
+        end = idx + 2
+        del sys.argv[idx:end]
+        if backend not in ("cpu", "gpu"):
+            print("Error: --backend must be 'cpu' or 'gpu'")
+            sys.exit(1)
+
     if len(sys.argv) < 3:
-        print("Usage: python cluster_bills.py <algorithm> <name> [params...]")
+        print(
+            "Usage: python cluster_bills.py <algorithm> <name> [params...]"
+            " [--backend cpu|gpu]"
+        )
         print("\nAlgorithms:")
         print("  kmeans <name> <n_clusters>")
         print("  hdbscan <name> <min_cluster_size> [min_samples]")
+        print("\nOptions:")
+        print("  --backend gpu: Run clustering on GPU via RAPIDS cuML")
         print("\nExamples:")
         print("  python cluster_bills.py kmeans" " 'Policy Topics - 10 clusters' 10")
         print("  python cluster_bills.py hdbscan" " 'Auto-clustered Topics' 5 3")
@@ -286,7 +405,7 @@ def main():
     name = sys.argv[2]
 
     # Initialize clusterer
-    clusterer = BillClusterer(database_url)
+    clusterer = BillClusterer(database_url, backend)
 
     try:
         # Load embeddings
@@ -20,150 +20,456 @@ Usage:
     pnpm enrich:bills --limit 10
     pnpm enrich:bills --bill-id 1427 --force
     pnpm enrich:bills --batch --limit 100
+    pnpm enrich:bills --batch --wait
     pnpm enrich:bills --batch-status batch_abc123
     pnpm enrich:bills --batch-results batch_abc123
 """
 
 import os
 import sys
+import asyncio
+import re
+import io
 import json
+import struct
 import hashlib
+import logging
 import tempfile
+import queue
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 
 load_dotenv()
 
+log = logging.getLogger("enrich_bills")
+
 try:
     import openai
 except ImportError:
     print("openai package not installed. Run: pip install openai")
     sys.exit(1)
 
-DELAY_BETWEEN_REQUESTS = 0.5  # Reduced delay for efficiency
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
 LLM_MODEL = "gpt-5.4-nano"  # 400K context, 128K output, cheapest GPT-5.4-class
 MAX_PDF_CHARS = 100000  # Use more of the bill text with large context window
+DEFAULT_RPM = 500  # Requests per minute allowed by the OpenAI tier
+DEFAULT_TPM = 2_000_000  # Input tokens per minute allowed by the OpenAI tier
+MAX_API_RETRIES = 5  # SDK retries 429/5xx with exponential backoff and jitter
+REQUEST_TIMEOUT = 120  # Seconds before a single completion request is abandoned
+RESPONSE_CACHE_DIR = "data/cache/enrichments"
+BATCH_POLL_INTERVAL = 60  # Seconds between batch status checks with --wait
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+# Bills left 'processing' this long (e.g. by an interrupted run) are retried
+STALE_PROCESSING_INTERVAL = "1 hour"
+
+# Static instructions sent as the system message. Keeping them identical and
+# ahead of the per-bill content lets OpenAI cache the shared prefix.
+ENRICHMENT_SYSTEM_PROMPT = """あなたは日本の法律を一般市民にわかりやすく説明する専門家です。\
+ユーザーが提示する法案情報を分析し、指定されたJSON形式で情報を生成してください。
+
+以下の形式で回答してください。必ず有効なJSONで返してください：
+
+{
+  "summaryShort": "50〜80文字の一行要約。専門用語を避け、この法案が何をするのかを簡潔に説明",
+  "summaryDetailed": "200〜300文字の詳細説明。高校生でも理解できる平易な言葉で、法案の目的と内容を説明",
+  "keyPoints": [
+    {
+      "who": "影響を受ける人や組織（例：年収500万円以上の個人）",
+      "what": "何が変わるか（例：所得税率が20%から25%に増加）",
+      "when": "いつから施行されるか（不明な場合は「公布後」など）"
+    }
+  ],
+  "impactTags": ["#タグ1", "#タグ2", "#タグ3"],
+  "prosAndCons": {
+    "pros": ["賛成派の論点1", "賛成派の論点2", "賛成派の論点3"],
+    "cons": ["反対派の論点1", "反対派の論点2", "反対派の論点3"]
+  },
+  "exampleScenario": "もしこの法案が成立したら...という形で、具体的な例を挙げて影響を説明（100〜150文字）"
+}
+
+重要な注意点：
+- 中立的な立場を保ち、「良い」「悪い」などの評価語は使わない
+- 「Aの観点からはメリット」「Bの観点からはデメリット」のように主体を明示する
+- 条文で使われている正式名称を基本とし、必要に応じて括弧で簡単な説明を付ける
+- 不確かな情報は推測せず、確認できる情報のみを含める
+- keyPointsは1〜3項目、impactTagsは3〜5個、pros/consは各2〜3個を目安にする"""
+
+# PDF extraction noise stripped by clean_pdf before text is sent to the model
+TRAILING_SPACE_RE = re.compile(r"[^\S\n]+\n")
+# Page numbers such as "12", "- 12 -" or "－１２－" on a line of their own
+PAGE_NUMBER_LINE_RE = re.compile(
+    r"^[ \t\u3000]*[-－]?[ \t\u3000]*[0-9０-９]+[ \t\u3000]*[-－]?[ \t\u3000]*$",
+    re.MULTILINE,
+)
+REPEATED_LINE_RE = re.compile(r"^(.+)(?:\n\1)+$", re.MULTILINE)
+EXTRA_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# generate_bill_embeddings.py collapses all whitespace before storing
+# text_content, so stored text has no lines; only dashed page numbers such
+# as " - 12 - " or " －１２－ " can still be told apart from the body there
+INLINE_PAGE_NUMBER_RE = re.compile(
+    r"(?:^|(?<=\s))[-－][ \u3000]?[0-9０-９]+[ \u3000]?[-－](?:\s+|$)"
+)
+
+
+def clean_pdf(text: str) -> str:
+    """Strip PDF extraction noise (page numbers, form feeds, trailing spaces,
+    repeated lines and blank runs) to save input tokens."""
+    text = text.replace("\r\n", "\n").replace("\f", "\n")
+    text = TRAILING_SPACE_RE.sub("\n", text)
+    text = INLINE_PAGE_NUMBER_RE.sub("", text)
+    text = PAGE_NUMBER_LINE_RE.sub("", text)
+    text = REPEATED_LINE_RE.sub(r"\1", text)
+    text = EXTRA_BLANK_LINES_RE.sub("\n\n", text)
+    return text.strip()
+
+
+# Output cap: the schema needs well under 2K tokens of Japanese text
+MAX_COMPLETION_TOKENS = 4000
+
+# Structured output schema matching ENRICHMENT_SYSTEM_PROMPT
+ENRICHMENT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "bill_enrichment",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summaryShort": {"type": "string"},
+                "summaryDetailed": {"type": "string"},
+                "keyPoints": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "who": {"type": "string"},
+                            "what": {"type": "string"},
+                            "when": {"type": "string"},
+                        },
+                        "required": ["who", "what", "when"],
+                        "additionalProperties": False,
+                    },
+                },
+                "impactTags": {"type": "array", "items": {"type": "string"}},
+                "prosAndCons": {
+                    "type": "object",
+                    "properties": {
+                        "pros": {"type": "array", "items": {"type": "string"}},
+                        "cons": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "required": ["pros", "cons"],
+                    "additionalProperties": False,
+                },
+                "exampleScenario": {"type": "string"},
+            },
+            "required": [
+                "summaryShort",
+                "summaryDetailed",
+                "keyPoints",
+                "impactTags",
+                "prosAndCons",
+                "exampleScenario",
+            ],
+            "additionalProperties": False,
+        },
+    },
+}
 
 
 def hash_text(text: str) -> str:
-    """Generate MD5 hash of text for change detection."""
+    """Generate MD5 hash of text for change detection.
+
+    Matches PostgreSQL's md5(), so SOURCE_HASH_SQL can compare stored hashes
+    without loading any text.
+    """
     return hashlib.md5(text.encode()).hexdigest()
 
 
-def generate_enrichment(
-    client: openai.OpenAI,
+def source_hash(bill: Dict[str, Any]) -> str:
+    """Hash of the bill inputs stored in source_text_hash."""
+    pdf_excerpt = (bill.get("pdf_text") or "")[:1000]
+    return hash_text(f"{bill['title']}|{pdf_excerpt}")
+
+
+def blake2b_source_hash(bill: Dict[str, Any]) -> str:
+    """source_hash as briefly stored with BLAKE2b; matches are rewritten."""
+    pdf_excerpt = (bill.get("pdf_text") or "")[:1000]
+    text = f"{bill['title']}|{pdf_excerpt}"
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+# source_hash computed in SQL (left() counts characters, like Python slicing)
+SOURCE_HASH_SQL = "md5(b.title || '|' || left(COALESCE(bem.text_content, ''), 1000))"
+
+
+def source_unchanged(bill: Dict[str, Any]) -> bool:
+    """Whether a completed enrichment was generated from the current inputs.
+
+    A missing hash means the inputs are unknown, not that they changed.
+    """
+    if bill["status"] != "completed" or not bill["title"]:
+        return False
+    stored = bill["source_text_hash"]
+    return not stored or stored in (source_hash(bill), blake2b_source_hash(bill))
+
+
+REWRITE_SOURCE_HASHES_QUERY = """
+UPDATE bill_enrichment be
+SET source_text_hash = v.source_text_hash
+FROM (VALUES %s) AS v (bill_id, source_text_hash)
+WHERE be.bill_id = v.bill_id
+"""
+
+
+def rewrite_blake2b_source_hashes(conn, bills: List[Dict[str, Any]]) -> int:
+    """Replace matching BLAKE2b source hashes with the MD5 form.
+
+    The SQL change check only understands MD5, so without this those bills
+    would be selected again on every run. Returns the number rewritten.
+    """
+    rows = [
+        (bill["id"], source_hash(bill))
+        for bill in bills
+        if bill["source_text_hash"] == blake2b_source_hash(bill)
+    ]
+    if rows:
+        cursor = conn.cursor()
+        execute_values(cursor, REWRITE_SOURCE_HASHES_QUERY, rows)
+        conn.commit()
+        cursor.close()
+    return len(rows)
+
+
+class AsyncTokenBucket:
+    """Token bucket refilled continuously at `rate_per_minute`."""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = float(rate_per_minute)
+        self.tokens = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0):
+        """Wait until `amount` tokens are available, then take them."""
+        amount = min(amount, self.capacity)
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """Paces requests to OpenAI's per-minute request and token quotas."""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.requests = AsyncTokenBucket(rpm)
+        self.tokens = AsyncTokenBucket(tpm)
+
+    async def wait(self, messages: List[Dict[str, str]]):
+        await self.requests.acquire()
+        await self.tokens.acquire(estimate_tokens(messages))
+
+
+def estimate_tokens(messages: List[Dict[str, str]]) -> int:
+    """Rough input token count; Japanese text is about one token per character."""
+    return sum(len(m["content"]) for m in messages)
+
+
+def response_cache_path(messages: List[Dict[str, str]], model: str = LLM_MODEL) -> str:
+    """Cache file for an LLM response, keyed by model, output settings and prompt."""
+    key = hashlib.blake2b(digest_size=16)
+    key.update(f"{model}:{MAX_COMPLETION_TOKENS}".encode())
+    key.update(json_dumps(ENRICHMENT_RESPONSE_FORMAT).encode())
+    for message in messages:
+        key.update(f"\0{message['role']}\0{message['content']}".encode())
+    return os.path.join(RESPONSE_CACHE_DIR, f"{key.hexdigest()}.json")
+
+
+def load_cached_response(cache_path: str) -> Optional[Dict[str, Any]]:
+    """Load a cached enrichment result, or None if missing."""
+    if not os.path.exists(cache_path):
+        return None
+    with open(cache_path, "rb") as f:
+        return json_loads(f.read())
+
+
+def save_cached_response(cache_path: str, result: Dict[str, Any]):
+    """Save an enrichment result to cache (written atomically via rename)."""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(json_dumps(result))
+    os.replace(tmp_path, cache_path)
+
+
+async def generate_enrichment(
+    client: openai.AsyncOpenAI,
+    limiter: RateLimiter,
     bill_title: str,
     pdf_text: Optional[str],
     debate_summary: Optional[Dict[str, Any]],
+    use_cache: bool = True,
+    model: str = LLM_MODEL,
+    max_pdf_chars: int = MAX_PDF_CHARS,
 ) -> Dict[str, Any]:
-    """Generate enrichment content using OpenAI API."""
+    """Generate enrichment content using OpenAI API.
+
+    Validated responses are cached on disk by prompt, so re-running the
+    pipeline on unchanged input does not call the API again.
+    """
+
+    messages = build_enrichment_messages(
+        bill_title, pdf_text, debate_summary, max_pdf_chars
+    )
+    cache_path = response_cache_path(messages, model)
+    if use_cache:
+        cached = load_cached_response(cache_path)
+        if cached is not None:
+            return cached
 
-    prompt = build_enrichment_prompt(bill_title, pdf_text, debate_summary)
+    await limiter.wait(messages)
 
-    response = client.chat.completions.create(
-        model=LLM_MODEL,
-        messages=[{"role": "user", "content": prompt}],
+    response = await client.chat.completions.create(
+        model=model,
+        messages=messages,
         temperature=0.3,
-        response_format={"type": "json_object"},
+        max_completion_tokens=MAX_COMPLETION_TOKENS,
+        response_format=ENRICHMENT_RESPONSE_FORMAT,
     )
 
-    result = json.loads(response.choices[0].message.content)
+    choice = response.choices[0]
+    if choice.finish_reason == "length":
+        raise ValueError("Response truncated at max_completion_tokens")
+    result = json_loads(choice.message.content)
 
     # Validate required fields
     if not result.get("summaryShort") or not result.get("summaryDetailed"):
         raise ValueError("Missing required fields in response")
 
+    save_cached_response(cache_path, result)
     return result
 
 
+def build_enrichment_messages(
+    bill_title: str,
+    pdf_text: Optional[str],
+    debate_summary: Optional[Dict[str, Any]],
+    max_pdf_chars: int = MAX_PDF_CHARS,
+) -> List[Dict[str, str]]:
+    """Chat messages for a bill: static system prompt first, bill data last."""
+    return [
+        {"role": "system", "content": ENRICHMENT_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": build_enrichment_prompt(
+                bill_title, pdf_text, debate_summary, max_pdf_chars
+            ),
+        },
+    ]
+
+
+# (debate_summary key, heading) pairs rendered in this order
+DEBATE_SUMMARY_SECTIONS = (
+    ("pro_arguments", "【賛成派の論点】"),
+    ("con_arguments", "【反対派の論点】"),
+    ("key_questions", "【主な質問】"),
+    ("gov_explanations", "【政府の説明】"),
+)
+
+
 def build_enrichment_prompt(
     bill_title: str,
     pdf_text: Optional[str],
     debate_summary: Optional[Dict[str, Any]],
+    max_pdf_chars: int = MAX_PDF_CHARS,
 ) -> str:
-    """Build the enrichment prompt for a bill."""
+    """Build the per-bill user message (title, PDF text, debate summary).
+
+    The static instructions live in ENRICHMENT_SYSTEM_PROMPT so every request
+    shares the same prefix and benefits from OpenAI prompt caching.
+    """
 
-    # Build context from available sources
-    context = f"法案名: {bill_title}\n\n"
+    # Build context from available sources; parts are joined once at the end
+    parts = [f"法案名: {bill_title}\n"]
 
     if pdf_text:
         # Use more of the PDF text with larger context window
-        truncated_pdf = pdf_text[:MAX_PDF_CHARS]
-        if len(pdf_text) > MAX_PDF_CHARS:
-            context += (
-                f"法案本文 (抜粋、全{len(pdf_text):,}" f"文字中):\n{truncated_pdf}\n\n"
+        pdf_text = clean_pdf(pdf_text)
+        truncated_pdf = pdf_text[:max_pdf_chars]
+        if len(pdf_text) > max_pdf_chars:
+            parts.append(
+                f"法案本文 (抜粋、全{len(pdf_text):,}文字中):\n{truncated_pdf}\n"
             )
         else:
-            context += f"法案本文:\n{truncated_pdf}\n\n"
+            parts.append(f"法案本文:\n{truncated_pdf}\n")
 
     # Add debate summary if available (from bill_debate_summary table)
     if debate_summary:
-        context += "国会での議論の要約:\n"
-
-        pro_args = debate_summary.get("pro_arguments", [])
-        if pro_args:
-            context += "【賛成派の論点】\n"
-            for arg in pro_args:
-                context += f"  - {arg}\n"
-
-        con_args = debate_summary.get("con_arguments", [])
-        if con_args:
-            context += "【反対派の論点】\n"
-            for arg in con_args:
-                context += f"  - {arg}\n"
-
-        key_questions = debate_summary.get("key_questions", [])
-        if key_questions:
-            context += "【主な質問】\n"
-            for q in key_questions:
-                context += f"  - {q}\n"
-
-        gov_explanations = debate_summary.get("gov_explanations", [])
-        if gov_explanations:
-            context += "【政府の説明】\n"
-            for exp in gov_explanations:
-                context += f"  - {exp}\n"
-
-        context += "\n"
-
-    prompt = f"""あなたは日本の法律を一般市民にわかりやすく説明する専門家です。\
-以下の法案情報を分析し、指定されたJSON形式で情報を生成してください。
-
-{context}
+        parts.append("国会での議論の要約:")
+        for key, heading in DEBATE_SUMMARY_SECTIONS:
+            items = debate_summary.get(key, [])
+            if items:
+                parts.append(heading)
+                parts.extend(f"  - {item}" for item in items)
+        parts.append("")
+
+    return "\n".join(parts) + "\n"
+
+
+def attach_debate_summary(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the joined bill_debate_summary columns of a bill row
+    with a parsed `debate_summary` dict (None if no completed summary)."""
+    bill = dict(row)
+    pro = bill.pop("pro_arguments_summary")
+    con = bill.pop("con_arguments_summary")
+    questions = bill.pop("key_questions")
+    explanations = bill.pop("government_explanations")
+    summary_debate_count = bill.pop("summary_debate_count")
+
+    bill["debate_summary"] = None
+    if summary_debate_count is None:
+        return bill
 
-以下の形式で回答してください。必ず有効なJSONで返してください：
-
-{{
-  "summaryShort": "50〜80文字の一行要約。専門用語を避け、この法案が何をするのかを簡潔に説明",
-  "summaryDetailed": "200〜300文字の詳細説明。高校生でも理解できる平易な言葉で、法案の目的と内容を説明",
-  "keyPoints": [
-    {{
-      "who": "影響を受ける人や組織（例：年収500万円以上の個人）",
-      "what": "何が変わるか（例：所得税率が20%から25%に増加）",
-      "when": "いつから施行されるか（不明な場合は「公布後」など）"
-    }}
-  ],
-  "impactTags": ["#タグ1", "#タグ2", "#タグ3"],
-  "prosAndCons": {{
-    "pros": ["賛成派の論点1", "賛成派の論点2", "賛成派の論点3"],
-    "cons": ["反対派の論点1", "反対派の論点2", "反対派の論点3"]
-  }},
-  "exampleScenario": "もしこの法案が成立したら...という形で、具体的な例を挙げて影響を説明（100〜150文字）"
-}}
-
-重要な注意点：
-- 中立的な立場を保ち、「良い」「悪い」などの評価語は使わない
-- 「Aの観点からはメリット」「Bの観点からはデメリット」のように主体を明示する
-- 条文で使われている正式名称を基本とし、必要に応じて括弧で簡単な説明を付ける
-- 不確かな情報は推測せず、確認できる情報のみを含める
-- keyPointsは1〜3項目、impactTagsは3〜5個、pros/consは各2〜3個を目安にする"""
-
-    return prompt
+    # Parse JSON fields
+    try:
+        bill["debate_summary"] = {
+            "pro_arguments": json_loads(pro or "[]"),
+            "con_arguments": json_loads(con or "[]"),
+            "key_questions": json_loads(questions or "[]"),
+            "gov_explanations": json_loads(explanations or "[]"),
+            "debate_count": summary_debate_count,
+        }
+    except json.JSONDecodeError:
+        pass
+    return bill
 
 
 def get_bills_to_enrich(
@@ -183,106 +489,271 @@ def get_bills_to_enrich(
             b.title,
             bem.text_content as pdf_text,
             be.status,
-            (SELECT COUNT(*)
-             FROM bill_debates db
-             WHERE db.bill_id = b.id
-            ) as debate_count
+            be.source_text_hash,
+            bds.pro_arguments_summary,
+            bds.con_arguments_summary,
+            bds.key_questions,
+            bds.government_explanations,
+            bds.debate_count as summary_debate_count,
+            COALESCE(dc.debate_count, 0) as debate_count
         FROM bill b
+        LEFT JOIN (
+            SELECT bill_id, COUNT(*) as debate_count
+            FROM bill_debates
+            WHERE bill_id = %s
+            GROUP BY bill_id
+        ) dc
+            ON b.id = dc.bill_id
         LEFT JOIN bill_embeddings bem
             ON b.id = bem.bill_id
         LEFT JOIN bill_enrichment be
             ON b.id = be.bill_id
+        LEFT JOIN bill_debate_summary bds
+            ON b.id = bds.bill_id
+            AND bds.status = 'completed'
         WHERE b.id = %s
         """
-        cursor.execute(query, (bill_id,))
-        bills = cursor.fetchall()
+        cursor.execute(query, (bill_id, bill_id))
+        bills = [attach_debate_summary(row) for row in cursor.fetchall()]
         cursor.close()
         return bills
 
+    # Completed bills are only selected again when their source text changed;
+    # a missing hash (e.g. from older batch results) does not count as a change
     where_clause = (
         "1=1"
         if force_regenerate
-        else """
+        else f"""
         (be.bill_id IS NULL
          OR be.status = 'pending'
-         OR be.status = 'failed')
+         OR be.status = 'failed'
+         OR (be.status = 'processing'
+             AND be.updated_at < NOW() - INTERVAL '{STALE_PROCESSING_INTERVAL}')
+         OR (be.status = 'completed'
+             AND be.source_text_hash <> ''
+             AND be.source_text_hash <> {SOURCE_HASH_SQL}))
     """
     )
+    # Only bills with source material (PDF text or a completed debate summary)
+    where_clause += """
+        AND (bem.text_content IS NOT NULL
+             OR bds.bill_id IS NOT NULL)
+    """
 
-    limit_clause = f"LIMIT {limit}" if limit else ""
+    limit_clause = "LIMIT %s" if limit else ""
     query = f"""
     SELECT
         b.id,
         b.title,
         bem.text_content as pdf_text,
         be.status,
-        (SELECT COUNT(*)
-         FROM bill_debates db
-         WHERE db.bill_id = b.id) as debate_count
+        be.source_text_hash,
+        bds.pro_arguments_summary,
+        bds.con_arguments_summary,
+        bds.key_questions,
+        bds.government_explanations,
+        bds.debate_count as summary_debate_count,
+        COALESCE(dc.debate_count, 0) as debate_count
     FROM bill b
+    LEFT JOIN (
+        SELECT bill_id, COUNT(*) as debate_count
+        FROM bill_debates
+        GROUP BY bill_id
+    ) dc
+        ON b.id = dc.bill_id
     LEFT JOIN bill_embeddings bem
         ON b.id = bem.bill_id
     LEFT JOIN bill_enrichment be
         ON b.id = be.bill_id
+    LEFT JOIN bill_debate_summary bds
+        ON b.id = bds.bill_id
+        AND bds.status = 'completed'
     WHERE {where_clause}
     ORDER BY
-        (SELECT COUNT(*)
-         FROM bill_debates db
-         WHERE db.bill_id = b.id) DESC,
+        COALESCE(dc.debate_count, 0) DESC,
         bem.text_content IS NOT NULL DESC,
         b.submission_session DESC
     {limit_clause}
     """
 
-    cursor.execute(query)
-    bills = cursor.fetchall()
+    cursor.execute(query, (limit,) if limit else None)
+    bills = [attach_debate_summary(row) for row in cursor.fetchall()]
     cursor.close()
 
     return bills
 
 
-def get_debate_summary_for_bill(
-    conn,
+UPSERT_ENRICHMENTS_QUERY = """
+INSERT INTO bill_enrichment (
+    bill_id, summary_short,
+    summary_detailed, key_points,
+    impact_tags, pros_and_cons,
+    example_scenario,
+    status, llm_model,
+    source_text_hash, error_message,
+    created_at, updated_at
+) VALUES %s
+ON CONFLICT (bill_id) DO UPDATE SET
+    summary_short = EXCLUDED.summary_short,
+    summary_detailed = EXCLUDED.summary_detailed,
+    key_points = EXCLUDED.key_points,
+    impact_tags = EXCLUDED.impact_tags,
+    pros_and_cons = EXCLUDED.pros_and_cons,
+    example_scenario = EXCLUDED.example_scenario,
+    status = EXCLUDED.status,
+    llm_model = EXCLUDED.llm_model,
+    source_text_hash = EXCLUDED.source_text_hash,
+    error_message = EXCLUDED.error_message,
+    updated_at = NOW()
+"""
+UPSERT_ENRICHMENTS_TEMPLATE = (
+    "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())"
+)
+
+UPSERT_STATUSES_QUERY = """
+INSERT INTO bill_enrichment
+    (bill_id, status, error_message,
+     created_at, updated_at)
+VALUES %s
+ON CONFLICT (bill_id) DO UPDATE SET
+    status = EXCLUDED.status,
+    error_message = EXCLUDED.error_message,
+    updated_at = NOW()
+"""
+UPSERT_STATUSES_TEMPLATE = "(%s, %s, %s, NOW(), NOW())"
+
+# Staging-table bulk load used by --bulk-commit: binary COPY into a temp
+# table, then a single INSERT ... SELECT ... ON CONFLICT into bill_enrichment
+ENRICHMENT_COPY_COLUMNS = (
+    "bill_id, summary_short, summary_detailed, key_points, impact_tags,"
+    " pros_and_cons, example_scenario, status, llm_model,"
+    " source_text_hash, error_message"
+)
+MERGE_STAGED_ENRICHMENTS_QUERY = f"""
+INSERT INTO bill_enrichment ({ENRICHMENT_COPY_COLUMNS}, created_at, updated_at)
+SELECT {ENRICHMENT_COPY_COLUMNS}, NOW(), NOW()
+FROM bill_enrichment_staging
+ON CONFLICT (bill_id) DO UPDATE SET
+    summary_short = EXCLUDED.summary_short,
+    summary_detailed = EXCLUDED.summary_detailed,
+    key_points = EXCLUDED.key_points,
+    impact_tags = EXCLUDED.impact_tags,
+    pros_and_cons = EXCLUDED.pros_and_cons,
+    example_scenario = EXCLUDED.example_scenario,
+    status = EXCLUDED.status,
+    llm_model = EXCLUDED.llm_model,
+    source_text_hash = EXCLUDED.source_text_hash,
+    error_message = EXCLUDED.error_message,
+    updated_at = NOW()
+"""
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+PGCOPY_TRAILER = struct.pack(">h", -1)
+
+WRITE_BATCH_SIZE = 100  # Rows buffered before the writer flushes
+WRITE_FLUSH_INTERVAL = 2.0  # Max seconds a row waits in the writer buffer
+
+
+def enrichment_row(
     bill_id: int,
-) -> Optional[Dict[str, Any]]:
-    """Get debate summary for a specific bill
-    from bill_debate_summary table."""
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    status: str,
+    result: Dict[str, Any],
+    error: Optional[str] = None,
+    model: str = LLM_MODEL,
+) -> tuple:
+    """Build an UPSERT_ENRICHMENTS_QUERY row from a generated result."""
+    return (
+        bill_id,
+        result.get("summaryShort"),
+        result.get("summaryDetailed"),
+        json_dumps(result.get("keyPoints", [])),
+        json_dumps(result.get("impactTags", [])),
+        json_dumps(result.get("prosAndCons", {})),
+        result.get("exampleScenario"),
+        status,
+        model,
+        result.get("sourceHash"),
+        error,
+    )
 
-    query = """
-    SELECT
-        pro_arguments_summary,
-        con_arguments_summary,
-        key_questions,
-        government_explanations,
-        debate_count
-    FROM bill_debate_summary
-    WHERE bill_id = %s
-        AND status = 'completed'
+
+def flush_enrichments(
+    conn,
+    rows: List[tuple],
+    status_rows: Optional[List[tuple]] = None,
+):
+    """Upsert buffered rows in one transaction.
+
+    `rows` are full enrichments built by enrichment_row; `status_rows` are
+    (bill_id, status, error) tuples that leave existing content untouched.
     """
+    if not rows and not status_rows:
+        return
 
-    cursor.execute(query, (bill_id,))
-    result = cursor.fetchone()
+    cursor = conn.cursor()
+    if rows:
+        execute_values(
+            cursor,
+            UPSERT_ENRICHMENTS_QUERY,
+            rows,
+            template=UPSERT_ENRICHMENTS_TEMPLATE,
+            page_size=500,
+        )
+    if status_rows:
+        execute_values(
+            cursor,
+            UPSERT_STATUSES_QUERY,
+            status_rows,
+            template=UPSERT_STATUSES_TEMPLATE,
+            page_size=500,
+        )
+    conn.commit()
     cursor.close()
 
-    if not result:
-        return None
 
-    # Parse JSON fields
-    try:
-        pro_args = json.loads(result["pro_arguments_summary"] or "[]")
-        con_args = json.loads(result["con_arguments_summary"] or "[]")
-        key_q = json.loads(result["key_questions"] or "[]")
-        gov_exp = json.loads(result["government_explanations"] or "[]")
-        return {
-            "pro_arguments": pro_args,
-            "con_arguments": con_args,
-            "key_questions": key_q,
-            "gov_explanations": gov_exp,
-            "debate_count": result["debate_count"],
-        }
-    except json.JSONDecodeError:
-        return None
+def build_enrichments_copy_buffer(rows: List[tuple]) -> io.BytesIO:
+    """
+    Encode enrichment rows (as built by enrichment_row) in PostgreSQL binary
+    COPY format: bill_id int4 followed by ten text fields (NULL as -1).
+    """
+    buf = io.BytesIO()
+    buf.write(PGCOPY_HEADER)
+
+    for bill_id, *fields in rows:
+        buf.write(struct.pack(">hii", len(fields) + 1, 4, bill_id))
+        for field in fields:
+            if field is None:
+                buf.write(struct.pack(">i", -1))
+            else:
+                data = field.encode()
+                buf.write(struct.pack(">i", len(data)))
+                buf.write(data)
+
+    buf.write(PGCOPY_TRAILER)
+    buf.seek(0)
+    return buf
+
+
+def bulk_load_enrichments(conn, rows: List[tuple]):
+    """Upsert many enrichment rows via a staging table in one transaction."""
+    if not rows:
+        return
+
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS bill_enrichment_staging
+            (LIKE bill_enrichment INCLUDING DEFAULTS)
+            ON COMMIT DELETE ROWS
+        """
+    )
+    cursor.copy_expert(
+        f"COPY bill_enrichment_staging ({ENRICHMENT_COPY_COLUMNS})"
+        " FROM STDIN WITH BINARY",
+        build_enrichments_copy_buffer(rows),
+    )
+    cursor.execute(MERGE_STAGED_ENRICHMENTS_QUERY)
+    conn.commit()
+    cursor.close()
 
 
 def upsert_enrichment(
@@ -292,80 +763,155 @@ def upsert_enrichment(
     result: Optional[Dict] = None,
     error: Optional[str] = None,
 ):
-    """Insert or update enrichment record."""
-    cursor = conn.cursor()
-
+    """Insert or update a single enrichment record."""
     if result:
-        query = """
-        INSERT INTO bill_enrichment (
-            bill_id, summary_short,
-            summary_detailed, key_points,
-            impact_tags, pros_and_cons,
-            example_scenario,
-            status, llm_model,
-            source_text_hash, error_message,
-            created_at, updated_at
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW()
-        )
-        ON CONFLICT (bill_id) DO UPDATE SET
-            summary_short = EXCLUDED.summary_short,
-            summary_detailed = EXCLUDED.summary_detailed,
-            key_points = EXCLUDED.key_points,
-            impact_tags = EXCLUDED.impact_tags,
-            pros_and_cons = EXCLUDED.pros_and_cons,
-            example_scenario = EXCLUDED.example_scenario,
-            status = EXCLUDED.status,
-            llm_model = EXCLUDED.llm_model,
-            source_text_hash = EXCLUDED.source_text_hash,
-            error_message = EXCLUDED.error_message,
-            updated_at = NOW()
-        """
-        cursor.execute(
-            query,
-            (
-                bill_id,
-                result.get("summaryShort"),
-                result.get("summaryDetailed"),
-                json.dumps(
-                    result.get("keyPoints", []),
-                    ensure_ascii=False,
-                ),
-                json.dumps(
-                    result.get("impactTags", []),
-                    ensure_ascii=False,
-                ),
-                json.dumps(
-                    result.get("prosAndCons", {}),
-                    ensure_ascii=False,
-                ),
-                result.get("exampleScenario"),
-                status,
-                LLM_MODEL,
-                result.get("sourceHash"),
-                error,
-            ),
-        )
+        flush_enrichments(conn, [enrichment_row(bill_id, status, result, error)])
     else:
-        query = """
-        INSERT INTO bill_enrichment
-            (bill_id, status, error_message,
-             created_at, updated_at)
-        VALUES (%s, %s, %s, NOW(), NOW())
-        ON CONFLICT (bill_id) DO UPDATE SET
-            status = EXCLUDED.status,
-            error_message = EXCLUDED.error_message,
-            updated_at = NOW()
-        """
-        cursor.execute(query, (bill_id, status, error))
+        flush_enrichments(conn, [], [(bill_id, status, error)])
 
-    conn.commit()
-    cursor.close()
+
+class EnrichmentWriter:
+    """Background thread that batches enrichment upserts.
+
+    Workers hand results to put_result/put_status; a single writer thread
+    holds one pooled DB connection and flushes every WRITE_BATCH_SIZE rows or
+    WRITE_FLUSH_INTERVAL seconds, whichever comes first. With `bulk`, all
+    rows are held until close() and loaded through bulk_load_enrichments.
+
+    Only the latest row per bill is kept, so a result replaces the bill's
+    'processing' mark if both are still buffered. A batch that fails to
+    write is retried row by row; results that still cannot be written are
+    marked 'failed' where possible and counted in failed_writes.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        pool: ThreadedConnectionPool,
+        model: str = LLM_MODEL,
+        bulk: bool = False,
+        batch_size: int = WRITE_BATCH_SIZE,
+        flush_interval: float = WRITE_FLUSH_INTERVAL,
+    ):
+        self.pool = pool
+        self.model = model
+        self.bulk = bulk
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: queue.Queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.failed_writes = 0
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def put_result(self, bill_id: int, result: Dict[str, Any]):
+        row = enrichment_row(bill_id, "completed", result, model=self.model)
+        self.queue.put(("result", row))
+
+    def put_status(self, bill_id: int, status: str, error: Optional[str] = None):
+        self.queue.put(("status", (bill_id, status, error)))
+
+    def close(self):
+        """Flush remaining rows and stop the writer thread."""
+        self.queue.put(self._STOP)
+        self.thread.join()
+
+    def _flush(self, conn, items: List[Tuple[str, tuple]]):
+        if not self.bulk:
+            self._flush_batch(conn, items)
+            return
+
+        try:
+            bulk_load_enrichments(
+                conn, [row for kind, row in items if kind == "result"]
+            )
+            flush_enrichments(
+                conn, [], [row for kind, row in items if kind == "status"]
+            )
+            return
+        except Exception as e:
+            conn.rollback()
+            log.error(
+                "Bulk load of %d enrichments failed, falling back to batched"
+                " upserts: %s",
+                len(items),
+                e,
+            )
+
+        for start in range(0, len(items), self.batch_size):
+            end = start + self.batch_size
+            self._flush_batch(conn, items[start:end])
+
+    def _flush_batch(self, conn, items: List[Tuple[str, tuple]]):
+        rows = [row for kind, row in items if kind == "result"]
+        status_rows = [row for kind, row in items if kind == "status"]
+        try:
+            flush_enrichments(conn, rows, status_rows)
+            return
+        except Exception as e:
+            conn.rollback()
+            log.error(
+                "Failed to write %d enrichments, retrying one by one: %s",
+                len(items),
+                e,
+            )
+
+        for kind, row in items:
+            try:
+                if kind == "result":
+                    flush_enrichments(conn, [row])
+                else:
+                    flush_enrichments(conn, [], [row])
+            except Exception as e:
+                conn.rollback()
+                log.error("Failed to write enrichment for bill %d: %s", row[0], e)
+                if kind != "result":
+                    continue
+                self.failed_writes += 1
+                try:
+                    flush_enrichments(conn, [], [(row[0], "failed", str(e))])
+                except Exception:
+                    # Left 'processing'; picked up again once stale
+                    conn.rollback()
+
+    def _run(self):
+        conn = self.pool.getconn()
+        # Latest (kind, row) per bill_id
+        pending: Dict[int, Tuple[str, tuple]] = {}
+        deadline = time.monotonic() + self.flush_interval
+        stopping = False
+
+        try:
+            while not stopping:
+                # Bulk mode only flushes on close, so it can block indefinitely
+                timeout = None if self.bulk else max(deadline - time.monotonic(), 0)
+                try:
+                    item = self.queue.get(timeout=timeout)
+                    if item is self._STOP:
+                        stopping = True
+                    else:
+                        pending[item[1][0]] = item
+                except queue.Empty:
+                    pass
+
+                # Bulk mode only flushes on close
+                full = len(pending) >= self.batch_size
+                due = not self.bulk and (full or time.monotonic() >= deadline)
+                if stopping or due:
+                    self._flush(conn, list(pending.values()))
+                    pending = {}
+                    deadline = time.monotonic() + self.flush_interval
+        finally:
+            self.pool.putconn(conn)
 
 
 def prepare_batch_requests(
-    conn,
     bills: List[Dict[str, Any]],
+    model: str = LLM_MODEL,
+    max_pdf_chars: int = MAX_PDF_CHARS,
 ) -> List[Dict[str, Any]]:
     """Prepare batch API request lines for all bills."""
     requests = []
@@ -373,22 +919,24 @@ def prepare_batch_requests(
         if not bill["title"]:
             continue
 
-        debate_summary = get_debate_summary_for_bill(conn, bill["id"])
-        prompt = build_enrichment_prompt(
+        messages = build_enrichment_messages(
             bill["title"],
             bill.get("pdf_text"),
-            debate_summary,
+            bill["debate_summary"],
+            max_pdf_chars,
         )
 
         request_line = {
-            "custom_id": f"enrich-{bill['id']}",
+            # The source hash rides along so results store what was sent
+            "custom_id": f"enrich-{bill['id']}-{source_hash(bill)}",
             "method": "POST",
             "url": "/v1/chat/completions",
             "body": {
-                "model": LLM_MODEL,
-                "messages": [{"role": "user", "content": prompt}],
+                "model": model,
+                "messages": messages,
                 "temperature": 0.3,
-                "response_format": {"type": "json_object"},
+                "max_completion_tokens": MAX_COMPLETION_TOKENS,
+                "response_format": ENRICHMENT_RESPONSE_FORMAT,
             },
         }
         requests.append(request_line)
@@ -398,12 +946,13 @@ def prepare_batch_requests(
 def submit_batch(
     client: openai.OpenAI,
     requests: List[Dict[str, Any]],
+    model: str = LLM_MODEL,
 ) -> str:
     """Write JSONL, upload, and submit a batch job. Returns batch ID."""
     # Write JSONL to temp file
     with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
         for req in requests:
-            f.write(json.dumps(req, ensure_ascii=False) + "\n")
+            f.write(json_dumps(req) + "\n")
         jsonl_path = f.name
 
     print(f"Wrote {len(requests)} requests to {jsonl_path}")
@@ -418,7 +967,7 @@ def submit_batch(
         input_file_id=file_obj.id,
         endpoint="/v1/chat/completions",
         completion_window="24h",
-        metadata={"script": "enrich_bills", "model": LLM_MODEL},
+        metadata={"script": "enrich_bills", "model": model},
     )
     print(f"Batch created: {batch.id}")
     print(f"Status: {batch.status}")
@@ -442,6 +991,28 @@ def check_batch_status(client: openai.OpenAI, batch_id: str):
     return batch
 
 
+def wait_for_batch(
+    client: openai.OpenAI,
+    batch_id: str,
+    poll_interval: int = BATCH_POLL_INTERVAL,
+):
+    """Poll a batch job until it reaches a terminal status."""
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        if counts:
+            print(
+                f"  Status: {batch.status}"
+                f" ({counts.completed}/{counts.total} done,"
+                f" {counts.failed} failed)"
+            )
+        else:
+            print(f"  Status: {batch.status}")
+        if batch.status in BATCH_TERMINAL_STATUSES:
+            return batch
+        time.sleep(poll_interval)
+
+
 def retrieve_batch_results(
     client: openai.OpenAI,
     conn,
@@ -463,69 +1034,62 @@ def retrieve_batch_results(
         print("No output file available.")
         return
 
+    # Model the batch was submitted with (recorded in its metadata)
+    model = (batch.metadata or {}).get("model", LLM_MODEL)
+
     # Download results
     content = client.files.content(batch.output_file_id)
     results_text = content.text
 
     success_count = 0
     error_count = 0
+    rows: List[tuple] = []
+    status_rows: List[tuple] = []
 
     for line in results_text.strip().split("\n"):
         if not line:
             continue
-        result_obj = json.loads(line)
-        custom_id = result_obj["custom_id"]
-        bill_id = int(custom_id.replace("enrich-", ""))
+        result_obj = json_loads(line)
+        # custom_id is enrich-<bill_id>-<source hash> (no hash in older batches)
+        _, bill_id, *hash_part = result_obj["custom_id"].split("-")
+        bill_id = int(bill_id)
 
         response = result_obj.get("response")
         error = result_obj.get("error")
 
         if error:
             print(f"  Bill {bill_id}: Error - {error}")
-            upsert_enrichment(
-                conn,
-                bill_id,
-                "failed",
-                error=json.dumps(error, ensure_ascii=False),
-            )
+            status_rows.append((bill_id, "failed", json_dumps(error)))
             error_count += 1
             continue
 
         if response and response.get("status_code") == 200:
             body = response["body"]
             content_str = body["choices"][0]["message"]["content"]
-            result = json.loads(content_str)
+            result = json_loads(content_str)
 
             if not result.get("summaryShort") or not result.get("summaryDetailed"):
-                upsert_enrichment(
-                    conn,
-                    bill_id,
-                    "failed",
-                    error="Missing required fields",
-                )
+                status_rows.append((bill_id, "failed", "Missing required fields"))
                 error_count += 1
                 continue
 
-            result["sourceHash"] = ""
-            upsert_enrichment(conn, bill_id, "completed", result)
+            result["sourceHash"] = hash_part[0] if hash_part else None
+            rows.append(enrichment_row(bill_id, "completed", result, model=model))
             success_count += 1
             print(f"  Bill {bill_id}: ✓" f" {result['summaryShort'][:50]}...")
         else:
             status_code = response.get("status_code") if response else "N/A"
-            upsert_enrichment(
-                conn,
-                bill_id,
-                "failed",
-                error=f"HTTP {status_code}",
-            )
+            status_rows.append((bill_id, "failed", f"HTTP {status_code}"))
             error_count += 1
 
+    # Save all results in a single transaction
+    flush_enrichments(conn, rows, status_rows)
+
     print(f"\nResults: {success_count} success, {error_count} errors")
 
 
 def main():
     import argparse
-    import time
 
     parser = argparse.ArgumentParser(
         description=("Enrich bills with LLM-generated content")
@@ -550,13 +1114,65 @@ def main():
         "--concurrency",
         type=int,
         default=3,
-        help="Number of parallel workers" " (default: 3)",
+        help="Maximum concurrent OpenAI requests" " (default: 3)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=DEFAULT_RPM,
+        help="OpenAI requests per minute limit" f" (default: {DEFAULT_RPM})",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=DEFAULT_TPM,
+        help="OpenAI input tokens per minute limit" f" (default: {DEFAULT_TPM})",
+    )
+    parser.add_argument(
+        "--model",
+        default=LLM_MODEL,
+        help=f"OpenAI model to use (default: {LLM_MODEL})",
+    )
+    parser.add_argument(
+        "--max-pdf-chars",
+        type=int,
+        default=MAX_PDF_CHARS,
+        help="Bill text characters included in the prompt"
+        f" (default: {MAX_PDF_CHARS}; lower for small-context models)",
+    )
+    parser.add_argument(
+        "--bulk-commit",
+        action="store_true",
+        help="Hold all results and load them in one COPY-based"
+        " transaction at the end (for full --force rebuilds)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Call the API even if a cached response"
+        f" exists in {RESPONSE_CACHE_DIR} (implied by --force)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log per-bill details (debate summary counts)",
     )
     parser.add_argument(
         "--batch",
         action="store_true",
         help="Submit as OpenAI Batch API job" " (50%% cheaper, results within 24h)",
     )
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="With --batch, poll until the job finishes" " and save its results",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=int,
+        default=BATCH_POLL_INTERVAL,
+        help="Seconds between batch status checks" f" (default: {BATCH_POLL_INTERVAL})",
+    )
     parser.add_argument(
         "--batch-status",
         type=str,
@@ -571,6 +1187,16 @@ def main():
     )
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    if args.verbose:
+        log.setLevel(logging.DEBUG)
+    # Keep HTTP client request logs out of the per-bill output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
     # Check environment variables
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
@@ -607,6 +1233,7 @@ def main():
         print(f"Bill ID: {args.bill_id}")
     else:
         print(f"Limit: {args.limit or 'all'}")
+    print(f"Model: {args.model} (PDF text up to {args.max_pdf_chars:,} chars)")
     print(f"Force regenerate: {args.force}")
     print(f"Mode: {'batch' if args.batch else 'synchronous'}")
     if not args.batch:
@@ -622,120 +1249,160 @@ def main():
     )
     print(f"Found {len(bills)} bills to process")
 
-    # Skip bills that have neither PDF text nor debate records
-    if not args.bill_id:
-        original_count = len(bills)
-        bills = [b for b in bills if b.get("pdf_text") or b["debate_count"] > 0]
-        skipped = original_count - len(bills)
-        if skipped > 0:
-            print(f"Skipped {skipped} bills with no PDF" " text and no debate records")
+    # Skip bills that have neither PDF text nor a debate summary; the prompt
+    # would only contain the title (the bulk query already filters these)
+    original_count = len(bills)
+    bills = [b for b in bills if b.get("pdf_text") or b["debate_summary"]]
+    skipped = original_count - len(bills)
+    if skipped > 0:
+        print(f"Skipped {skipped} bills with no PDF" " text and no debate summary")
+
+    # Skip completed bills whose source text is unchanged since generation
+    if not args.force:
+        unchanged_bills = [b for b in bills if source_unchanged(b)]
+        bills = [b for b in bills if not source_unchanged(b)]
+        if unchanged_bills:
+            print(f"Skipped {len(unchanged_bills)} bills with unchanged source text")
+        rewritten = rewrite_blake2b_source_hashes(conn, unchanged_bills)
+        if rewritten:
+            print(f"Rewrote {rewritten} BLAKE2b source hashes as MD5")
     print(f"Processing {len(bills)} bills")
     print("")
 
     # Batch mode: prepare and submit
     if args.batch:
         print("Preparing batch requests...")
-        requests = prepare_batch_requests(conn, bills)
+        requests = prepare_batch_requests(bills, args.model, args.max_pdf_chars)
         print(f"Prepared {len(requests)} requests")
         if not requests:
             print("No requests to submit.")
             conn.close()
             return
-        batch_id = submit_batch(client, requests)
+        batch_id = submit_batch(client, requests, args.model)
         print(f"\nBatch submitted! ID: {batch_id}")
+        if args.wait:
+            print("Waiting for batch to finish...")
+            wait_for_batch(client, batch_id, args.poll_interval)
+            retrieve_batch_results(client, conn, batch_id)
+            conn.close()
+            return
         print(f"Check status:  pnpm enrich:bills --batch-status {batch_id}")
         print(f"Get results:   pnpm enrich:bills --batch-results {batch_id}")
         conn.close()
         return
 
-    # Thread-safe counter
-    lock = threading.Lock()
-    results = {"success": 0, "error": 0}
+    concurrency = max(args.concurrency, 1)
+
+    # Workers no longer touch the DB; the pool only serves the writer thread
+    pool = ThreadedConnectionPool(minconn=1, maxconn=1, dsn=database_url)
 
-    def process_bill(bill_index: int, bill: Dict[str, Any]) -> bool:
-        """Process a single bill - runs in a thread."""
-        # Each thread needs its own DB connection and OpenAI client
-        thread_conn = psycopg2.connect(database_url)
-        thread_client = openai.OpenAI(api_key=openai_api_key)
+    # Results are written in batches by a single background writer
+    writer = EnrichmentWriter(pool, args.model, bulk=args.bulk_commit).start()
 
-        bill_num = bill_index + 1
-        prefix = f"[Bill {bill_num}/{len(bills)}]"
+    results = {"success": 0, "error": 0}
+
+    async def process_bill(
+        client: openai.AsyncOpenAI,
+        limiter: RateLimiter,
+        semaphore: asyncio.Semaphore,
+        bill_index: int,
+        bill: Dict[str, Any],
+    ) -> bool:
+        """Process a single bill, holding one of the concurrency slots."""
+        prefix = f"[Bill {bill_index + 1}/{len(bills)}]"
 
         if not bill["title"]:
-            print(f"{prefix} Skipping: No title available")
-            thread_conn.close()
+            log.warning("%s Skipping: No title available", prefix)
             return False
 
-        try:
-            print(f"{prefix} {bill['title']}")
-
-            # Mark as processing
-            upsert_enrichment(thread_conn, bill["id"], "processing")
-
-            # Get debate summary for this bill
-            debate_summary = get_debate_summary_for_bill(thread_conn, bill["id"])
-            if debate_summary:
-                pro_count = len(debate_summary.get("pro_arguments", []))
-                con_count = len(debate_summary.get("con_arguments", []))
-                print(
-                    f"{prefix}   Debate summary:"
-                    f" {pro_count} pro,"
-                    f" {con_count} con"
+        async with semaphore:
+            # Marked as it is dispatched; the writer batches the mark
+            writer.put_status(bill["id"], "processing")
+            try:
+                # Debate summary was loaded with the bill
+                debate_summary = bill["debate_summary"]
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        "%s %s (debate summary: %s)",
+                        prefix,
+                        bill["title"],
+                        (
+                            f"{len(debate_summary.get('pro_arguments', []))} pro,"
+                            f" {len(debate_summary.get('con_arguments', []))} con"
+                            if debate_summary
+                            else "none"
+                        ),
+                    )
+
+                # Generate enrichment content
+                result = await generate_enrichment(
+                    client,
+                    limiter,
+                    bill["title"],
+                    bill.get("pdf_text"),
+                    debate_summary,
+                    # --force regenerates; fresh responses still refill the cache
+                    use_cache=not (args.no_cache or args.force),
+                    model=args.model,
+                    max_pdf_chars=args.max_pdf_chars,
                 )
-            else:
-                print(f"{prefix}   No debate" " summary available")
-
-            # Generate enrichment content
-            result = generate_enrichment(
-                thread_client,
-                bill["title"],
-                bill.get("pdf_text"),
-                debate_summary,
-            )
-
-            # Build source text hash for change detection
-            pdf_excerpt = (bill.get("pdf_text") or "")[:1000]
-            source_text = f"{bill['title']}|{pdf_excerpt}"
-            result["sourceHash"] = hash_text(source_text)
 
-            # Save to database
-            upsert_enrichment(thread_conn, bill["id"], "completed", result)
+                # Build source text hash for change detection
+                result["sourceHash"] = source_hash(bill)
 
-            print(f"{prefix}   ✓ Enrichment completed")
-            short_summary = result["summaryShort"][:50]
-            print(f"{prefix}     Short: {short_summary}...")
+                # Queue for the batched database write
+                writer.put_result(bill["id"], result)
 
-            with lock:
                 results["success"] += 1
+                log.info(
+                    "%s ✓ %s — %s... (%d done)",
+                    prefix,
+                    bill["title"],
+                    result["summaryShort"][:50],
+                    results["success"] + results["error"],
+                )
+                return True
 
-            return True
-
-        except Exception as e:
-            print(f"{prefix}   ✗ Error: {e}")
-            upsert_enrichment(thread_conn, bill["id"], "failed", error=str(e))
-            with lock:
+            except Exception as e:
+                writer.put_status(bill["id"], "failed", str(e))
                 results["error"] += 1
-            return False
+                log.error(
+                    "%s ✗ %s: %s (%d done)",
+                    prefix,
+                    bill["title"],
+                    e,
+                    results["success"] + results["error"],
+                )
+                return False
+
+    async def process_all():
+        # One shared client; the semaphore caps in-flight requests and the
+        # limiter paces them to the RPM/TPM quota (429s are retried by the SDK)
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = RateLimiter(args.rpm, args.tpm)
+        async with openai.AsyncOpenAI(
+            api_key=openai_api_key,
+            max_retries=MAX_API_RETRIES,
+            timeout=REQUEST_TIMEOUT,
+        ) as client:
+            await asyncio.gather(
+                *(
+                    process_bill(client, limiter, semaphore, i, bill)
+                    for i, bill in enumerate(bills)
+                )
+            )
 
-        finally:
-            thread_conn.close()
-
-    # Process bills with concurrency
-    if args.concurrency > 1:
-        print(f"Processing with {args.concurrency} parallel workers...\n")
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {
-                executor.submit(process_bill, i, bill): bill
-                for i, bill in enumerate(bills)
-            }
-            for future in as_completed(futures):
-                # Results are already tracked in the results dict
-                pass
-    else:
-        # Sequential processing
-        for i, bill in enumerate(bills):
-            process_bill(i, bill)
-            time.sleep(DELAY_BETWEEN_REQUESTS)
+    print(f"Processing with up to {concurrency} concurrent requests...\n")
+    asyncio.run(process_all())
+
+    writer.close()
+    pool.closeall()
+
+    # Results the writer could not save are not successes
+    results["success"] -= writer.failed_writes
+    results["error"] += writer.failed_writes
+    if writer.failed_writes:
+        log.error("%d enrichments could not be saved", writer.failed_writes)
 
     print("")
     print("=" * 60)
@@ -744,6 +1411,9 @@ def main():
 
     conn.close()
 
+    if writer.failed_writes:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
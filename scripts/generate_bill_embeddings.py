@@ -8,26 +8,41 @@ Generate embeddings for bills by:
 """
 
 import os
+import io
 import json
 import re
+import struct
 import sys
-from typing import List, Dict, Optional
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Optional, Tuple
 import requests
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import psycopg2
-from datetime import datetime
 from dotenv import load_dotenv
+import numpy as np
 
 # Load environment variables from .env file
 load_dotenv()
 
+# PDFium (C++) extracts text far faster than PyPDF2's pure-Python layout
+# code; PyPDF2 is only used when pypdfium2 is missing
 try:
-    import PyPDF2
+    import pypdfium2 as pdfium
 except ImportError:
-    print("PyPDF2 not installed. Run: pip install PyPDF2")
-    sys.exit(1)
+    pdfium = None
+
+    try:
+        import PyPDF2
+    except ImportError:
+        print("pypdfium2 not installed. Run: pip install pypdfium2")
+        sys.exit(1)
 
 try:
+    import torch
     from sentence_transformers import SentenceTransformer
 except ImportError:
     print(
@@ -35,12 +50,185 @@ except ImportError:
     )
     sys.exit(1)
 
+try:
+    import orjson
+
+    def embedding_json(embedding: np.ndarray) -> str:
+        # Serializes float32 directly with the shortest round-tripping repr,
+        # about half the size of json.dumps on the float64 tolist() values
+        return orjson.dumps(embedding, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+except ImportError:
+
+    def embedding_json(embedding: np.ndarray) -> str:
+        return json.dumps(embedding.tolist())
+
+
+# lxml parses the gian page in C; html.parser is the pure-Python fallback
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Dynamically int8-quantized ONNX export published alongside the model on
+# the Hugging Face Hub, used by --onnx for CPU inference
+ONNX_QUANTIZED_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# PDF text included in the embedding document. The model only reads its
+# first max_seq_length tokens (128 for paraphrase-multilingual-mpnet-base-v2),
+# which Japanese bill text reaches well within this many characters, so
+# anything longer is tokenized only to be thrown away
+EMBED_PDF_CHARS = 2000
+
+# Documents per transformer forward pass
+ENCODE_BATCH_SIZE = 32
+
+# Bills are fetched, encoded and written in windows of this size. Within a
+# window documents are sorted by token count before batching, so a wider
+# window keeps title-only bills and long PDF bills out of the same batch
+BUCKET_WINDOW = 256
+
+# Worker threads for the network-bound PDF lookup / download stage
+FETCH_WORKERS = 16
+
+# Bills prepared ahead of the encoder, bounding memory held by fetched
+# PDF text while keeping the next window ready when encoding finishes
+FETCH_AHEAD = 2 * BUCKET_WINDOW
+
+# Encoded windows waiting for the database writer thread
+WRITE_QUEUE_SIZE = 2
+HTTP_TIMEOUT = 30
+
+# Section headers on the gian page for each bill type
+GIAN_TYPE_HEADERS = {
+    "閣法": "法律案（内閣提出）",
+    "衆法": "法律案（衆法）",
+    "参法": "法律案（参法）",
+}
+
+# (bill type, bill number) -> PDF URL for one session's gian page
+GianIndex = Dict[Tuple[str, int], str]
+
+# Stop reading PDF pages once this much text has been collected. The text
+# is stored in bill_embeddings.text_content, which enrich_bills.py reads up
+# to its own MAX_PDF_CHARS (100,000), so the cap follows that consumer rather
+# than the much shorter embedding document. The margin covers characters
+# lost when whitespace is collapsed.
+MAX_PDF_TEXT_CHARS = 110_000
+
+# PDF extraction noise stripped by strip_pdf_noise while the page text still
+# has its line breaks (they are lost when whitespace is collapsed): page
+# numbers such as "12", "- 12 -" or "－１２－" on a line of their own, and
+# lines repeated on consecutive lines
+PAGE_NUMBER_LINE_RE = re.compile(
+    r"^[ \t\u3000]*[-－]?[ \t\u3000]*[0-9０-９]+[ \t\u3000]*[-－]?[ \t\u3000]*$",
+    re.MULTILINE,
+)
+REPEATED_LINE_RE = re.compile(r"^(.+)(?:\n\1)+$", re.MULTILINE)
+
+PreparedBill = Tuple[Dict, Optional[str], Optional[str], str]
+
+# Each window is binary-COPYed into a temp staging table and merged with
+# one INSERT ... SELECT, so the server skips per-value text parsing and
+# escaping of the long text_content and embedding fields
+EMBEDDING_COPY_COLUMNS = "bill_id, pdf_url, text_content, embedding, embedding_model"
+MERGE_STAGED_EMBEDDINGS_QUERY = f"""
+INSERT INTO bill_embeddings ({EMBEDDING_COPY_COLUMNS}, created_at)
+SELECT {EMBEDDING_COPY_COLUMNS}, NOW()
+FROM bill_embeddings_staging
+ON CONFLICT (bill_id) DO UPDATE SET
+    pdf_url = EXCLUDED.pdf_url,
+    text_content = EXCLUDED.text_content,
+    embedding = EXCLUDED.embedding,
+    embedding_model = EXCLUDED.embedding_model,
+    created_at = EXCLUDED.created_at
+"""
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+PGCOPY_TRAILER = struct.pack(">h", -1)
+
+
+def build_embeddings_copy_buffer(rows: List[tuple]) -> io.BytesIO:
+    """
+    Encode embedding rows in PostgreSQL binary COPY format: bill_id int4
+    followed by four text fields (NULL as -1).
+    """
+    buf = io.BytesIO()
+    buf.write(PGCOPY_HEADER)
+
+    for bill_id, *fields in rows:
+        buf.write(struct.pack(">hii", len(fields) + 1, 4, bill_id))
+        for field in fields:
+            if field is None:
+                buf.write(struct.pack(">i", -1))
+            else:
+                data = field.encode()
+                buf.write(struct.pack(">i", len(data)))
+                buf.write(data)
+
+    buf.write(PGCOPY_TRAILER)
+    buf.seek(0)
+    return buf
+
+
+# PDFium is not thread-safe, so fetch workers take turns extracting text
+PDFIUM_LOCK = threading.Lock()
+
+
+def strip_pdf_noise(text: str) -> str:
+    """Drop page-number lines and consecutive repeated lines from PDF text."""
+    text = text.replace("\r\n", "\n").replace("\r", "\n").replace("\f", "\n")
+    text = PAGE_NUMBER_LINE_RE.sub("", text)
+    return REPEATED_LINE_RE.sub(r"\1", text)
+
+
+def read_pdf_pages(content: bytes, max_chars: Optional[int] = None) -> List[str]:
+    """
+    Extract the text of each page of a PDF document.
+
+    Args:
+        content: Raw PDF bytes
+        max_chars: Stop after the page that brings the collected text to
+            at least this many characters (None reads every page)
+    """
+    pages = []
+    total_len = 0
+
+    if pdfium is None:
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+        for page in pdf_reader.pages:
+            text = page.extract_text() or ""
+            pages.append(text)
+            total_len += len(text)
+            if max_chars is not None and total_len >= max_chars:
+                break
+        return pages
+
+    with PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(content)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                pages.append(text)
+                total_len += len(text)
+                if max_chars is not None and total_len >= max_chars:
+                    break
+        finally:
+            pdf.close()
+    return pages
+
 
 class BillEmbeddingGenerator:
     def __init__(
         self,
         database_url: str,
         model_name: str = ("paraphrase-multilingual-mpnet-base-v2"),
+        half_precision: bool = True,
+        onnx: bool = False,
     ):
         """
         Initialize the generator with database
@@ -50,17 +238,81 @@ class BillEmbeddingGenerator:
             database_url: PostgreSQL connection string
             model_name: Sentence-transformers model name
                 (default: multilingual model for Japanese)
+            half_precision: Run the model in FP16 when it is on a CUDA
+                device (ignored on CPU)
+            onnx: Run the int8-quantized ONNX export on ONNX Runtime's CPU
+                provider instead of PyTorch
         """
         self.conn = psycopg2.connect(database_url)
+        self.session = self._create_session()
+        self._gian_index_cache: Dict[int, GianIndex] = {}
+        self._gian_index_lock = threading.Lock()
         self.model_name = model_name
         print(f"Loading embedding model: {model_name}...")
-        self.model = SentenceTransformer(model_name)
+        if onnx:
+            # Same pooling and output space as the PyTorch model, so the
+            # stored embeddings stay comparable across backends
+            self.model = SentenceTransformer(
+                model_name,
+                device="cpu",
+                backend="onnx",
+                model_kwargs={
+                    "file_name": ONNX_QUANTIZED_FILE,
+                    "provider": "CPUExecutionProvider",
+                },
+            )
+        else:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.model = SentenceTransformer(model_name, device=device)
+        self.model.eval()
+        if self.model.device.type == "cuda":
+            if half_precision:
+                # Inference only: FP16 runs on tensor cores at half the
+                # memory traffic with negligible drift in cosine similarity
+                self.model.half()
+            else:
+                torch.set_float32_matmul_precision("high")
+            # Pay for CUDA context setup and kernel selection up front
+            # instead of inside the first real batch
+            with torch.inference_mode():
+                self.model.encode(
+                    ["warmup"] * ENCODE_BATCH_SIZE,
+                    batch_size=ENCODE_BATCH_SIZE,
+                    show_progress_bar=False,
+                )
         print(
             "Model loaded successfully."
+            f" Device: {self.model.device}."
             " Embedding dimension:"
             f" {self.model.get_sentence_embedding_dimension()}"
         )
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create an HTTP session shared by all fetch workers so connections
+        to sangiin.go.jp are kept alive and reused across bills.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=FETCH_WORKERS,
+            pool_maxsize=FETCH_WORKERS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "User-Agent": "candidate-match-bill-embeddings/1.0",
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+        return session
+
     def get_bills_without_embeddings(
         self,
         limit: Optional[int] = None,
@@ -105,8 +357,33 @@ class BillEmbeddingGenerator:
         Scrape the actual PDF URL from the sangiin.go.jp gian page.
         This is more reliable than trying to construct the URL pattern.
         """
+        if bill_type not in GIAN_TYPE_HEADERS:
+            return None
+
+        index = self._get_gian_index(session)
+        if index is None:
+            return None
+        return index.get((bill_type, number))
+
+    def _get_gian_index(self, session: int) -> Optional[GianIndex]:
+        """
+        Return the PDF URL index for a session, fetching and parsing its
+        gian page only once. Every bill of a session lives on the same
+        page, so later lookups are plain dict hits.
+        """
+        with self._gian_index_lock:
+            if session in self._gian_index_cache:
+                return self._gian_index_cache[session]
+
+            index = self._fetch_gian_index(session)
+            if index is not None:
+                self._gian_index_cache[session] = index
+            return index
+
+    def _fetch_gian_index(self, session: int) -> Optional[GianIndex]:
+        """Fetch a session's gian page and index its bill PDF links."""
         try:
-            from bs4 import BeautifulSoup
+            from bs4 import BeautifulSoup, SoupStrainer
         except ImportError:
             print(
                 "  Warning: BeautifulSoup not"
@@ -123,89 +400,94 @@ class BillEmbeddingGenerator:
         )
 
         try:
-            response = requests.get(gian_url, timeout=30)
+            response = self.session.get(gian_url, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"  Error fetching gian page: {e}")
+            return None
 
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Find the section for this bill type
-            type_headers = {
-                "閣法": "法律案（内閣提出）",
-                "衆法": "法律案（衆法）",
-                "参法": "法律案（参法）",
-            }
-
-            if bill_type not in type_headers:
-                return None
+        # Only the section headers and their tables matter; the strainer
+        # keeps the rest of the page out of the tree entirely
+        soup = BeautifulSoup(
+            response.content,
+            HTML_PARSER,
+            parse_only=SoupStrainer(["h2", "table"]),
+        )
 
-            # Find the h2 header for this bill type
-            h2 = soup.find(
-                "h2",
-                string=lambda text: (text and type_headers[bill_type] in text),
+        index: GianIndex = {}
+        seen_types = set()
+        for h2 in soup.find_all("h2"):
+            # Match the h2 header to a bill type (first section wins)
+            heading = h2.get_text()
+            bill_type = next(
+                (
+                    bill_type
+                    for bill_type, header in GIAN_TYPE_HEADERS.items()
+                    if bill_type not in seen_types and header in heading
+                ),
+                None,
             )
-            if not h2:
-                return None
+            if bill_type is None:
+                continue
+            seen_types.add(bill_type)
 
             # Find the table after the h2
             table = h2.find_next("table")
             if not table:
-                return None
+                continue
 
-            # Find the row with our bill number
             for row in table.find_all("tr"):
                 cells = row.find_all("td")
-                if len(cells) >= 3:
-                    # First cell should contain the bill number
-                    try:
-                        row_number = int(cells[1].get_text(strip=True))
-                        if row_number == number:
-                            # Look for the PDF link in this row (提出法律案)
-                            for cell in cells:
-                                link = cell.find(
-                                    "a",
-                                    href=lambda h: (h and "pdf/t" in h),
-                                )
-                                if link:
-                                    pdf_path = link.get("href")
-                                    # Resolve relative URL
-                                    if pdf_path.startswith("./"):
-                                        pdf_path = pdf_path[2:]
-                                    full_url = (
-                                        "https://www.sangiin.go.jp"
-                                        "/japanese/joho1/kousei"
-                                        f"/gian/{session}/"
-                                        f"{pdf_path}"
-                                    )
-                                    return full_url
-                    except (ValueError, AttributeError):
-                        continue
-
-            return None
-
-        except requests.exceptions.RequestException as e:
-            print(f"  Error fetching gian page: {e}")
-            return None
-
-    def extract_pdf_text(self, pdf_url: str) -> Optional[str]:
-        """Download PDF and extract text content."""
+                if len(cells) < 3:
+                    continue
+                # Second cell holds the bill number
+                try:
+                    row_number = int(cells[1].get_text(strip=True))
+                except ValueError:
+                    continue
+                if (bill_type, row_number) in index:
+                    continue
+
+                # Look for the PDF link in this row (提出法律案)
+                for cell in cells:
+                    link = cell.select_one('a[href*="pdf/t"]')
+                    if link:
+                        pdf_path = link.get("href")
+                        # Resolve relative URL
+                        if pdf_path.startswith("./"):
+                            pdf_path = pdf_path[2:]
+                        index[(bill_type, row_number)] = (
+                            "https://www.sangiin.go.jp"
+                            "/japanese/joho1/kousei"
+                            f"/gian/{session}/"
+                            f"{pdf_path}"
+                        )
+                        break
+
+        return index
+
+    def extract_pdf_text(
+        self,
+        pdf_url: str,
+        max_chars: int = MAX_PDF_TEXT_CHARS,
+    ) -> Optional[str]:
+        """
+        Download PDF and extract text content, skipping the pages past
+        roughly max_chars characters.
+        """
         try:
-            response = requests.get(pdf_url, timeout=30)
+            response = self.session.get(pdf_url, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
 
-            pdf_file = BytesIO(response.content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-
-            text_content = []
-            for page in pdf_reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_content.append(text)
+            text_content = [
+                text for text in read_pdf_pages(response.content, max_chars) if text
+            ]
 
-            full_text = "\n".join(text_content)
+            full_text = strip_pdf_noise("\n".join(text_content))
 
-            # Clean up text
-            full_text = re.sub(r"\s+", " ", full_text)  # Normalize whitespace
-            full_text = full_text.strip()
+            # Normalize whitespace; str.split() treats the same characters
+            # as whitespace as \s and drops leading/trailing runs
+            full_text = " ".join(full_text.split())
 
             return full_text if full_text else None
 
@@ -239,87 +521,164 @@ class BillEmbeddingGenerator:
 
         # Add PDF text content
         if pdf_text:
-            parts.append(
-                f"本文: {pdf_text[:5000]}"
-            )  # Limit to first 5000 chars to avoid too long texts
+            parts.append(f"本文: {pdf_text[:EMBED_PDF_CHARS]}")
 
         document = "\n\n".join(parts)
         return document
 
-    def generate_and_store_embedding(self, bill: Dict) -> bool:
-        """Generate embedding for a bill and store in database."""
-        bill_id = bill["id"]
-        bill_type = bill["type"]
-        session = bill["submission_session"]
-        number = bill["number"]
-
-        print(f"\nProcessing bill {bill_id}: {bill_type}-{session}-{number}")
-        print(f"  Title: {bill.get('title', 'N/A')[:80]}...")
+    def prepare_bill(self, bill: Dict) -> PreparedBill:
+        """
+        Resolve the PDF for a bill and build its embedding document.
+        Safe to run from worker threads: it does not touch the database.
 
+        Returns:
+            (bill, pdf_url, pdf_text, document)
+        """
         # Scrape PDF URL from the website
-        pdf_url = self.scrape_pdf_url(bill_type, session, number)
-
-        if pdf_url:
-            print(f"  PDF URL: {pdf_url}")
-        else:
-            print("  Warning: Could not find PDF URL for this bill")
+        pdf_url = self.scrape_pdf_url(
+            bill["type"], bill["submission_session"], bill["number"]
+        )
 
         # Extract PDF text if URL was found
-        pdf_text = None
+        pdf_text = self.extract_pdf_text(pdf_url) if pdf_url else None
+
+        # Create document for embedding
+        document = self.create_bill_document(bill, pdf_text)
+
+        return bill, pdf_url, pdf_text, document
+
+    def report_prepared(self, prepared: PreparedBill):
+        """Print the progress lines for a prepared bill."""
+        bill, pdf_url, pdf_text, document = prepared
+
+        print(
+            f"\nProcessing bill {bill['id']}: {bill['type']}"
+            f"-{bill['submission_session']}-{bill['number']}"
+        )
+        print(f"  Title: {bill.get('title', 'N/A')[:80]}...")
+
         if pdf_url:
-            pdf_text = self.extract_pdf_text(pdf_url)
+            print(f"  PDF URL: {pdf_url}")
             if pdf_text:
                 print(f"  Extracted {len(pdf_text)} characters from PDF")
             else:
                 print("  Warning: Could not extract text from PDF")
+        else:
+            print("  Warning: Could not find PDF URL for this bill")
 
         if not pdf_text:
             print("  Using title only")
 
-        # Create document for embedding
-        document = self.create_bill_document(bill, pdf_text)
         print(f"  Document length: {len(document)} characters")
 
-        # Generate embedding
-        print("  Generating embedding...")
-        embedding = self.model.encode(document)
-        embedding_json = json.dumps(embedding.tolist())
+    def encode_documents(
+        self, documents: List[str], pdf_cut: Optional[List[bool]] = None
+    ) -> np.ndarray:
+        """
+        Encode documents in batches of similar token length.
+
+        Documents are sorted by their true token count so each padded
+        batch wastes as little attention compute as possible; the
+        embeddings are returned in the original document order.
+        Identical documents are encoded once and share the embedding.
+        pdf_cut flags the documents whose PDF text was longer than
+        EMBED_PDF_CHARS.
+        """
+        unique_index: Dict[str, int] = {}
+        inverse = [unique_index.setdefault(doc, len(unique_index)) for doc in documents]
+        if len(unique_index) < len(documents):
+            unique_cut = None
+            if pdf_cut is not None:
+                unique_cut = [False] * len(unique_index)
+                for i, cut in zip(inverse, pdf_cut):
+                    unique_cut[i] = unique_cut[i] or cut
+            return self.encode_documents(list(unique_index), unique_cut)[inverse]
+
+        lengths = self.model.tokenizer(
+            documents,
+            truncation=True,
+            max_length=self.model.max_seq_length,
+            return_length=True,
+        )["length"]
+        order = np.argsort(lengths, kind="stable")
+
+        # A cut document that still fits in the model's window lost text
+        # the model would have read; EMBED_PDF_CHARS is then too small
+        undercut = sum(
+            1
+            for cut, length in zip(pdf_cut or (), lengths)
+            if cut and length < self.model.max_seq_length
+        )
+        if undercut:
+            print(
+                f"  Warning: {undercut} documents were truncated to"
+                f" {EMBED_PDF_CHARS} PDF characters before filling"
+                f" {self.model.max_seq_length} tokens"
+            )
+
+        embeddings = np.empty(
+            (len(documents), self.model.get_sentence_embedding_dimension()),
+            dtype=np.float32,
+        )
+        # Embeddings are never backpropagated; inference_mode also skips
+        # autograd's view and version-counter bookkeeping
+        with torch.inference_mode():
+            for start in range(0, len(order), ENCODE_BATCH_SIZE):
+                end = start + ENCODE_BATCH_SIZE
+                batch_idx = order[start:end]
+                embeddings[batch_idx] = self.model.encode(
+                    [documents[i] for i in batch_idx],
+                    batch_size=ENCODE_BATCH_SIZE,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                    normalize_embeddings=False,
+                )
+        return embeddings
+
+    def store_embeddings(
+        self, prepared: List[PreparedBill], embeddings: np.ndarray
+    ) -> int:
+        """
+        Store a batch of embeddings through the staging table.
+
+        Returns:
+            Number of embeddings stored (0 if the batch failed)
+        """
+        rows = [
+            (
+                bill["id"],
+                pdf_url,
+                pdf_text,
+                embedding_json(embedding),
+                self.model_name,
+            )
+            for (bill, pdf_url, pdf_text, _), embedding in zip(prepared, embeddings)
+        ]
 
-        # Store in database
         cursor = self.conn.cursor()
         try:
             cursor.execute(
                 """
-                INSERT INTO bill_embeddings
-                    (bill_id, pdf_url, text_content,
-                     embedding, embedding_model,
-                     created_at)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (bill_id) DO UPDATE
-                SET pdf_url = EXCLUDED.pdf_url,
-                    text_content = EXCLUDED.text_content,
-                    embedding = EXCLUDED.embedding,
-                    embedding_model = EXCLUDED.embedding_model,
-                    created_at = EXCLUDED.created_at
-            """,
-                (
-                    bill_id,
-                    pdf_url,
-                    pdf_text,
-                    embedding_json,
-                    self.model_name,
-                    datetime.now(),
-                ),
+                CREATE TEMP TABLE IF NOT EXISTS bill_embeddings_staging
+                    (LIKE bill_embeddings INCLUDING DEFAULTS)
+                    ON COMMIT DELETE ROWS
+                """
+            )
+            cursor.copy_expert(
+                f"COPY bill_embeddings_staging ({EMBEDDING_COPY_COLUMNS})"
+                " FROM STDIN WITH BINARY",
+                build_embeddings_copy_buffer(rows),
             )
+            cursor.execute(MERGE_STAGED_EMBEDDINGS_QUERY)
 
             self.conn.commit()
-            print("  ✓ Embedding stored successfully")
-            return True
+            print(f"  ✓ Stored {len(rows)} embeddings")
+            return len(rows)
 
         except Exception as e:
             self.conn.rollback()
-            print(f"  Error storing embedding: {e}")
-            return False
+            print(f"  Error storing embeddings: {e}")
+            return 0
         finally:
             cursor.close()
 
@@ -333,45 +692,129 @@ class BillEmbeddingGenerator:
 
         print(f"\nFound {len(bills)} bills without embeddings")
 
-        success_count = 0
-        for i, bill in enumerate(bills, 1):
-            print(f"\n[{i}/{len(bills)}]", end=" ")
-            if self.generate_and_store_embedding(bill):
-                success_count += 1
+        # Three overlapping stages: fetch workers prepare documents ahead of
+        # the encoder, the main thread encodes, and a writer thread (the
+        # only user of self.conn from here on) stores finished windows
+        write_queue: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        stored = [0]
+
+        def write_windows():
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    return
+                stored[0] += self.store_embeddings(*item)
+
+        writer = threading.Thread(target=write_windows, daemon=True)
+        writer.start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+                results = self._prepare_ahead(executor, bills)
+
+                for start in range(0, len(bills), BUCKET_WINDOW):
+                    window = range(
+                        start + 1, min(start + BUCKET_WINDOW, len(bills)) + 1
+                    )
+                    prepared = []
+                    for i, item in zip(window, results):
+                        print(f"\n[{i}/{len(bills)}]", end=" ")
+                        self.report_prepared(item)
+                        prepared.append(item)
+
+                    print(f"\nGenerating embeddings for {len(prepared)} bills...")
+                    embeddings = self.encode_documents(
+                        [doc for *_, doc in prepared],
+                        [
+                            len(pdf_text or "") > EMBED_PDF_CHARS
+                            for _, _, pdf_text, _ in prepared
+                        ],
+                    )
+                    write_queue.put((prepared, embeddings))
+        finally:
+            write_queue.put(None)
+            writer.join()
+
+        success_count = stored[0]
 
         print("\n\n=== Summary ===")
         print(f"Total bills processed: {len(bills)}")
         print(f"Successfully generated embeddings: {success_count}")
         print(f"Failed: {len(bills) - success_count}")
 
+    def _prepare_ahead(
+        self, executor: ThreadPoolExecutor, bills: List[Dict]
+    ) -> Iterator[PreparedBill]:
+        """
+        Yield prepared bills in order while keeping up to FETCH_AHEAD
+        of them in flight on the executor.
+        """
+        pending = deque()
+        remaining = iter(bills)
+
+        for bill in remaining:
+            pending.append(executor.submit(self.prepare_bill, bill))
+            if len(pending) >= FETCH_AHEAD:
+                break
+
+        while pending:
+            result = pending.popleft().result()
+            bill = next(remaining, None)
+            if bill is not None:
+                pending.append(executor.submit(self.prepare_bill, bill))
+            yield result
+
     def close(self):
-        """Close database connection."""
+        """Close HTTP session and database connection."""
+        self.session.close()
         if self.conn:
             self.conn.close()
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Generate embeddings for bills without one"
+    )
+    parser.add_argument(
+        "limit",
+        nargs="?",
+        type=int,
+        default=None,
+        help="Number of bills to process (default: all)",
+    )
+    parser.add_argument(
+        "--fp32",
+        action="store_true",
+        help="Keep the model in FP32 on GPU instead of FP16",
+    )
+    parser.add_argument(
+        "--onnx",
+        action="store_true",
+        help="Use the int8-quantized ONNX model on CPU"
+        " (requires sentence-transformers[onnx] >= 3.2)",
+    )
+    args = parser.parse_args()
+
     # Get database URL from environment
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
         print("Error: DATABASE_URL environment variable not set")
         sys.exit(1)
 
-    # Parse command line arguments
-    limit = None
-    if len(sys.argv) > 1:
-        try:
-            limit = int(sys.argv[1])
-            print(f"Processing limit: {limit} bills")
-        except ValueError:
-            print(f"Invalid limit value: {sys.argv[1]}")
-            sys.exit(1)
+    if args.limit is not None:
+        print(f"Processing limit: {args.limit} bills")
 
     # Initialize generator
-    generator = BillEmbeddingGenerator(database_url)
+    generator = BillEmbeddingGenerator(
+        database_url,
+        half_precision=not args.fp32,
+        onnx=args.onnx,
+    )
 
     try:
-        generator.process_all_bills(limit)
+        generator.process_all_bills(args.limit)
     finally:
         generator.close()
 
@@ -8,6 +8,7 @@ import os
 import sys
 import json
 import psycopg2
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Tuple
 from dotenv import load_dotenv
@@ -20,6 +21,31 @@ except ImportError:
     print("openai package not installed. Run: pip install openai")
     sys.exit(1)
 
+# Concurrent naming requests; each label is an independent OpenAI call
+NAMING_WORKERS = 8
+
+# Identical for every cluster, so it goes first as the system message and
+# only the title list varies in the user turn; this lets OpenAI's automatic
+# prompt caching reuse the prefix once it is long enough to qualify
+NAMING_SYSTEM_PROMPT = """あなたは日本の国会法案を分析する専門家です。
+
+ユーザーが提示するのは、機械学習によってグループ化された法案のリストです。これらの法案に共通する具体的なテーマを特定し、このグループに適切な名前を付けてください。
+
+## 重要な指示:
+1. 名前は具体的で識別しやすいものにしてください。「法改正関連」のような汎用的な名前は避けてください。
+2. 法案の内容から、最も顕著な政策分野や目的を抽出してください。
+3. 例: 「地方財政・交付税」「労働者保護・雇用」「防衛・安保法制」「子育て・教育支援」「環境・エネルギー」など
+
+## 回答形式 (JSON):
+{
+    "name": "具体的で識別しやすいクラスター名（8文字以内）",
+    "description": "共通テーマの説明文。\
+「このクラスター」や「これらの法案」で始めず、\
+内容を直接説明してください。\
+例: 「地方自治体の財政基盤強化と交付税制度の改正\
+に関する法案群。○○や△△などの施策を含む。」"
+}"""
+
 
 def get_cluster_bills(conn, cluster_id: int) -> Dict[int, List[str]]:
     """Get all bills grouped by cluster label."""
@@ -72,32 +98,14 @@ def generate_cluster_name(
 
     # Send all titles
     titles_text = "\n".join(f"- {t}" for t in titles)
-
-    prompt = f"""あなたは日本の国会法案を分析する専門家です。
-
-以下は、機械学習によってグループ化された法案のリストです。これらの法案に共通する具体的なテーマを特定し、このグループに適切な名前を付けてください。
-
-## 重要な指示:
-1. 名前は具体的で識別しやすいものにしてください。「法改正関連」のような汎用的な名前は避けてください。
-2. 法案の内容から、最も顕著な政策分野や目的を抽出してください。
-3. 例: 「地方財政・交付税」「労働者保護・雇用」「防衛・安保法制」「子育て・教育支援」「環境・エネルギー」など
-
-## 法案タイトル一覧 ({len(titles)}件):
-{titles_text}
-
-## 回答形式 (JSON):
-{{
-    "name": "具体的で識別しやすいクラスター名（8文字以内）",
-    "description": "共通テーマの説明文。\
-「このクラスター」や「これらの法案」で始めず、\
-内容を直接説明してください。\
-例: 「地方自治体の財政基盤強化と交付税制度の改正\
-に関する法案群。○○や△△などの施策を含む。」"
-}}"""
+    user_content = f"## 法案タイトル一覧 ({len(titles)}件):\n{titles_text}"
 
     response = client.chat.completions.create(
         model="gpt-5.1",
-        messages=[{"role": "user", "content": prompt}],
+        messages=[
+            {"role": "system", "content": NAMING_SYSTEM_PROMPT},
+            {"role": "user", "content": user_content},
+        ],
         temperature=0.2,
         response_format={"type": "json_object"},
     )
@@ -187,24 +195,30 @@ def main():
     # Initialize OpenAI client
     client = openai.OpenAI(api_key=openai_api_key)
 
-    # Generate names for each cluster
-    for label in sorted(clusters.keys()):
-        if label in existing:
-            continue
+    # Generate names for each cluster. Requests overlap in worker threads;
+    # results are saved on the main thread, which owns the connection
+    pending = [label for label in sorted(clusters.keys()) if label not in existing]
+
+    with ThreadPoolExecutor(max_workers=NAMING_WORKERS) as executor:
+        futures = {
+            executor.submit(generate_cluster_name, client, clusters[label]): label
+            for label in pending
+        }
 
-        titles = clusters[label]
-        print(f"\nCluster {label}: {len(titles)} bills")
+        for future in as_completed(futures):
+            label = futures[future]
+            print(f"\nCluster {label}: {len(clusters[label])} bills")
 
-        try:
-            name, description = generate_cluster_name(client, titles)
-            print(f"  Name: {name}")
-            print(f"  Description: {description}")
+            try:
+                name, description = future.result()
+                print(f"  Name: {name}")
+                print(f"  Description: {description}")
 
-            save_cluster_name(conn, cluster_id, label, name, description)
-            print("  ✓ Saved to database")
+                save_cluster_name(conn, cluster_id, label, name, description)
+                print("  ✓ Saved to database")
 
-        except Exception as e:
-            print(f"  ✗ Error generating name: {e}")
+            except Exception as e:
+                print(f"  ✗ Error generating name: {e}")
 
     conn.close()
     print("\n✓ Done!")
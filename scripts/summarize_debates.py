@@ -12,46 +12,378 @@ The summaries are then used by enrich_bills.py for better enrichment.
 Usage:
     pnpm summarize:debates --limit 10
     pnpm summarize:debates --bill-id 1427 --force
-    pnpm summarize:debates --concurrency 3  # Process 3 bills in parallel
+    pnpm summarize:debates --concurrency 3  # Process 3 bills concurrently
+    pnpm summarize:debates --concurrency 1  # Process bills one at a time
     pnpm summarize:debates --batch --limit 100
+    pnpm summarize:debates --batch --wait
     pnpm summarize:debates --batch-status batch_abc123
     pnpm summarize:debates --batch-results batch_abc123
+    pnpm summarize:debates --backfill debate_backfill
 """
 
 import os
 import sys
 import json
 import argparse
+import asyncio
+import hashlib
+import queue
 import tempfile
-import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Any
+import time
+from collections import namedtuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 
 load_dotenv()
 
 try:
+    import httpx
     import openai
 except ImportError:
     print("openai package not installed. Run: pip install openai")
     sys.exit(1)
 
-DELAY_BETWEEN_REQUESTS = 0.5  # Reduced delay for efficiency
+# httpx only speaks HTTP/2 with the h2 package (pip install httpx[http2]);
+# without it the pooled client keeps HTTP/1.1 keep-alive connections
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+# Without tiktoken, chunk sizes fall back to one token per character, which
+# is close for Japanese text
+TOKEN_ENCODING = None
+try:
+    import tiktoken
+except ImportError:
+    pass
+else:
+    try:
+        # Tokenizer shared by the GPT-4o and GPT-5 model families
+        TOKEN_ENCODING = tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # The encoding file is downloaded on first use, so offline runs can fail
+        print(f"tiktoken encoding unavailable ({e}); counting characters instead")
+
 LLM_MODEL = "gpt-5.4-nano"  # 400K context, 128K output, cheapest GPT-5.4-class
-MAX_CONTEXT_CHARS = 180000  # ~135K tokens for Japanese text, stays under 200K TPM limit
+MAX_CONTEXT_TOKENS = 135_000  # Debate tokens per chunk (a folded tail adds up to 20%)
+TAIL_FOLD_RATIO = 0.2  # Fold a last chunk under 20% of the limit into the previous one
+MAX_PACKED_TOKENS = 270_000  # Chunk tokens packed into one request
 MAX_SPEECH_CHARS = 3000  # Allow longer individual speeches
-CHUNK_SIZE = 100  # Number of speeches per chunk for hierarchical summarization
+MIN_DEBATE_SPEECHES = 4  # Fewer speeches than this are summarized without the LLM
+MIN_DEBATE_CHARS = 500  # As are debates with less formatted text than this
+SKIPPED_MODEL = "skipped"  # llm_model recorded when no LLM call was made
+MIN_PROCEDURAL_CHARS = 80  # Shorter remarks by the chair are dropped as procedural
+DEBATE_FETCH_SIZE = 1000  # Rows per round-trip when streaming a bill's debates
+DEFAULT_RPM = 500  # Requests per minute allowed by the OpenAI tier
+DEFAULT_TPM = 2_000_000  # Input tokens per minute allowed by the OpenAI tier
+MAX_API_RETRIES = 6  # SDK retries 429/5xx/timeouts with exponential backoff and jitter
+REQUEST_TIMEOUT = 300  # Seconds before a single completion request is abandoned
+CONNECT_TIMEOUT = 10  # Seconds to establish a connection to the API
+BATCH_MERGE_CONNECTIONS = 10  # Pooled connections for merging batch chunk summaries
+BACKFILL_MAX_IN_FLIGHT = 50  # Concurrent requests in --backfill mode
+PROMPT_VERSION = 2  # Bump when prompts change so cached summaries are not reused
+BATCH_POLL_INTERVAL = 60  # Seconds between batch status checks with --wait
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Presiding officers whose short remarks (opening the sitting, recognizing
+# speakers, calling votes) are procedure rather than debate
+PROCEDURAL_POSITIONS = {
+    "議長",
+    "副議長",
+    "委員長",
+    "委員長代理",
+    "会長",
+    "会長代理",
+}
+
+# Static instructions sent as the system message. Keeping them identical and
+# ahead of the per-bill content lets OpenAI cache the shared prefix; the user
+# message carries only the bill title and debate text.
+SINGLE_SYSTEM_PROMPT = """あなたは国会議事録の分析専門家です。\
+ユーザーが提示する法案に関する国会での議論を分析し、構造化された要約を作成してください。
+
+===== 分析指示 =====
+以下のJSON形式で、議論の要点を整理してください：
+
+{
+  "proArguments": [
+    "賛成派の論点1（どの立場からのメリットか明示）",
+    "賛成派の論点2",
+    "賛成派の論点3"
+  ],
+  "conArguments": [
+    "反対派の論点1（どの立場からの懸念か明示）",
+    "反対派の論点2",
+    "反対派の論点3"
+  ],
+  "keyQuestions": [
+    "議員から出された重要な質問1",
+    "議員から出された重要な質問2"
+  ],
+  "governmentExplanations": [
+    "政府・担当大臣からの主な説明1",
+    "政府・担当大臣からの主な説明2"
+  ],
+  "summary": "この法案の議論で最も注目すべき点を100文字程度で要約"
+}
+
+注意事項：
+- 各カテゴリは2〜5項目を目安にする
+- 具体的な数字や事例があれば含める
+- 「〇〇の観点からは」のように、どの立場からの意見かを明示する
+- 質問が見つからない場合は空配列でよい
+- 必ず有効なJSONで返答すること"""
+
+CHUNK_SYSTEM_PROMPT = """あなたは国会議事録の分析専門家です。\
+ユーザーが提示する法案に関する国会での議論（指定されたパート）を分析してください。
+
+===== 分析指示 =====
+以下のJSON形式で、このパートの議論の要点を整理してください：
+
+{
+  "proArguments": ["賛成派の論点（立場を明示）"],
+  "conArguments": ["反対派の論点（立場を明示）"],
+  "keyQuestions": ["議員から出された重要な質問"],
+  "governmentExplanations": ["政府・担当大臣からの主な説明"],
+  "keyPoints": ["その他の重要な議論ポイント"]
+}
+
+注意事項：
+- 各カテゴリは0〜5項目
+- 該当がなければ空配列
+- 具体的な数字や事例を含める
+- 必ず有効なJSONで返答すること"""
+
+PACKED_CHUNK_SYSTEM_PROMPT = """あなたは国会議事録の分析専門家です。\
+ユーザーが提示する法案に関する国会での議論は、複数のパートに分けて見出し付きで示されます。各パートを個別に分析してください。
+
+===== 分析指示 =====
+以下のJSON形式で、パートごとに議論の要点を整理してください。"chunks"配列にはパートの順番どおりに、パート数と同じ個数のオブジェクトを入れてください：
+
+{
+  "chunks": [
+    {
+      "proArguments": ["賛成派の論点（立場を明示）"],
+      "conArguments": ["反対派の論点（立場を明示）"],
+      "keyQuestions": ["議員から出された重要な質問"],
+      "governmentExplanations": ["政府・担当大臣からの主な説明"],
+      "keyPoints": ["その他の重要な議論ポイント"]
+    }
+  ]
+}
+
+注意事項：
+- 各パートの各カテゴリは0〜5項目
+- 該当がなければ空配列
+- 具体的な数字や事例を含める
+- 必ず有効なJSONで返答すること"""
+
+MERGE_SYSTEM_PROMPT = """あなたは国会議事録の分析専門家です。\
+ユーザーが提示するのは、法案に関する議論を複数パートに分けて分析した結果です。
+これらを統合し、重複を除去して最終的な要約を作成してください。
+
+===== 統合指示 =====
+以下のJSON形式で、統合された要約を作成してください：
+
+{
+  "proArguments": [
+    "賛成派の論点1（どの立場からのメリットか明示）",
+    "賛成派の論点2",
+    "賛成派の論点3"
+  ],
+  "conArguments": [
+    "反対派の論点1（どの立場からの懸念か明示）",
+    "反対派の論点2",
+    "反対派の論点3"
+  ],
+  "keyQuestions": [
+    "議員から出された重要な質問1",
+    "議員から出された重要な質問2"
+  ],
+  "governmentExplanations": [
+    "政府・担当大臣からの主な説明1",
+    "政府・担当大臣からの主な説明2"
+  ],
+  "summary": "この法案の議論で最も注目すべき点を100文字程度で要約"
+}
+
+注意事項：
+- 重複する論点は統合する
+- 各カテゴリは2〜5項目を目安にする
+- 最も重要な論点を優先的に選ぶ
+- 具体的な数字や事例があれば含める
+- 必ず有効なJSONで返答すること"""
+
+STRING_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+
+def strict_object_schema(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Object schema requiring every property and allowing no others."""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def strict_response_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Structured output response_format enforcing `schema` exactly."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": schema},
+    }
+
+
+# Structured output schemas matching the system prompts above
+CHUNK_SCHEMA = strict_object_schema(
+    {
+        "proArguments": STRING_LIST_SCHEMA,
+        "conArguments": STRING_LIST_SCHEMA,
+        "keyQuestions": STRING_LIST_SCHEMA,
+        "governmentExplanations": STRING_LIST_SCHEMA,
+        "keyPoints": STRING_LIST_SCHEMA,
+    }
+)
+SUMMARY_SCHEMA = strict_object_schema(
+    {
+        "proArguments": STRING_LIST_SCHEMA,
+        "conArguments": STRING_LIST_SCHEMA,
+        "keyQuestions": STRING_LIST_SCHEMA,
+        "governmentExplanations": STRING_LIST_SCHEMA,
+        "summary": {"type": "string"},
+    }
+)
+
+# SINGLE_SYSTEM_PROMPT and MERGE_SYSTEM_PROMPT
+SUMMARY_RESPONSE_FORMAT = strict_response_format("debate_summary", SUMMARY_SCHEMA)
+# CHUNK_SYSTEM_PROMPT
+CHUNK_RESPONSE_FORMAT = strict_response_format("debate_chunk_summary", CHUNK_SCHEMA)
+# PACKED_CHUNK_SYSTEM_PROMPT
+PACKED_CHUNK_RESPONSE_FORMAT = strict_response_format(
+    "debate_chunk_summaries",
+    strict_object_schema({"chunks": {"type": "array", "items": CHUNK_SCHEMA}}),
+)
+
+
+class AsyncTokenBucket:
+    """Token bucket refilled continuously at `rate_per_minute`."""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = float(rate_per_minute)
+        self.tokens = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0):
+        """Wait until `amount` tokens are available, then take them."""
+        amount = min(amount, self.capacity)
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """Paces requests to OpenAI's per-minute request and token quotas."""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.requests = AsyncTokenBucket(rpm)
+        self.tokens = AsyncTokenBucket(tpm)
+
+    async def wait(self, messages: List[Dict[str, str]]):
+        await self.requests.acquire()
+        await self.tokens.acquire(estimate_tokens(messages))
+
+
+def create_async_client(api_key: str, max_connections: int) -> openai.AsyncOpenAI:
+    """Create an async OpenAI client over a shared keep-alive connection pool.
+
+    Requests reuse pooled TLS connections (multiplexed over HTTP/2 when h2 is
+    installed) instead of handshaking per request. Closing the OpenAI client
+    also closes the pool.
+    """
+    timeout = httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+    http_client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        timeout=timeout,
+    )
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        max_retries=MAX_API_RETRIES,
+        timeout=timeout,
+        http_client=http_client,
+    )
+
+
+def estimate_tokens(messages: List[Dict[str, str]]) -> int:
+    """Input token count, measured like the chunker with count_tokens."""
+    return sum(count_tokens(m["content"]) for m in messages)
+
+
+async def complete_json(
+    client: openai.AsyncOpenAI,
+    limiter: RateLimiter,
+    messages: List[Dict[str, str]],
+    response_format: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Run one structured output completion once the rate limiter admits it."""
+    await limiter.wait(messages)
+
+    response = await client.chat.completions.create(
+        model=LLM_MODEL,
+        messages=messages,
+        temperature=0.3,
+        response_format=response_format,
+    )
+
+    return json_loads(response.choices[0].message.content)
+
+
+# Row of get_bills_with_debates, in SELECT column order
+Bill = namedtuple("Bill", "id title debate_count")
 
 
 def get_bills_with_debates(
     conn, limit: Optional[int], force: bool, bill_id: Optional[int]
-) -> List[Dict[str, Any]]:
+) -> List[Bill]:
     """Get bills that have debates and need summarization."""
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    cursor = conn.cursor()
 
     if bill_id:
         query = """
@@ -86,14 +418,20 @@ def get_bills_with_debates(
         """
         cursor.execute(query)
 
-    bills = cursor.fetchall()
+    bills = [Bill(*row) for row in cursor.fetchall()]
     cursor.close()
     return bills
 
 
-def get_debates_for_bill(conn, bill_id: int) -> List[Dict[str, Any]]:
-    """Get all debate records for a bill."""
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+def get_bill_speeches(conn, bill_id: int) -> List[str]:
+    """Get all debate records for a bill, formatted for context.
+
+    Rows are streamed as tuples through a server-side cursor and formatted as
+    they arrive, so raw rows for large bills are never held in memory.
+    Procedural remarks are dropped (see format_speech).
+    """
+    cursor = conn.cursor(name=f"debates_{bill_id}")
+    cursor.itersize = DEBATE_FETCH_SIZE
 
     query = """
     SELECT
@@ -102,29 +440,30 @@ def get_debates_for_bill(conn, bill_id: int) -> List[Dict[str, Any]]:
         speaker_position,
         speaker_group,
         speaker_role,
-        house,
-        meeting_name,
-        meeting_date,
-        speech_order
+        house
     FROM bill_debates
     WHERE bill_id = %s
     ORDER BY meeting_date, speech_order
     """
 
     cursor.execute(query, (bill_id,))
-    debates = cursor.fetchall()
+    speeches = [speech for speech in map(format_speech, cursor) if speech is not None]
     cursor.close()
-    return debates
+    return speeches
+
 
+def format_speech(row: tuple) -> Optional[str]:
+    """Format a single speech row from get_bill_speeches for context.
 
-def format_speech(debate: Dict[str, Any]) -> str:
-    """Format a single speech for context."""
-    speaker = debate.get("speaker_name", "")
-    position = debate.get("speaker_position", "")
-    group = debate.get("speaker_group", "")
-    role = debate.get("speaker_role", "")
-    house = debate.get("house", "")
-    content = debate.get("speech_content", "")
+    Returns None for procedural remarks: the meeting record header and short
+    remarks by the presiding officer, which cost tokens without adding debate.
+    """
+    content, speaker, position, group, role, house = row
+
+    if speaker == "会議録情報":
+        return None
+    if position in PROCEDURAL_POSITIONS and len(content) < MIN_PROCEDURAL_CHARS:
+        return None
 
     # Build speaker label
     speaker_label = speaker
@@ -139,58 +478,240 @@ def format_speech(debate: Dict[str, Any]) -> str:
     if len(content) > MAX_SPEECH_CHARS:
         content = content[:MAX_SPEECH_CHARS] + "..."
 
-    return f"【{house}・{speaker_label}】\n{content}\n"
+    return "【{}・{}】\n{}\n".format(house, speaker_label, content)
 
 
-def summarize_chunk(
-    client: openai.OpenAI,
+def debate_input_hash(bill_title: str, speeches: List[str]) -> str:
+    """128-bit BLAKE2b hash of everything that determines a bill's summary."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{LLM_MODEL}|{PROMPT_VERSION}|{bill_title}|".encode())
+    for speech in speeches:
+        digest.update(speech.encode())
+    return digest.hexdigest()
+
+
+SUMMARY_FIELDS = (
+    "proArguments",
+    "conArguments",
+    "keyQuestions",
+    "governmentExplanations",
+)
+
+# Deterministic summary saved for trivially small debates
+EMPTY_SUMMARY = {field: [] for field in SUMMARY_FIELDS}
+
+
+def get_cached_summary(conn, input_hash: str) -> Optional[Dict[str, Any]]:
+    """Return a completed summary produced from identical input, if any."""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT pro_arguments_summary, con_arguments_summary,
+               key_questions, government_explanations
+        FROM bill_debate_summary
+        WHERE input_hash = %s AND status = 'completed'
+        LIMIT 1
+        """,
+        (input_hash,),
+    )
+    row = cursor.fetchone()
+    cursor.close()
+    if row is None:
+        return None
+    return {
+        field: json_loads(value) if value else []
+        for field, value in zip(SUMMARY_FIELDS, row)
+    }
+
+
+def load_bill_input(
+    conn, bill: Bill
+) -> Tuple[List[str], str, Optional[Dict[str, Any]]]:
+    """Fetch a bill's speeches and any reusable summary in one transaction.
+
+    Returns (formatted_speeches, input_hash, cached_summary). The cache is
+    only consulted for debates that would otherwise need the LLM. The
+    transaction is committed on return so the connection goes back to the
+    pool idle rather than idle in transaction.
+    """
+    with conn:
+        speeches = get_bill_speeches(conn, bill.id)
+        input_hash = debate_input_hash(bill.title, speeches)
+        cached = None
+        if not is_trivial_debate(speeches):
+            cached = get_cached_summary(conn, input_hash)
+    return speeches, input_hash, cached
+
+
+def is_trivial_debate(formatted_speeches: List[str]) -> bool:
+    """True for debates too small to be worth an LLM call."""
+    if len(formatted_speeches) < MIN_DEBATE_SPEECHES:
+        return True
+    return sum(len(s) for s in formatted_speeches) < MIN_DEBATE_CHARS
+
+
+def count_tokens(text: str) -> int:
+    """Model token count of `text` (characters if tiktoken is unavailable)."""
+    if TOKEN_ENCODING is None:
+        return len(text)
+    return len(TOKEN_ENCODING.encode_ordinary(text))
+
+
+def iter_chunks(formatted_speeches: List[str]) -> Iterator[Tuple[List[str], int]]:
+    """Yield (chunk, chunk_tokens), splitting at MAX_CONTEXT_TOKENS.
+
+    Sizing and splitting happen in one pass; a bill that fits a single context
+    comes back as exactly one chunk. A trailing chunk smaller than
+    TAIL_FOLD_RATIO of the context limit is folded into the previous chunk
+    rather than costing its own request, so the last chunk can reach
+    (1 + TAIL_FOLD_RATIO) * MAX_CONTEXT_TOKENS; that still fits the model's
+    400K context.
+    """
+    previous = None
+    current_chunk = []
+    current_size = 0
+
+    for speech in formatted_speeches:
+        size = count_tokens(speech)
+        if current_size + size > MAX_CONTEXT_TOKENS and current_chunk:
+            if previous:
+                yield previous
+            previous = (current_chunk, current_size)
+            current_chunk = []
+            current_size = 0
+        current_chunk.append(speech)
+        current_size += size
+
+    if previous and current_size < TAIL_FOLD_RATIO * MAX_CONTEXT_TOKENS:
+        previous[0].extend(current_chunk)
+        yield previous[0], previous[1] + current_size
+        return
+
+    if previous:
+        yield previous
+    if current_chunk:
+        yield current_chunk, current_size
+
+
+def build_chunk_messages(
+    bill_title: str, chunk_texts: List[str], chunk_num: int
+) -> List[Dict[str, str]]:
+    """Chat messages for summarizing one chunk of a large debate."""
+    debates_context = "\n".join(chunk_texts)
+    return [
+        {"role": "system", "content": CHUNK_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": f"""法案名: {bill_title}
+パート: {chunk_num}
+
+===== 議事録 =====
+{debates_context}""",
+        },
+    ]
+
+
+async def summarize_chunk(
+    client: openai.AsyncOpenAI,
+    limiter: RateLimiter,
     bill_title: str,
     chunk_texts: List[str],
     chunk_num: int,
 ) -> Dict[str, Any]:
     """Summarize a chunk of debates."""
-    debates_context = "\n".join(chunk_texts)
+    messages = build_chunk_messages(bill_title, chunk_texts, chunk_num)
 
-    prompt = f"""あなたは国会議事録の分析専門家です。以下の法案に関する国会での議論（パート{chunk_num}）を分析してください。
+    return await complete_json(client, limiter, messages, CHUNK_RESPONSE_FORMAT)
 
-法案名: {bill_title}
 
-===== 議事録 =====
-{debates_context}
+def pack_chunks(chunk_tokens: List[int]) -> List[List[int]]:
+    """Group consecutive chunk indices so each group stays within MAX_PACKED_TOKENS."""
+    groups = []
+    current_group = []
+    current_size = 0
 
-===== 分析指示 =====
-以下のJSON形式で、このパートの議論の要点を整理してください：
+    for i, size in enumerate(chunk_tokens):
+        if current_size + size > MAX_PACKED_TOKENS and current_group:
+            groups.append(current_group)
+            current_group = []
+            current_size = 0
+        current_group.append(i)
+        current_size += size
 
-{{
-  "proArguments": ["賛成派の論点（立場を明示）"],
-  "conArguments": ["反対派の論点（立場を明示）"],
-  "keyQuestions": ["議員から出された重要な質問"],
-  "governmentExplanations": ["政府・担当大臣からの主な説明"],
-  "keyPoints": ["その他の重要な議論ポイント"]
-}}
+    if current_group:
+        groups.append(current_group)
 
-注意事項：
-- 各カテゴリは0〜5項目
-- 該当がなければ空配列
-- 具体的な数字や事例を含める
-- 必ず有効なJSONで返答すること"""
+    return groups
 
-    response = client.chat.completions.create(
-        model=LLM_MODEL,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-        response_format={"type": "json_object"},
+
+def build_packed_chunk_messages(
+    bill_title: str, chunks: List[List[str]], chunk_nums: List[int]
+) -> List[Dict[str, str]]:
+    """Chat messages asking for a separate summary of each chunk."""
+    sections = "\n".join(
+        f"### パート{num}\n" + "\n".join(chunk)
+        for num, chunk in zip(chunk_nums, chunks)
     )
+    return [
+        {"role": "system", "content": PACKED_CHUNK_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": f"""法案名: {bill_title}
+パート数: {len(chunks)}
 
-    return json.loads(response.choices[0].message.content)
+===== 議事録 =====
+{sections}""",
+        },
+    ]
 
 
-def merge_chunk_summaries(
-    client: openai.OpenAI,
+async def summarize_chunks_packed(
+    client: openai.AsyncOpenAI,
+    limiter: RateLimiter,
     bill_title: str,
-    chunk_summaries: List[Dict[str, Any]],
-) -> Dict[str, Any]:
-    """Merge multiple chunk summaries into a final summary."""
+    chunks: List[List[str]],
+    chunk_tokens: List[int],
+) -> List[Dict[str, Any]]:
+    """Summarize chunks, packing several into each request where they fit.
+
+    A packed response whose "chunks" array does not line up with the request
+    falls back to one request per chunk.
+    """
+
+    async def summarize_group(group: List[int]) -> List[Dict[str, Any]]:
+        if len(group) == 1:
+            i = group[0]
+            return [
+                await summarize_chunk(client, limiter, bill_title, chunks[i], i + 1)
+            ]
+
+        messages = build_packed_chunk_messages(
+            bill_title, [chunks[i] for i in group], [i + 1 for i in group]
+        )
+        result = await complete_json(
+            client, limiter, messages, PACKED_CHUNK_RESPONSE_FORMAT
+        )
+        summaries = result["chunks"]
+        if len(summaries) == len(group):
+            return summaries
+
+        return await asyncio.gather(
+            *(
+                summarize_chunk(client, limiter, bill_title, chunks[i], i + 1)
+                for i in group
+            )
+        )
+
+    groups = await asyncio.gather(
+        *(summarize_group(g) for g in pack_chunks(chunk_tokens))
+    )
+    return [summary for group in groups for summary in group]
+
+
+def build_merge_messages(
+    bill_title: str, chunk_summaries: List[Dict[str, Any]]
+) -> List[Dict[str, str]]:
+    """Chat messages for merging chunk summaries into a final summary."""
     # Combine all points from chunks
     all_pro = []
     all_con = []
@@ -199,11 +720,11 @@ def merge_chunk_summaries(
     all_key = []
 
     for summary in chunk_summaries:
-        all_pro.extend(summary.get("proArguments", []))
-        all_con.extend(summary.get("conArguments", []))
-        all_questions.extend(summary.get("keyQuestions", []))
-        all_gov.extend(summary.get("governmentExplanations", []))
-        all_key.extend(summary.get("keyPoints", []))
+        all_pro.extend(summary["proArguments"])
+        all_con.extend(summary["conArguments"])
+        all_questions.extend(summary["keyQuestions"])
+        all_gov.extend(summary["governmentExplanations"])
+        all_key.extend(summary["keyPoints"])
 
     # Create context for final merge
     merge_context = f"""法案名: {bill_title}
@@ -225,163 +746,195 @@ def merge_chunk_summaries(
 【その他重要ポイント】({len(all_key)}件)
 {chr(10).join(f'- {k}' for k in all_key)}"""
 
-    prompt = f"""あなたは国会議事録の分析専門家です。以下は法案に関する議論を複数パートに分けて分析した結果です。
-これらを統合し、重複を除去して最終的な要約を作成してください。
-
-{merge_context}
-
-===== 統合指示 =====
-以下のJSON形式で、統合された要約を作成してください：
-
-{{
-  "proArguments": [
-    "賛成派の論点1（どの立場からのメリットか明示）",
-    "賛成派の論点2",
-    "賛成派の論点3"
-  ],
-  "conArguments": [
-    "反対派の論点1（どの立場からの懸念か明示）",
-    "反対派の論点2",
-    "反対派の論点3"
-  ],
-  "keyQuestions": [
-    "議員から出された重要な質問1",
-    "議員から出された重要な質問2"
-  ],
-  "governmentExplanations": [
-    "政府・担当大臣からの主な説明1",
-    "政府・担当大臣からの主な説明2"
-  ],
-  "summary": "この法案の議論で最も注目すべき点を100文字程度で要約"
-}}
+    return [
+        {"role": "system", "content": MERGE_SYSTEM_PROMPT},
+        {"role": "user", "content": merge_context},
+    ]
 
-注意事項：
-- 重複する論点は統合する
-- 各カテゴリは2〜5項目を目安にする
-- 最も重要な論点を優先的に選ぶ
-- 具体的な数字や事例があれば含める
-- 必ず有効なJSONで返答すること"""
 
-    response = client.chat.completions.create(
-        model=LLM_MODEL,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-        response_format={"type": "json_object"},
-    )
+async def merge_chunk_summaries(
+    client: openai.AsyncOpenAI,
+    limiter: RateLimiter,
+    bill_title: str,
+    chunk_summaries: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Merge multiple chunk summaries into a final summary."""
+    messages = build_merge_messages(bill_title, chunk_summaries)
 
-    return json.loads(response.choices[0].message.content)
+    return await complete_json(client, limiter, messages, SUMMARY_RESPONSE_FORMAT)
 
 
-def summarize_debates(
-    client: openai.OpenAI,
+async def summarize_debates(
+    client: openai.AsyncOpenAI,
+    limiter: RateLimiter,
     bill_title: str,
-    debates: List[Dict[str, Any]],
+    formatted_speeches: List[str],
     prefix: str = "",
 ) -> Dict[str, Any]:
     """Use LLM to summarize debate records with hierarchical processing."""
 
-    # Format all speeches
-    formatted_speeches = [format_speech(d) for d in debates]
-
-    # Calculate total context size
-    total_chars = sum(len(s) for s in formatted_speeches)
-    print(f"{prefix}   Total: {total_chars:,} chars ({len(debates)} speeches)")
+    # Split into chunks, counting tokens in the same pass; tokenizing is CPU
+    # work, so it runs off the event loop
+    chunked = await asyncio.to_thread(list, iter_chunks(formatted_speeches))
+    chunks = [chunk for chunk, _ in chunked]
+    chunk_tokens = [tokens for _, tokens in chunked]
+    print(
+        f"{prefix}   Total: {sum(chunk_tokens):,} tokens"
+        f" ({len(formatted_speeches)} speeches)"
+    )
 
     # If fits in single context, process directly
-    if total_chars <= MAX_CONTEXT_CHARS:
-        debates_context = "\n".join(formatted_speeches)
-        return summarize_single(client, bill_title, debates_context)
+    if len(chunks) == 1:
+        debates_context = "\n".join(chunks[0])
+        return await summarize_single(client, limiter, bill_title, debates_context)
 
     # Hierarchical summarization for large debates
     print(f"{prefix}   Using hierarchical summarization")
-
-    # Split into chunks
-    chunks = []
-    current_chunk = []
-    current_size = 0
-
-    for speech in formatted_speeches:
-        if current_size + len(speech) > MAX_CONTEXT_CHARS and current_chunk:
-            chunks.append(current_chunk)
-            current_chunk = []
-            current_size = 0
-        current_chunk.append(speech)
-        current_size += len(speech)
-
-    if current_chunk:
-        chunks.append(current_chunk)
-
     print(f"{prefix}   Split into {len(chunks)} chunks")
 
-    # Summarize each chunk
-    chunk_summaries = []
-    for i, chunk in enumerate(chunks):
-        print(f"{prefix}   Processing chunk {i + 1}/{len(chunks)}...")
-        summary = summarize_chunk(client, bill_title, chunk, i + 1)
-        chunk_summaries.append(summary)
-        time.sleep(DELAY_BETWEEN_REQUESTS)
+    # Chunks are independent, so summarize them concurrently, packing several
+    # per request; the rate limiter keeps the combined rate within quota
+    print(f"{prefix}   Processing {len(chunks)} chunks concurrently...")
+    chunk_summaries = await summarize_chunks_packed(
+        client, limiter, bill_title, chunks, chunk_tokens
+    )
 
     # Merge chunk summaries
     print(f"{prefix}   Merging chunk summaries...")
-    return merge_chunk_summaries(client, bill_title, chunk_summaries)
-
+    return await merge_chunk_summaries(client, limiter, bill_title, chunk_summaries)
 
-def build_single_summary_prompt(bill_title: str, debates_context: str) -> str:
-    """Build the prompt for single-context debate summarization."""
-    return f"""あなたは国会議事録の分析専門家です。以下の法案に関する国会での議論を分析し、構造化された要約を作成してください。
 
-法案名: {bill_title}
+def build_single_summary_messages(
+    bill_title: str, debates_context: str
+) -> List[Dict[str, str]]:
+    """Chat messages for single-context debate summarization."""
+    return [
+        {"role": "system", "content": SINGLE_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": f"""法案名: {bill_title}
 
 ===== 議事録 =====
-{debates_context}
+{debates_context}""",
+        },
+    ]
 
-===== 分析指示 =====
-以下のJSON形式で、議論の要点を整理してください：
 
-{{
-  "proArguments": [
-    "賛成派の論点1（どの立場からのメリットか明示）",
-    "賛成派の論点2",
-    "賛成派の論点3"
-  ],
-  "conArguments": [
-    "反対派の論点1（どの立場からの懸念か明示）",
-    "反対派の論点2",
-    "反対派の論点3"
-  ],
-  "keyQuestions": [
-    "議員から出された重要な質問1",
-    "議員から出された重要な質問2"
-  ],
-  "governmentExplanations": [
-    "政府・担当大臣からの主な説明1",
-    "政府・担当大臣からの主な説明2"
-  ],
-  "summary": "この法案の議論で最も注目すべき点を100文字程度で要約"
-}}
-
-注意事項：
-- 各カテゴリは2〜5項目を目安にする
-- 具体的な数字や事例があれば含める
-- 「〇〇の観点からは」のように、どの立場からの意見かを明示する
-- 質問が見つからない場合は空配列でよい
-- 必ず有効なJSONで返答すること"""
-
-
-def summarize_single(
-    client: openai.OpenAI, bill_title: str, debates_context: str
+async def summarize_single(
+    client: openai.AsyncOpenAI,
+    limiter: RateLimiter,
+    bill_title: str,
+    debates_context: str,
 ) -> Dict[str, Any]:
     """Summarize debates that fit in a single context."""
-    prompt = build_single_summary_prompt(bill_title, debates_context)
+    messages = build_single_summary_messages(bill_title, debates_context)
+
+    return await complete_json(client, limiter, messages, SUMMARY_RESPONSE_FORMAT)
+
+
+UPSERT_SUMMARIES_QUERY = """
+INSERT INTO bill_debate_summary (
+    bill_id,
+    pro_arguments_summary,
+    con_arguments_summary,
+    key_questions,
+    government_explanations,
+    debate_count,
+    status,
+    llm_model,
+    input_hash,
+    error_message,
+    created_at,
+    updated_at
+) VALUES %s
+ON CONFLICT (bill_id) DO UPDATE SET
+    pro_arguments_summary = EXCLUDED.pro_arguments_summary,
+    con_arguments_summary = EXCLUDED.con_arguments_summary,
+    key_questions = EXCLUDED.key_questions,
+    government_explanations = EXCLUDED.government_explanations,
+    debate_count = EXCLUDED.debate_count,
+    status = EXCLUDED.status,
+    llm_model = EXCLUDED.llm_model,
+    input_hash = EXCLUDED.input_hash,
+    error_message = EXCLUDED.error_message,
+    updated_at = NOW()
+"""
+UPSERT_SUMMARIES_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())"
+
+UPSERT_STATUSES_QUERY = """
+INSERT INTO bill_debate_summary
+    (bill_id, debate_count, status,
+     error_message, created_at, updated_at)
+VALUES %s
+ON CONFLICT (bill_id) DO UPDATE SET
+    debate_count = EXCLUDED.debate_count,
+    status = EXCLUDED.status,
+    error_message = EXCLUDED.error_message,
+    updated_at = NOW()
+"""
+UPSERT_STATUSES_TEMPLATE = "(%s, %s, %s, %s, NOW(), NOW())"
 
-    response = client.chat.completions.create(
-        model=LLM_MODEL,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-        response_format={"type": "json_object"},
+WRITE_BATCH_SIZE = 100  # Rows buffered before the writer flushes
+WRITE_FLUSH_INTERVAL = 2.0  # Max seconds a row waits in the writer buffer
+
+
+def summary_row(
+    bill_id: int,
+    debate_count: int,
+    status: str,
+    result: Dict[str, Any],
+    error: Optional[str] = None,
+    input_hash: Optional[str] = None,
+    model: str = LLM_MODEL,
+) -> tuple:
+    """Build an UPSERT_SUMMARIES_QUERY row from a generated result."""
+    return (
+        bill_id,
+        json_dumps(result["proArguments"]),
+        json_dumps(result["conArguments"]),
+        json_dumps(result["keyQuestions"]),
+        json_dumps(result["governmentExplanations"]),
+        debate_count,
+        status,
+        model,
+        input_hash,
+        error,
     )
 
-    return json.loads(response.choices[0].message.content)
+
+def flush_summaries(
+    conn,
+    rows: List[tuple],
+    status_rows: Optional[List[tuple]] = None,
+):
+    """Upsert buffered rows in one transaction.
+
+    `rows` are full summaries built by summary_row; `status_rows` are
+    (bill_id, debate_count, status, error) tuples that leave existing
+    content untouched.
+    """
+    if not rows and not status_rows:
+        return
+
+    cursor = conn.cursor()
+    if rows:
+        execute_values(
+            cursor,
+            UPSERT_SUMMARIES_QUERY,
+            rows,
+            template=UPSERT_SUMMARIES_TEMPLATE,
+            page_size=WRITE_BATCH_SIZE,
+        )
+    if status_rows:
+        execute_values(
+            cursor,
+            UPSERT_STATUSES_QUERY,
+            status_rows,
+            template=UPSERT_STATUSES_TEMPLATE,
+            page_size=WRITE_BATCH_SIZE,
+        )
+    conn.commit()
+    cursor.close()
 
 
 def upsert_debate_summary(
@@ -391,112 +944,243 @@ def upsert_debate_summary(
     status: str,
     result: Optional[Dict] = None,
     error: Optional[str] = None,
+    input_hash: Optional[str] = None,
+    model: str = LLM_MODEL,
 ):
     """Insert or update debate summary record."""
-    cursor = conn.cursor()
-
     if result:
-        query = """
-        INSERT INTO bill_debate_summary (
+        flush_summaries(
+            conn,
+            [
+                summary_row(
+                    bill_id, debate_count, status, result, error, input_hash, model
+                )
+            ],
+        )
+    else:
+        flush_summaries(conn, [], [(bill_id, debate_count, status, error)])
+
+
+class SummaryWriter:
+    """Background thread that batches debate summary upserts.
+
+    Bill tasks hand results to put_result/put_status; a single writer thread
+    holds one pooled DB connection and flushes every WRITE_BATCH_SIZE rows or
+    WRITE_FLUSH_INTERVAL seconds, whichever comes first. A batch that fails
+    to write is retried row by row; summaries that still cannot be written
+    are marked 'failed' where possible and counted in failed_writes.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        pool: ThreadedConnectionPool,
+        batch_size: int = WRITE_BATCH_SIZE,
+        flush_interval: float = WRITE_FLUSH_INTERVAL,
+    ):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: queue.Queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.failed_writes = 0
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def put_result(
+        self,
+        bill_id: int,
+        debate_count: int,
+        result: Dict[str, Any],
+        input_hash: Optional[str] = None,
+        model: str = LLM_MODEL,
+    ):
+        row = summary_row(
             bill_id,
-            pro_arguments_summary,
-            con_arguments_summary,
-            key_questions,
-            government_explanations,
             debate_count,
-            status,
-            llm_model,
-            error_message,
-            created_at,
-            updated_at
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW()
+            "completed",
+            result,
+            input_hash=input_hash,
+            model=model,
         )
-        ON CONFLICT (bill_id) DO UPDATE SET
-            pro_arguments_summary = EXCLUDED.pro_arguments_summary,
-            con_arguments_summary = EXCLUDED.con_arguments_summary,
-            key_questions = EXCLUDED.key_questions,
-            government_explanations = EXCLUDED.government_explanations,
-            debate_count = EXCLUDED.debate_count,
-            status = EXCLUDED.status,
-            llm_model = EXCLUDED.llm_model,
-            error_message = EXCLUDED.error_message,
-            updated_at = NOW()
-        """
-        cursor.execute(
-            query,
-            (
-                bill_id,
-                json.dumps(result.get("proArguments", []), ensure_ascii=False),
-                json.dumps(result.get("conArguments", []), ensure_ascii=False),
-                json.dumps(result.get("keyQuestions", []), ensure_ascii=False),
-                json.dumps(
-                    result.get("governmentExplanations", []),
-                    ensure_ascii=False,
-                ),
-                debate_count,
-                status,
-                LLM_MODEL,
-                error,
-            ),
-        )
-    else:
-        query = """
-        INSERT INTO bill_debate_summary
-            (bill_id, debate_count, status,
-             error_message, created_at, updated_at)
-        VALUES (%s, %s, %s, %s, NOW(), NOW())
-        ON CONFLICT (bill_id) DO UPDATE SET
-            debate_count = EXCLUDED.debate_count,
-            status = EXCLUDED.status,
-            error_message = EXCLUDED.error_message,
-            updated_at = NOW()
-        """
-        cursor.execute(query, (bill_id, debate_count, status, error))
+        self.queue.put(("result", row))
+
+    def put_status(
+        self,
+        bill_id: int,
+        debate_count: int,
+        status: str,
+        error: Optional[str] = None,
+    ):
+        self.queue.put(("status", (bill_id, debate_count, status, error)))
+
+    def close(self):
+        """Flush remaining rows and stop the writer thread."""
+        self.queue.put(self._STOP)
+        self.thread.join()
+
+    def _flush(self, conn, rows: List[tuple], status_rows: List[tuple]):
+        try:
+            flush_summaries(conn, rows, status_rows)
+            return
+        except Exception as e:
+            conn.rollback()
+            print(
+                f"Failed to write {len(rows) + len(status_rows)} debate summaries,"
+                f" retrying one by one: {e}"
+            )
 
-    conn.commit()
-    cursor.close()
+        for row in status_rows:
+            try:
+                flush_summaries(conn, [], [row])
+            except Exception as e:
+                conn.rollback()
+                print(f"Failed to write status for bill {row[0]}: {e}")
+
+        for row in rows:
+            try:
+                flush_summaries(conn, [row])
+            except Exception as e:
+                conn.rollback()
+                print(f"Failed to write debate summary for bill {row[0]}: {e}")
+                self.failed_writes += 1
+                bill_id, debate_count = row[0], row[5]
+                try:
+                    flush_summaries(
+                        conn, [], [(bill_id, debate_count, "failed", str(e))]
+                    )
+                except Exception:
+                    # Left 'processing'; not completed, so selected again
+                    conn.rollback()
+
+    def _run(self):
+        conn = self.pool.getconn()
+        rows: List[tuple] = []
+        status_rows: List[tuple] = []
+        deadline = time.monotonic() + self.flush_interval
+        stopping = False
+
+        try:
+            while not stopping:
+                timeout = max(deadline - time.monotonic(), 0)
+                try:
+                    item = self.queue.get(timeout=timeout)
+                    if item is self._STOP:
+                        stopping = True
+                    else:
+                        kind, row = item
+                        (rows if kind == "result" else status_rows).append(row)
+                except queue.Empty:
+                    pass
+
+                full = len(rows) + len(status_rows) >= self.batch_size
+                if stopping or full or time.monotonic() >= deadline:
+                    self._flush(conn, rows, status_rows)
+                    rows, status_rows = [], []
+                    deadline = time.monotonic() + self.flush_interval
+        finally:
+            self.pool.putconn(conn)
+
+
+def batch_request_line(
+    custom_id: str,
+    messages: List[Dict[str, str]],
+    response_format: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build one Batch API JSONL line for a structured output completion."""
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": LLM_MODEL,
+            "messages": messages,
+            "temperature": 0.3,
+            "response_format": response_format,
+        },
+    }
 
 
 def prepare_batch_requests(
     conn,
-    bills: List[Dict[str, Any]],
-) -> tuple[List[Dict[str, Any]], List[int]]:
-    """Prepare batch API requests for bills that fit single context.
-    Returns (requests, skipped_bill_ids)."""
+    bills: List[Bill],
+) -> List[Dict[str, Any]]:
+    """Prepare batch API requests for all bills.
+
+    Bills whose input matches an existing completed summary reuse it without
+    a request. Bills that fit a single context get one request (custom_id
+    `debate-{bill_id}`). Larger bills get one request per chunk (custom_id
+    `debate-{bill_id}:{chunk_num}/{total_chunks}`); their chunk summaries are
+    merged online when the results are retrieved.
+    """
     requests = []
-    skipped_ids = []
 
     for bill in bills:
-        debates = get_debates_for_bill(conn, bill["id"])
-        if not debates:
+        formatted_speeches, input_hash, cached = load_bill_input(conn, bill)
+        if not formatted_speeches:
+            continue
+
+        if is_trivial_debate(formatted_speeches):
+            upsert_debate_summary(
+                conn,
+                bill.id,
+                bill.debate_count,
+                "completed",
+                EMPTY_SUMMARY,
+                input_hash=input_hash,
+                model=SKIPPED_MODEL,
+            )
+            print(f"  Bill {bill.id}: skipped trivially small debate")
+            continue
+
+        if cached:
+            upsert_debate_summary(
+                conn,
+                bill.id,
+                bill.debate_count,
+                "completed",
+                cached,
+                input_hash=input_hash,
+            )
+            print(f"  Bill {bill.id}: reused cached summary")
             continue
 
-        formatted_speeches = [format_speech(d) for d in debates]
-        total_chars = sum(len(s) for s in formatted_speeches)
+        chunks = [chunk for chunk, _ in iter_chunks(formatted_speeches)]
 
-        # Batch mode only supports single-context bills
-        if total_chars > MAX_CONTEXT_CHARS:
-            skipped_ids.append(bill["id"])
+        if len(chunks) == 1:
+            debates_context = "\n".join(chunks[0])
+            messages = build_single_summary_messages(bill.title, debates_context)
+            requests.append(
+                batch_request_line(
+                    f"debate-{bill.id}", messages, SUMMARY_RESPONSE_FORMAT
+                )
+            )
             continue
 
-        debates_context = "\n".join(formatted_speeches)
-        prompt = build_single_summary_prompt(bill["title"], debates_context)
-
-        request_line = {
-            "custom_id": f"debate-{bill['id']}",
-            "method": "POST",
-            "url": "/v1/chat/completions",
-            "body": {
-                "model": LLM_MODEL,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-                "response_format": {"type": "json_object"},
-            },
-        }
-        requests.append(request_line)
+        for i, chunk in enumerate(chunks):
+            messages = build_chunk_messages(bill.title, chunk, i + 1)
+            custom_id = f"debate-{bill.id}:{i + 1}/{len(chunks)}"
+            requests.append(
+                batch_request_line(custom_id, messages, CHUNK_RESPONSE_FORMAT)
+            )
+
+    return requests
 
-    return requests, skipped_ids
+
+def parse_custom_id(custom_id: str) -> tuple[int, Optional[int], Optional[int]]:
+    """Split a custom_id into (bill_id, chunk_num, total_chunks).
+
+    chunk_num and total_chunks are None for single-context requests.
+    """
+    key = custom_id.replace("debate-", "")
+    if ":" not in key:
+        return int(key), None, None
+    bill_id, chunk = key.split(":", 1)
+    chunk_num, total_chunks = chunk.split("/", 1)
+    return int(bill_id), int(chunk_num), int(total_chunks)
 
 
 def submit_batch(
@@ -506,7 +1190,7 @@ def submit_batch(
     """Write JSONL, upload, and submit a batch job. Returns batch ID."""
     with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
         for req in requests:
-            f.write(json.dumps(req, ensure_ascii=False) + "\n")
+            f.write(json_dumps(req) + "\n")
         jsonl_path = f.name
 
     print(f"Wrote {len(requests)} requests to {jsonl_path}")
@@ -541,10 +1225,123 @@ def check_batch_status(client: openai.OpenAI, batch_id: str):
     return batch
 
 
+def wait_for_batch(
+    client: openai.OpenAI,
+    batch_id: str,
+    poll_interval: int = BATCH_POLL_INTERVAL,
+):
+    """Poll a batch job until it reaches a terminal status."""
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        if counts:
+            print(
+                f"  Status: {batch.status}"
+                f" ({counts.completed}/{counts.total} done,"
+                f" {counts.failed} failed)"
+            )
+        else:
+            print(f"  Status: {batch.status}")
+        if batch.status in BATCH_TERMINAL_STATUSES:
+            return batch
+        time.sleep(poll_interval)
+
+
+def get_bills_by_id(conn, bill_ids: List[int]) -> Dict[int, Bill]:
+    """Look up titles and debate counts for the given bill IDs.
+
+    Bills that no longer exist map to an empty title and no debates.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT b.id, b.title, COUNT(db.id) as debate_count
+        FROM bill b
+        LEFT JOIN bill_debates db ON b.id = db.bill_id
+        WHERE b.id = ANY(%s)
+        GROUP BY b.id, b.title
+        """,
+        (bill_ids,),
+    )
+    bills = {bill_id: Bill(bill_id, "", 0) for bill_id in bill_ids}
+    bills.update((row[0], Bill(*row)) for row in cursor.fetchall())
+    cursor.close()
+    return bills
+
+
+def save_batch_summary(conn, bill: Bill, result: Dict[str, Any]):
+    """Save a summary from a batch job along with its input hash."""
+    speeches = get_bill_speeches(conn, bill.id)
+    upsert_debate_summary(
+        conn,
+        bill.id,
+        bill.debate_count,
+        "completed",
+        result,
+        input_hash=debate_input_hash(bill.title or "", speeches),
+    )
+
+
+def merge_batch_chunks(
+    client: openai.OpenAI,
+    conn,
+    chunk_results: Dict[int, Dict[int, Dict[str, Any]]],
+    bills: Dict[int, Bill],
+    rpm: int = DEFAULT_RPM,
+    tpm: int = DEFAULT_TPM,
+) -> tuple[int, int]:
+    """Merge chunk summaries returned by a batch job online and save them.
+
+    Returns (success_count, error_count).
+    """
+
+    async def merge_all() -> List[Any]:
+        limiter = RateLimiter(rpm, tpm)
+        async with create_async_client(
+            client.api_key, BATCH_MERGE_CONNECTIONS
+        ) as async_client:
+            return await asyncio.gather(
+                *(
+                    merge_chunk_summaries(
+                        async_client,
+                        limiter,
+                        bills[bill_id].title or "",
+                        [chunks[num] for num in sorted(chunks)],
+                    )
+                    for bill_id, chunks in chunk_results.items()
+                ),
+                return_exceptions=True,
+            )
+
+    merged = asyncio.run(merge_all())
+
+    success_count = 0
+    error_count = 0
+    for bill_id, result in zip(chunk_results, merged):
+        if isinstance(result, Exception):
+            print(f"  Bill {bill_id}: Merge error - {result}")
+            upsert_debate_summary(conn, bill_id, 0, "failed", error=str(result))
+            error_count += 1
+            continue
+
+        save_batch_summary(conn, bills[bill_id], result)
+        success_count += 1
+        pro_count = len(result["proArguments"])
+        con_count = len(result["conArguments"])
+        print(
+            f"  Bill {bill_id}: ✓ {pro_count} pro, {con_count} con"
+            f" (merged {len(chunk_results[bill_id])} chunks)"
+        )
+
+    return success_count, error_count
+
+
 def retrieve_batch_results(
     client: openai.OpenAI,
     conn,
     batch_id: str,
+    rpm: int = DEFAULT_RPM,
+    tpm: int = DEFAULT_TPM,
 ):
     """Retrieve batch results and save to database."""
     batch = client.batches.retrieve(batch_id)
@@ -565,65 +1362,232 @@ def retrieve_batch_results(
     content = client.files.content(batch.output_file_id)
     results_text = content.text
 
+    result_objs = [
+        json_loads(line) for line in results_text.strip().split("\n") if line
+    ]
+    save_batch_output(client, conn, result_objs, rpm, tpm)
+
+
+def save_batch_output(
+    client: openai.OpenAI,
+    conn,
+    result_objs: List[Dict[str, Any]],
+    rpm: int = DEFAULT_RPM,
+    tpm: int = DEFAULT_TPM,
+):
+    """Save Batch API output lines to the database.
+
+    Chunk results are grouped per bill and merged online once every chunk of
+    the bill succeeded; a bill with any failed chunk is marked failed.
+    """
     success_count = 0
     error_count = 0
+    chunk_results: Dict[int, Dict[int, Dict[str, Any]]] = {}
+    chunk_totals: Dict[int, int] = {}
+    failed_bills = set()
 
-    for line in results_text.strip().split("\n"):
-        if not line:
-            continue
-        result_obj = json.loads(line)
-        custom_id = result_obj["custom_id"]
-        bill_id = int(custom_id.replace("debate-", ""))
+    bills = get_bills_by_id(
+        conn, sorted({parse_custom_id(r["custom_id"])[0] for r in result_objs})
+    )
+
+    for result_obj in result_objs:
+        bill_id, chunk_num, total_chunks = parse_custom_id(result_obj["custom_id"])
 
         response = result_obj.get("response")
         error = result_obj.get("error")
 
-        if error:
-            print(f"  Bill {bill_id}: Error - {error}")
-            upsert_debate_summary(
-                conn,
-                bill_id,
-                0,
-                "failed",
-                error=json.dumps(error, ensure_ascii=False),
-            )
-            error_count += 1
+        if error or not (response and response.get("status_code") == 200):
+            if error:
+                print(f"  Bill {bill_id}: Error - {error}")
+                message = json_dumps(error)
+            else:
+                status_code = response.get("status_code") if response else "N/A"
+                message = f"HTTP {status_code}"
+            if chunk_num is not None:
+                message = f"Chunk {chunk_num}/{total_chunks}: {message}"
+            if bill_id not in failed_bills:
+                failed_bills.add(bill_id)
+                upsert_debate_summary(conn, bill_id, 0, "failed", error=message)
+                error_count += 1
             continue
 
-        if response and response.get("status_code") == 200:
-            body = response["body"]
-            content_str = body["choices"][0]["message"]["content"]
-            result = json.loads(content_str)
+        body = response["body"]
+        content_str = body["choices"][0]["message"]["content"]
+        result = json_loads(content_str)
 
-            # Get debate count for this bill
-            debates = get_debates_for_bill(conn, bill_id)
-            debate_count = len(debates)
+        if chunk_num is not None:
+            chunk_results.setdefault(bill_id, {})[chunk_num] = result
+            chunk_totals[bill_id] = total_chunks
+            continue
 
-            upsert_debate_summary(
-                conn,
-                bill_id,
-                debate_count,
-                "completed",
-                result,
+        save_batch_summary(conn, bills[bill_id], result)
+        success_count += 1
+        pro_count = len(result["proArguments"])
+        con_count = len(result["conArguments"])
+        print(f"  Bill {bill_id}: ✓" f" {pro_count} pro, {con_count} con")
+
+    # Only merge bills whose chunks all came back
+    mergeable = {}
+    for bill_id, chunks in chunk_results.items():
+        if bill_id in failed_bills:
+            continue
+        if len(chunks) != chunk_totals[bill_id]:
+            print(
+                f"  Bill {bill_id}: Missing chunks"
+                f" ({len(chunks)}/{chunk_totals[bill_id]} returned)"
             )
-            success_count += 1
-            pro_count = len(result.get("proArguments", []))
-            con_count = len(result.get("conArguments", []))
-            print(f"  Bill {bill_id}: ✓" f" {pro_count} pro, {con_count} con")
-        else:
-            status_code = response.get("status_code") if response else "N/A"
             upsert_debate_summary(
                 conn,
                 bill_id,
                 0,
                 "failed",
-                error=f"HTTP {status_code}",
+                error=f"Missing chunks: {len(chunks)}/{chunk_totals[bill_id]}",
             )
             error_count += 1
+            continue
+        mergeable[bill_id] = chunks
+
+    if mergeable:
+        print(f"\nMerging chunk summaries for {len(mergeable)} bills...")
+        merged_success, merged_errors = merge_batch_chunks(
+            client, conn, mergeable, bills, rpm, tpm
+        )
+        success_count += merged_success
+        error_count += merged_errors
 
     print(f"\nResults: {success_count} success, {error_count} errors")
 
 
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the objects of a JSONL file one line at a time."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield json_loads(line)
+
+
+def is_successful_result(result_obj: Dict[str, Any]) -> bool:
+    """True for a Batch API output line holding a completed response."""
+    response = result_obj.get("response")
+    return bool(response and response.get("status_code") == 200)
+
+
+async def process_requests_from_file(
+    client: openai.AsyncOpenAI,
+    limiter: RateLimiter,
+    requests_path: str,
+    results_path: str,
+    max_in_flight: int = BACKFILL_MAX_IN_FLIGHT,
+) -> Tuple[int, int]:
+    """Run Batch API request lines online, appending Batch API output lines.
+
+    Requests are streamed from `requests_path` and paced by the limiter, and
+    each response is appended to `results_path` as soon as it arrives.
+    Requests that already have a successful line there are skipped, so an
+    interrupted backfill resumes where it stopped.
+
+    Returns (success_count, error_count).
+    """
+    done = set()
+    if os.path.exists(results_path):
+        done = {
+            r["custom_id"] for r in read_jsonl(results_path) if is_successful_result(r)
+        }
+        if done:
+            print(f"Skipping {len(done)} requests already completed")
+
+    counts = {"success": 0, "error": 0}
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    with open(results_path, "a", encoding="utf-8") as out:
+
+        async def process_request(request: Dict[str, Any]):
+            custom_id = request["custom_id"]
+            try:
+                await limiter.wait(request["body"]["messages"])
+                response = await client.chat.completions.create(**request["body"])
+                line = {
+                    "custom_id": custom_id,
+                    "response": {"status_code": 200, "body": response.model_dump()},
+                }
+                counts["success"] += 1
+            except Exception as e:
+                print(f"  {custom_id}: Error - {e}")
+                line = {"custom_id": custom_id, "error": {"message": str(e)}}
+                counts["error"] += 1
+            finally:
+                semaphore.release()
+
+            out.write(json_dumps(line) + "\n")
+            out.flush()
+
+        tasks = []
+        for request in read_jsonl(requests_path):
+            if request["custom_id"] in done:
+                continue
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(process_request(request)))
+        await asyncio.gather(*tasks)
+
+    return counts["success"], counts["error"]
+
+
+def run_backfill(
+    client: openai.OpenAI,
+    conn,
+    bills: List[Bill],
+    backfill_dir: str,
+    rpm: int = DEFAULT_RPM,
+    tpm: int = DEFAULT_TPM,
+):
+    """Summarize bills through a resumable on-disk request/result pipeline.
+
+    Requests are written once to `requests.jsonl` in the Batch API format and
+    run online into `results.jsonl`; re-running with the same directory only
+    sends the requests that have not succeeded yet. The results are then
+    saved exactly like a batch job's output, merging chunked bills in a
+    second, smaller pass.
+    """
+    requests_path = os.path.join(backfill_dir, "requests.jsonl")
+    results_path = os.path.join(backfill_dir, "results.jsonl")
+
+    if os.path.exists(requests_path):
+        print(f"Resuming backfill from {requests_path}")
+    else:
+        os.makedirs(backfill_dir, exist_ok=True)
+        print("Preparing backfill requests...")
+        requests = prepare_batch_requests(conn, bills)
+        with open(requests_path + ".tmp", "w", encoding="utf-8") as f:
+            for req in requests:
+                f.write(json_dumps(req) + "\n")
+        # Only a complete requests file is ever picked up for resuming
+        os.replace(requests_path + ".tmp", requests_path)
+        print(f"Wrote {len(requests)} requests to {requests_path}")
+
+    async def process_all() -> Tuple[int, int]:
+        limiter = RateLimiter(rpm, tpm)
+        async with create_async_client(
+            client.api_key, BACKFILL_MAX_IN_FLIGHT
+        ) as async_client:
+            return await process_requests_from_file(
+                async_client, limiter, requests_path, results_path
+            )
+
+    sent_success, sent_errors = asyncio.run(process_all())
+    print(f"Requests: {sent_success} succeeded, {sent_errors} failed")
+
+    # Keep one line per request, preferring a success over earlier failures
+    result_objs: Dict[str, Dict[str, Any]] = {}
+    if os.path.exists(results_path):
+        for result_obj in read_jsonl(results_path):
+            previous = result_objs.get(result_obj["custom_id"])
+            if previous is None or not is_successful_result(previous):
+                result_objs[result_obj["custom_id"]] = result_obj
+
+    print("\nSaving backfill results...")
+    save_batch_output(client, conn, list(result_objs.values()), rpm, tpm)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Summarize debate records using LLM")
     parser.add_argument(
@@ -642,13 +1606,43 @@ def main():
         "--concurrency",
         type=int,
         default=3,
-        help="Number of parallel workers (default: 3)",
+        help="Number of bills summarized concurrently (default: 3)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=DEFAULT_RPM,
+        help=f"OpenAI requests per minute limit (default: {DEFAULT_RPM})",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=DEFAULT_TPM,
+        help=f"OpenAI input tokens per minute limit (default: {DEFAULT_TPM:,})",
     )
     parser.add_argument(
         "--batch",
         action="store_true",
         help="Submit as OpenAI Batch API job" " (50%% cheaper, results within 24h)",
     )
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="With --batch, poll until the job finishes" " and save its results",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=int,
+        default=BATCH_POLL_INTERVAL,
+        help="Seconds between batch status checks" f" (default: {BATCH_POLL_INTERVAL})",
+    )
+    parser.add_argument(
+        "--backfill",
+        type=str,
+        metavar="DIR",
+        help="Run requests online through resumable JSONL files in DIR"
+        " (re-run with the same DIR to resume)",
+    )
     parser.add_argument(
         "--batch-status",
         type=str,
@@ -687,7 +1681,7 @@ def main():
     # Handle batch results retrieval
     if args.batch_results:
         print("Retrieving batch results...")
-        retrieve_batch_results(client, conn, args.batch_results)
+        retrieve_batch_results(client, conn, args.batch_results, args.rpm, args.tpm)
         conn.close()
         return
 
@@ -696,8 +1690,14 @@ def main():
     print("=" * 60)
     print(f"Limit: {args.limit or 'all'}")
     print(f"Force: {args.force}")
-    print(f"Mode: {'batch' if args.batch else 'synchronous'}")
-    if not args.batch:
+    if args.batch:
+        mode = "batch"
+    elif args.backfill:
+        mode = "backfill"
+    else:
+        mode = "synchronous"
+    print(f"Mode: {mode}")
+    if not (args.batch or args.backfill):
         print(f"Concurrency: {args.concurrency}")
     if args.bill_id:
         print(f"Bill ID: {args.bill_id}")
@@ -709,14 +1709,7 @@ def main():
     # Batch mode: prepare and submit
     if args.batch:
         print("Preparing batch requests...")
-        requests, skipped = prepare_batch_requests(conn, bills)
-        if skipped:
-            print(
-                f"Skipped {len(skipped)} bills requiring"
-                " hierarchical summarization"
-                " (too large for single context)"
-            )
-            print("Run these without --batch:" f" --bill-id for IDs: {skipped}")
+        requests = prepare_batch_requests(conn, bills)
         print(f"Prepared {len(requests)} requests")
         if not requests:
             print("No requests to submit.")
@@ -724,107 +1717,145 @@ def main():
             return
         batch_id = submit_batch(client, requests)
         print(f"\nBatch submitted! ID: {batch_id}")
+        if args.wait:
+            print("Waiting for batch to finish...")
+            wait_for_batch(client, batch_id, args.poll_interval)
+            retrieve_batch_results(client, conn, batch_id, args.rpm, args.tpm)
+            conn.close()
+            return
         print(f"Check status:  pnpm summarize:debates" f" --batch-status {batch_id}")
         print(f"Get results:   pnpm summarize:debates" f" --batch-results {batch_id}")
         conn.close()
         return
 
-    # Thread-safe counter
-    lock = threading.Lock()
-    results = {"success": 0, "error": 0}
-
-    def process_bill(bill_index: int, bill: Dict[str, Any]) -> bool:
-        """Process a single bill - runs in a thread."""
-        # Each thread needs its own DB connection and OpenAI client
-        thread_conn = psycopg2.connect(database_url)
-        thread_client = openai.OpenAI(api_key=openai_api_key)
+    # Backfill mode: run the batch requests online from disk
+    if args.backfill:
+        run_backfill(client, conn, bills, args.backfill, args.rpm, args.tpm)
+        conn.close()
+        return
 
+    results = {"success": 0, "error": 0}
+    concurrency = max(args.concurrency, 1)
+
+    # At most `concurrency` bills load their debates at once, plus one
+    # connection for the writer thread that batches the summary upserts
+    pool = ThreadedConnectionPool(minconn=1, maxconn=concurrency + 1, dsn=database_url)
+    writer = SummaryWriter(pool).start()
+
+    async def process_bill(
+        client: openai.AsyncOpenAI,
+        limiter: RateLimiter,
+        semaphore: asyncio.Semaphore,
+        bill_index: int,
+        bill: Bill,
+    ) -> bool:
+        """Process a single bill, holding one of the concurrency slots."""
         bill_num = bill_index + 1
         prefix = f"[Bill {bill_num}/{len(bills)}]"
 
-        try:
-            print(f"{prefix} {bill['title']}")
-            print(f"{prefix}   Debate count: {bill['debate_count']}")
-
-            # Mark as processing
-            upsert_debate_summary(
-                thread_conn, bill["id"], bill["debate_count"], "processing"
-            )
-
-            # Get all debates
-            debates = get_debates_for_bill(thread_conn, bill["id"])
-            print(f"{prefix}   Loaded {len(debates)} speeches")
-
-            # Summarize using LLM
-            result = summarize_debates(
-                thread_client,
-                bill["title"],
-                debates,
-                prefix,
-            )
-
-            # Save to database
-            upsert_debate_summary(
-                thread_conn,
-                bill["id"],
-                bill["debate_count"],
-                "completed",
-                result,
-            )
-
-            print(f"{prefix}   ✓ Summary completed")
-            print(
-                f"{prefix}     Pro:" f" {len(result.get('proArguments', []))}" " points"
-            )
-            print(
-                f"{prefix}     Con:" f" {len(result.get('conArguments', []))}" " points"
-            )
+        async with semaphore:
+            try:
+                print(f"{prefix} {bill.title}")
+                print(f"{prefix}   Debate count: {bill.debate_count}")
+
+                # psycopg2 is blocking, so DB work runs in the default
+                # executor; the connection goes back to the pool before any
+                # LLM call so it is never held idle for minutes
+                bill_conn = await asyncio.to_thread(pool.getconn)
+                try:
+                    # Marked as its task starts, so the other bills keep
+                    # their completed summary until their own turn
+                    await asyncio.to_thread(
+                        upsert_debate_summary,
+                        bill_conn,
+                        bill.id,
+                        bill.debate_count,
+                        "processing",
+                    )
+                    speeches, input_hash, cached = await asyncio.to_thread(
+                        load_bill_input, bill_conn, bill
+                    )
+                finally:
+                    pool.putconn(bill_conn)
+                print(f"{prefix}   Loaded {len(speeches)} speeches")
+                dropped = bill.debate_count - len(speeches)
+                if dropped > 0:
+                    print(f"{prefix}   Dropped {dropped} procedural speeches")
+
+                model = LLM_MODEL
+                if is_trivial_debate(speeches):
+                    # Too little debate to be worth an LLM call
+                    print(f"{prefix}   Skipping LLM: trivially small debate")
+                    result = EMPTY_SUMMARY
+                    model = SKIPPED_MODEL
+                elif cached:
+                    # Identical input (same model, prompts and speeches) reuses
+                    # an existing completed summary instead of calling the LLM
+                    print(f"{prefix}   Reusing cached summary")
+                    result = cached
+                else:
+                    # Summarize using LLM
+                    result = await summarize_debates(
+                        client,
+                        limiter,
+                        bill.title,
+                        speeches,
+                        prefix,
+                    )
+
+                # Queue for the batched writer
+                writer.put_result(bill.id, bill.debate_count, result, input_hash, model)
+
+                print(f"{prefix}   ✓ Summary completed")
+                print(f"{prefix}     Pro:" f" {len(result['proArguments'])}" " points")
+                print(f"{prefix}     Con:" f" {len(result['conArguments'])}" " points")
 
-            with lock:
                 results["success"] += 1
+                return True
 
-            return True
-
-        except Exception as e:
-            print(f"{prefix}   ✗ Error: {e}")
-            upsert_debate_summary(
-                thread_conn,
-                bill["id"],
-                bill["debate_count"],
-                "failed",
-                error=str(e),
-            )
-            with lock:
+            except Exception as e:
+                print(f"{prefix}   ✗ Error: {e}")
+                writer.put_status(bill.id, bill.debate_count, "failed", str(e))
                 results["error"] += 1
-            return False
+                return False
+
+    async def process_all():
+        # One shared client; the semaphore caps the number of bills in flight
+        # and the limiter paces their requests to the RPM/TPM quota.
+        # Rate limits, 5xx and timeouts are retried by the SDK, which backs off
+        # exponentially with jitter and honours Retry-After, so a transient
+        # 429 no longer throws away the chunk summaries already paid for
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = RateLimiter(args.rpm, args.tpm)
+        async with create_async_client(openai_api_key, concurrency * 2) as async_client:
+            await asyncio.gather(
+                *(
+                    process_bill(async_client, limiter, semaphore, i, bill)
+                    for i, bill in enumerate(bills)
+                )
+            )
 
-        finally:
-            thread_conn.close()
-
-    # Process bills with concurrency
-    if args.concurrency > 1:
-        print(f"Processing with {args.concurrency} parallel workers...\n")
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {
-                executor.submit(process_bill, i, bill): bill
-                for i, bill in enumerate(bills)
-            }
-            for future in as_completed(futures):
-                # Results are already tracked in the results dict
-                pass
-    else:
-        # Sequential processing
-        for i, bill in enumerate(bills):
-            process_bill(i, bill)
-            time.sleep(DELAY_BETWEEN_REQUESTS)
+    print(f"Processing with up to {concurrency} concurrent bills...\n")
+    asyncio.run(process_all())
+    writer.close()
+    pool.closeall()
+
+    # Summaries the writer could not save are not successes
+    results["success"] -= writer.failed_writes
+    results["error"] += writer.failed_writes
 
     print()
     print("=" * 60)
     print(f"Completed: {results['success']} success," f" {results['error']} errors")
+    if writer.failed_writes:
+        print(f"{writer.failed_writes} summaries could not be saved")
     print("=" * 60)
 
     conn.close()
 
+    if writer.failed_writes:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -3,178 +3,600 @@
 Reduce bill embeddings to 2D using PCA for visualization.
 """
 
+import io
 import os
 import sys
 import json
+import struct
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import List, Tuple
 import psycopg2
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 
 load_dotenv()
 
 try:
-    from sklearn.decomposition import PCA
+    from sklearn.decomposition import PCA, IncrementalPCA
 except ImportError:
     print("scikit-learn not installed. Run: pip install scikit-learn")
     sys.exit(1)
 
+try:
+    import orjson
 
-def reduce_embeddings_to_2d(database_url: str, cluster_id: int = None):
-    """Load embeddings and reduce to 2D using PCA."""
-    conn = psycopg2.connect(database_url)
-    cursor = conn.cursor()
+    json_loads = orjson.loads
 
-    # Get all embeddings with bill details
-    cursor.execute(
-        """
-        SELECT
-            be.bill_id,
-            be.embedding,
-            b.type,
-            b.submission_session,
-            b.number,
-            b.title
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+try:
+    import cuml
+except ImportError:
+    # Optional GPU backend (RAPIDS cuML)
+    cuml = None
+
+
+# Rows fetched per round trip while the table may still fit in memory
+EMBEDDING_BATCH_SIZE = 512
+
+# Beyond that, IncrementalPCA batches use sklearn's default of 5 rows per
+# dimension, capped to this many bytes of float32 embeddings per batch
+STREAM_BATCH_BYTES = 64 * 1024 * 1024
+
+# Coordinate rows sent per UPDATE statement
+UPDATE_PAGE_SIZE = 500
+
+# Up to this many embeddings are fitted in memory with randomized PCA;
+# larger tables are streamed through IncrementalPCA
+IN_MEMORY_MAX_BILLS = 20_000
+
+# Only the columns the PCA needs; bill metadata is fetched per batch when
+# the coordinates are written out. The JSON text is parsed into float4[] by
+# PostgreSQL and sent in binary, one page of bills after the last bill_id seen.
+EMBEDDINGS_COPY_QUERY = """
+    COPY (
+        SELECT bill_id, translate(embedding, '[]', '{}')::real[]
+        FROM bill_embeddings
+        WHERE bill_id > %s
+        ORDER BY bill_id
+        LIMIT %s
+    ) TO STDOUT WITH (FORMAT binary)
+"""
+
+# Embeddings added since a projection was saved, plus assigned bills of the
+# clustering that still have no coordinates, for --incremental runs; paged
+# the same way, with (cluster_id, since) ahead of the keyset parameters
+CHANGED_EMBEDDINGS_COPY_QUERY = """
+    COPY (
+        SELECT be.bill_id, translate(be.embedding, '[]', '{}')::real[]
         FROM bill_embeddings be
-        JOIN bill b ON be.bill_id = b.id
+        LEFT JOIN bill_cluster_assignments bca
+            ON bca.bill_id = be.bill_id AND bca.cluster_id = %s
+        WHERE (
+            be.created_at > %s::timestamp
+            OR (bca.bill_id IS NOT NULL AND bca.x IS NULL)
+        )
+            AND be.bill_id > %s
         ORDER BY be.bill_id
+        LIMIT %s
+    ) TO STDOUT WITH (FORMAT binary)
+"""
+
+# PostgreSQL binary COPY framing: 11-byte signature, flags, extension length
+PGCOPY_HEADER_SIZE = 19
+PGCOPY_TRAILER_SIZE = 2
+
+
+def embeddings_copy_dtype(dim: int) -> np.dtype:
     """
+    Binary COPY row layout of (bill_id int4, embedding float4[dim]).
+
+    Every field is big-endian: the field count, each field's byte length,
+    the one-dimensional array header and a length prefix per element.
+    """
+    return np.dtype(
+        [
+            ("field_count", ">i2"),
+            ("bill_id_size", ">i4"),
+            ("bill_id", ">i4"),
+            ("array_size", ">i4"),
+            ("ndim", ">i4"),
+            ("has_nulls", ">i4"),
+            ("element_type", ">i4"),
+            ("dim", ">i4"),
+            ("lower_bound", ">i4"),
+            ("values", [("size", ">i4"), ("value", ">f4")], (dim,)),
+        ]
     )
 
-    rows = cursor.fetchall()
 
-    if len(rows) < 2:
-        print("Need at least 2 bills with embeddings for visualization")
+def parse_embeddings_copy(data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decode a binary COPY of (bill_id, embedding) rows.
+
+    All rows share one fixed-size layout, so the payload is viewed as a
+    single structured array and converted to (bill_ids, float32 matrix)
+    without creating a Python object per row or per value.
+    """
+    extension_size = struct.unpack_from(">i", data, PGCOPY_HEADER_SIZE - 4)[0]
+    body_start = PGCOPY_HEADER_SIZE + extension_size
+    body_end = len(data) - PGCOPY_TRAILER_SIZE
+    body = data[body_start:body_end]
+    if not body:
+        return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32)
+
+    dim_offset = embeddings_copy_dtype(0).fields["dim"][1]
+    dim = struct.unpack_from(">i", body, dim_offset)[0]
+    row_dtype = embeddings_copy_dtype(dim)
+    if len(body) % row_dtype.itemsize:
+        raise ValueError("Embeddings have inconsistent dimensions")
+
+    records = np.frombuffer(body, dtype=row_dtype)
+    if (records["dim"] != dim).any() or (records["values"]["size"] != 4).any():
+        raise ValueError("Embeddings have inconsistent dimensions or null values")
+
+    bill_ids = records["bill_id"].astype(np.int64)
+    matrix = np.ascontiguousarray(records["values"]["value"], dtype=np.float32)
+    return bill_ids, matrix
+
+
+def iter_embedding_batches(
+    conn,
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+    after_bill_id: int = 0,
+    query: str = EMBEDDINGS_COPY_QUERY,
+    params: tuple = (),
+):
+    """
+    Stream embeddings in batches of (bill_ids, embeddings_matrix).
+
+    Each batch is one binary COPY of the next `batch_size` bills by primary
+    key (starting after `after_bill_id`), decoded straight into a
+    C-contiguous float32 array, so neither the full result set nor any
+    per-row Python objects are ever held in memory. float32 halves the
+    memory traffic of the PCA, which sklearn keeps in single precision.
+    `query` takes `params` followed by the last bill_id seen and the page
+    size.
+
+    The next page is fetched on a background thread while the caller works
+    on the current one, so the database round trip overlaps with the PCA
+    and the output writes (statements on the shared connection still run
+    one at a time).
+    """
+    cursor = conn.cursor()
+
+    def fetch_page(last_bill_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        copy_query = cursor.mogrify(query, params + (last_bill_id, batch_size))
+        buf = io.BytesIO()
+        cursor.copy_expert(copy_query.decode(), buf)
+        return parse_embeddings_copy(buf.getvalue())
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(fetch_page, after_bill_id)
+    try:
+        while future is not None:
+            bill_ids, batch = future.result()
+            if len(bill_ids) == 0:
+                break
+
+            future = None
+            if len(bill_ids) == batch_size:
+                future = pool.submit(fetch_page, int(bill_ids[-1]))
+
+            yield bill_ids, batch
+    finally:
+        # An abandoned stream still waits for its prefetch before closing
+        pool.shutdown(wait=True)
         cursor.close()
-        conn.close()
-        return
 
-    # Parse embeddings
-    bill_ids = []
-    embeddings = []
-    bills_info = []
-
-    for row in rows:
-        bill_ids.append(row[0])
-        embeddings.append(json.loads(row[1]))
-        bills_info.append(
-            {
-                "billId": row[0],
-                "type": row[2],
-                "session": row[3],
-                "number": row[4],
-                "title": row[5] or "Untitled",
-            }
-        )
 
-    embeddings_matrix = np.array(embeddings)
+def fetch_bills_info(
+    cursor, bill_ids: np.ndarray, cluster_id: int = None
+) -> List[tuple]:
+    """
+    Load visualization metadata and cluster labels for the given sorted bill IDs.
 
-    print(
-        f"Reducing {len(bill_ids)} embeddings"
-        f" from {embeddings_matrix.shape[1]}D"
-        " to 2D using PCA..."
+    Rows come back ordered by id, aligned with bill_ids (every embedding
+    references an existing bill), as (id, type, submission_session, number,
+    title, cluster_label); cluster_label is None for bills without an
+    assignment in the given clustering.
+    """
+    cursor.execute(
+        """
+        SELECT b.id, b.type, b.submission_session, b.number, b.title,
+               bca.cluster_label
+        FROM bill b
+        LEFT JOIN bill_cluster_assignments bca
+            ON bca.bill_id = b.id AND bca.cluster_id = %s
+        WHERE b.id = ANY(%s)
+        ORDER BY b.id
+    """,
+        (cluster_id, bill_ids.tolist()),
     )
+    return cursor.fetchall()
 
-    # Apply PCA
-    pca = PCA(n_components=2)
-    reduced = pca.fit_transform(embeddings_matrix)
 
-    print(f"Explained variance: {pca.explained_variance_ratio_}")
-    print("Total variance explained:" f" {sum(pca.explained_variance_ratio_):.2%}")
+def stream_batch_size(dim: int) -> int:
+    """Rows per streamed IncrementalPCA batch for `dim`-dimensional embeddings."""
+    return max(EMBEDDING_BATCH_SIZE, min(5 * dim, STREAM_BATCH_BYTES // (4 * dim)))
 
-    # Get cluster assignments
-    cluster_assignments = {}
-    if cluster_id is not None:
-        # Use specified cluster
-        cursor.execute(
-            """
-            SELECT bill_id, cluster_label
-            FROM bill_cluster_assignments
-            WHERE cluster_id = %s
-        """,
-            (cluster_id,),
-        )
 
-        for bill_id, label in cursor.fetchall():
-            cluster_assignments[bill_id] = int(label)
+class GramPCA2D:
+    """
+    2-component PCA through the N x N Gram matrix, for fewer rows than columns.
 
-        print(f"Loaded cluster assignments from cluster {cluster_id}")
+    The top eigenvectors of Xc Xc^T, scaled by the square roots of their
+    eigenvalues, are the projected coordinates, so with N < D this decomposes
+    an N x N matrix instead of running SVD over the D-dimensional features.
+    Exposes the fitted attributes the caller reads from sklearn's PCA.
+    """
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """Fit on X, centering it in place, and return its 2D coordinates."""
+        self.mean_ = X.mean(axis=0)
+        X -= self.mean_
+
+        gram = X @ X.T
+        eigenvalues, eigenvectors = np.linalg.eigh(gram.astype(np.float64))
+        top = eigenvalues[::-1][:2].clip(min=0)
+        vectors = eigenvectors[:, ::-1][:, :2]
+        scale = np.sqrt(top)
+
+        components = (X.T @ vectors.astype(X.dtype)).T
+        components /= np.where(scale > 0, scale, 1)[:, None].astype(X.dtype)
+        # Same sign convention as sklearn: largest loading of each is positive
+        signs = np.sign(components[np.arange(2), np.abs(components).argmax(axis=1)])
+        signs[signs == 0] = 1
+
+        self.components_ = components * signs[:, None].astype(X.dtype)
+        self.explained_variance_ = top / (len(X) - 1)
+        self.explained_variance_ratio_ = top / max(eigenvalues.clip(min=0).sum(), 1e-30)
+        return (vectors * (scale * signs)).astype(X.dtype)
+
+
+def fit_pca_2d(conn, backend: str = "cpu"):
+    """
+    Fit a 2-component PCA on all embeddings.
+
+    Up to IN_MEMORY_MAX_BILLS embeddings are fitted at once with randomized
+    SVD, which only computes the two components needed (or with GramPCA2D
+    when there are fewer embeddings than dimensions), and are projected in
+    the same pass, so they need not be read again. The gpu backend fits the
+    same way with cuML's PCA and IncrementalPCA. Larger tables are fitted
+    batch by batch with IncrementalPCA, reading the rest of the table in
+    batches of stream_batch_size rows, and must be re-read for projection
+    with pca.batch_size.
+
+    Returns:
+        Tuple of (pca, projected batches or None, bill_count, method); pca is
+        None when there are fewer than 2 embeddings
+    """
+    stream = iter_embedding_batches(conn)
+    batches = []
+    bill_count = 0
+
+    for bill_ids, batch in stream:
+        batches.append((bill_ids, batch))
+        bill_count += len(bill_ids)
+        if bill_count > IN_MEMORY_MAX_BILLS:
+            break
     else:
-        # Use latest cluster if no cluster specified
-        cursor.execute(
-            """
-            SELECT DISTINCT cluster_id FROM bill_cluster_assignments
-            ORDER BY cluster_id DESC LIMIT 1
-        """
-        )
-        latest_cluster = cursor.fetchone()
-
-        if latest_cluster:
-            cluster_id = latest_cluster[0]
-            cursor.execute(
-                """
-                SELECT bill_id, cluster_label
-                FROM bill_cluster_assignments
-                WHERE cluster_id = %s
-            """,
-                (cluster_id,),
+        if bill_count < 2:
+            return None, batches, bill_count, None
+        # The batches are C-contiguous float32, as is their concatenation, so
+        # the estimator can use the buffer as is; with copy=False it is centered
+        # in place instead of being copied first, which is safe because the
+        # coordinates come out of the same fit_transform call
+        matrix = np.concatenate([batch for _, batch in batches])
+        if backend == "gpu":
+            pca = cuml.decomposition.PCA(n_components=2, output_type="numpy")
+            method = "PCA on GPU (cuML)"
+        elif matrix.shape[0] < matrix.shape[1]:
+            pca = GramPCA2D()
+            method = "PCA via the Gram matrix"
+        else:
+            pca = PCA(
+                n_components=2, svd_solver="randomized", random_state=0, copy=False
             )
-
-            for bill_id, label in cursor.fetchall():
-                cluster_assignments[bill_id] = int(label)
-
-            print(f"Loaded cluster assignments from cluster {cluster_id}")
-
-    # Create visualization data and prepare database updates
-    viz_data = []
-    db_updates = []
-    for i, bill_info in enumerate(bills_info):
-        x_val = float(reduced[i, 0])
-        y_val = float(reduced[i, 1])
-        cluster_label = cluster_assignments.get(bill_info["billId"], -1)
-
-        viz_data.append(
-            {
-                **bill_info,
-                "x": x_val,
-                "y": y_val,
-                "cluster": cluster_label,
-            }
+            method = "randomized PCA"
+        reduced = pca.fit_transform(matrix)
+        del matrix
+
+        start = 0
+        for i, (bill_ids, _) in enumerate(batches):
+            end = start + len(bill_ids)
+            batches[i] = (bill_ids, reduced[start:end])
+            start = end
+        return pca, batches, bill_count, method
+
+    stream.close()
+    batch_size = stream_batch_size(batches[0][1].shape[1])
+    last_bill_id = int(batches[-1][0][-1])
+
+    if backend == "gpu":
+        pca = cuml.decomposition.IncrementalPCA(
+            n_components=2, batch_size=batch_size, output_type="numpy"
         )
+        method = "incremental PCA on GPU (cuML)"
+    else:
+        pca = IncrementalPCA(n_components=2, batch_size=batch_size)
+        method = "incremental PCA"
+    for _, batch in batches:
+        pca.partial_fit(batch)
+    batches = None
+
+    for bill_ids, batch in iter_embedding_batches(conn, batch_size, last_bill_id):
+        pca.partial_fit(batch)
+        bill_count += len(bill_ids)
+
+    return pca, None, bill_count, method
+
+
+def viz_record(row: tuple, x: float, y: float) -> dict:
+    """Build the visualization record of a fetch_bills_info row."""
+    return {
+        "billId": row[0],
+        "type": row[1],
+        "session": row[2],
+        "number": row[3],
+        "title": row[4] or "Untitled",
+        "x": x,
+        "y": y,
+        "cluster": -1 if row[5] is None else row[5],
+    }
+
+
+def basis_file_for(output_file: str) -> str:
+    """Path of the saved PCA basis that goes with a visualization file."""
+    return os.path.splitext(output_file)[0] + "_pca.npz"
+
+
+def save_basis(basis_file: str, mean: np.ndarray, components: np.ndarray, since):
+    """Atomically save a PCA basis and the time its embeddings were read."""
+    with open(basis_file + ".tmp", "wb") as f:
+        np.savez(
+            f,
+            mean=np.asarray(mean, dtype=np.float32),
+            components=np.asarray(components, dtype=np.float32),
+            since=str(since),
+        )
+    os.replace(basis_file + ".tmp", basis_file)
 
-        # Only add to updates if we have a valid cluster assignment
-        if cluster_id is not None and bill_info["billId"] in cluster_assignments:
-            db_updates.append((x_val, y_val, cluster_id, bill_info["billId"]))
 
-    # Update x, y coordinates in database
-    if db_updates:
-        cursor.executemany(
-            """
-            UPDATE bill_cluster_assignments
-            SET x = %s, y = %s
-            WHERE cluster_id = %s AND bill_id = %s
-            """,
-            db_updates,
-        )
+def update_changed_projection(conn, cluster_id: int, output_file: str, basis_file: str):
+    """
+    Project only changed embeddings onto the saved PCA basis.
+
+    Embeddings created since the basis was saved, and assigned bills without
+    coordinates, are projected with the basis of the last full run; their
+    coordinates are written to the database and their records replaced in
+    (or added to) the existing visualization file. The rest of the file is
+    left as is, so only the changed rows are serialized anew.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT now()")
+    started_at = cursor.fetchone()[0]
+
+    with np.load(basis_file) as basis:
+        mean = basis["mean"]
+        components = basis["components"]
+        since = str(basis["since"])
+
+    changed = {}
+    update_count = 0
+    for bill_ids, batch in iter_embedding_batches(
+        conn, query=CHANGED_EMBEDDINGS_COPY_QUERY, params=(cluster_id, since)
+    ):
+        if batch.shape[1] != components.shape[1]:
+            print(
+                "Note: embedding dimension changed since the saved projection."
+                " Run without --incremental to refit."
+            )
+            cursor.close()
+            return
+
+        batch -= mean
+        reduced = batch @ components.T
+        rows = fetch_bills_info(cursor, bill_ids, cluster_id)
+        for row, x_val, y_val in zip(
+            rows, reduced[:, 0].tolist(), reduced[:, 1].tolist()
+        ):
+            changed[row[0]] = viz_record(row, x_val, y_val)
+
+        if cluster_id is not None:
+            assigned = np.fromiter(
+                (row[5] is not None for row in rows), dtype=bool, count=len(rows)
+            )
+            update_count += update_coordinates(
+                cursor, cluster_id, bill_ids[assigned], reduced[assigned]
+            )
+
+    print(f"Projected {len(changed)} changed embeddings onto the saved basis")
+    changed_count = len(changed)
+    if changed:
+        with open(output_file, "rb") as f:
+            records = json_loads(f.read())
+        for i, record in enumerate(records):
+            if record["billId"] in changed:
+                records[i] = changed.pop(record["billId"])
+        if changed:
+            records.extend(changed.values())
+            records.sort(key=lambda record: record["billId"])
+
+        with open(output_file + ".tmp", "wb") as f:
+            f.write(b"[")
+            for i, record in enumerate(records):
+                f.write(b",\n" if i else b"\n")
+                f.write(json_dumps(record))
+            f.write(b"\n]\n")
+
+    if update_count:
         conn.commit()
         print(
             "\n\u2713 Updated"
-            f" {len(db_updates)}"
+            f" {update_count}"
             " bill_cluster_assignments"
             " with x, y coordinates"
         )
 
+    if changed_count:
+        os.replace(output_file + ".tmp", output_file)
+        print(f"✓ Updated {changed_count} bills in {output_file}")
+    save_basis(basis_file, mean, components, started_at)
+    cursor.close()
+
+
+def update_coordinates(
+    cursor, cluster_id: int, bill_ids: np.ndarray, coords: np.ndarray
+) -> int:
+    """Write x, y for the given bills of a clustering; returns the row count."""
+    if len(bill_ids) == 0:
+        return 0
+
+    # One multi-row UPDATE per page instead of a round trip per bill
+    execute_values(
+        cursor,
+        """
+        UPDATE bill_cluster_assignments AS t
+        SET x = v.x, y = v.y
+        FROM (VALUES %s) AS v (x, y, cluster_id, bill_id)
+        WHERE t.cluster_id = v.cluster_id AND t.bill_id = v.bill_id
+        """,
+        zip(
+            coords[:, 0].tolist(),
+            coords[:, 1].tolist(),
+            repeat(cluster_id),
+            bill_ids.tolist(),
+        ),
+        page_size=UPDATE_PAGE_SIZE,
+    )
+    return len(bill_ids)
+
+
+def reduce_embeddings_to_2d(
+    database_url: str,
+    cluster_id: int = None,
+    backend: str = "cpu",
+    incremental: bool = False,
+):
+    """
+    Load embeddings and reduce to 2D using PCA.
+
+    With incremental, a clustering whose visualization was already generated
+    only has its changed embeddings projected onto the saved PCA basis (see
+    update_changed_projection); otherwise PCA is refitted on all embeddings.
+    """
+    if backend == "gpu" and cuml is None:
+        print("Note: cuml not installed. Falling back to CPU backend.")
+        backend = "cpu"
+
+    conn = psycopg2.connect(database_url)
+    cursor = conn.cursor()
+
+    # Cluster labels are joined onto each batch's metadata query; use the
+    # latest cluster if no cluster specified
+    if cluster_id is None:
+        cursor.execute("SELECT max(cluster_id) FROM bill_cluster_assignments")
+        cluster_id = cursor.fetchone()[0]
+
+    if cluster_id is not None:
+        print(f"Using cluster assignments from cluster {cluster_id}")
+
     # Save to cluster-specific file if cluster_id is provided,
     # otherwise use default
     if cluster_id is not None:
         output_file = "static/data/" f"bill_embeddings_2d_cluster_{cluster_id}.json"
     else:
         output_file = "static/data/bill_embeddings_2d.json"
+    basis_file = basis_file_for(output_file)
+
+    if incremental:
+        if os.path.exists(output_file) and os.path.exists(basis_file):
+            update_changed_projection(conn, cluster_id, output_file, basis_file)
+            cursor.close()
+            conn.close()
+            return
+        print("Note: no saved projection to update. Running a full projection.")
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(viz_data, f, ensure_ascii=False, indent=2)
+    # Embeddings created after this are picked up by the next incremental run
+    cursor.execute("SELECT now()")
+    started_at = cursor.fetchone()[0]
+
+    pca, batches, bill_count, method = fit_pca_2d(conn, backend)
+
+    if pca is None:
+        print("Need at least 2 bills with embeddings for visualization")
+        cursor.close()
+        conn.close()
+        return
+
+    print(
+        f"Reduced {bill_count} embeddings"
+        f" from {pca.components_.shape[1]}D"
+        f" to 2D using {method}"
+    )
+    print(f"Explained variance: {pca.explained_variance_ratio_}")
+    print("Total variance explained:" f" {sum(pca.explained_variance_ratio_):.2%}")
+
+    # Project each batch (re-reading the table when it was streamed) and
+    # write out its visualization records and coordinates before the next,
+    # one record at a time; the file only replaces the old one once complete
+    if batches is None:
+        batches = (
+            (bill_ids, pca.transform(batch))
+            for bill_ids, batch in iter_embedding_batches(conn, pca.batch_size)
+        )
+
+    viz_count = 0
+    update_count = 0
+    with open(output_file + ".tmp", "wb") as f:
+        f.write(b"[")
+        for bill_ids, reduced in batches:
+            rows = fetch_bills_info(cursor, bill_ids, cluster_id)
+            # A label of -1 alone is HDBSCAN noise, not a missing assignment
+            assigned = np.fromiter(
+                (row[5] is not None for row in rows), dtype=bool, count=len(rows)
+            )
+
+            for row, x_val, y_val in zip(
+                rows, reduced[:, 0].tolist(), reduced[:, 1].tolist()
+            ):
+                f.write(b",\n" if viz_count else b"\n")
+                f.write(json_dumps(viz_record(row, x_val, y_val)))
+                viz_count += 1
+
+            # Only update bills with a cluster assignment
+            if cluster_id is not None:
+                update_count += update_coordinates(
+                    cursor, cluster_id, bill_ids[assigned], reduced[assigned]
+                )
+        f.write(b"\n]\n")
+
+    # Update x, y coordinates in database
+    if update_count:
+        conn.commit()
+        print(
+            "\n\u2713 Updated"
+            f" {update_count}"
+            " bill_cluster_assignments"
+            " with x, y coordinates"
+        )
+
+    os.replace(output_file + ".tmp", output_file)
+    save_basis(basis_file, pca.mean_, pca.components_, started_at)
 
     print(f"✓ Saved 2D visualization data to {output_file}")
-    print(f"  {len(viz_data)} bills")
+    print(f"  {viz_count} bills")
     if cluster_id is not None:
         print(f"  Cluster ID: {cluster_id}")
 
@@ -188,6 +610,20 @@ def main():
         print("Error: DATABASE_URL environment variable not set")
         sys.exit(1)
 
+    incremental = "--incremental" in sys.argv
+    if incremental:
+        sys.argv.remove("--incremental")
+
+    backend = "cpu"
+    if "--backend" in sys.argv:
+        idx = sys.argv.index("--backend")
+        backend = sys.argv[idx + 1].lower() if idx + 1 < len(sys.argv) else ""
+        end = idx + 2
+        del sys.argv[idx:end]
+        if backend not in ("cpu", "gpu"):
+            print("Error: --backend must be 'cpu' or 'gpu'")
+            sys.exit(1)
+
     # Check if cluster ID is provided as argument
     cluster_id = None
     if len(sys.argv) > 1:
@@ -198,7 +634,7 @@ def main():
             print("Error: Cluster ID must be an integer")
             sys.exit(1)
 
-    reduce_embeddings_to_2d(database_url, cluster_id)
+    reduce_embeddings_to_2d(database_url, cluster_id, backend, incremental)
 
 
 if __name__ == "__main__":
@@ -503,72 +503,81 @@ export type BillEnrichment = typeof billEnrichment.$inferSelect;
 export type NewBillEnrichment = typeof billEnrichment.$inferInsert;
 
 // Bill debates table - records from Kokkai API (National Diet proceedings)
-export const billDebates = pgTable('bill_debates', {
-	id: serial('id').primaryKey(),
-	billId: integer('bill_id')
-		.notNull()
-		.references(() => bill.id, { onDelete: 'cascade' }),
+export const billDebates = pgTable(
+	'bill_debates',
+	{
+		id: serial('id').primaryKey(),
+		billId: integer('bill_id')
+			.notNull()
+			.references(() => bill.id, { onDelete: 'cascade' }),
 
-	// Meeting info from Kokkai API
-	meetingId: text('meeting_id').notNull(), // issueID from API
-	speechId: text('speech_id').notNull().unique(), // speechID from API
-	session: integer('session')
-		.notNull()
-		.references(() => congressSession.sessionNumber), // 国会回次
-	house: text('house').notNull(), // 院名 (衆議院/参議院)
-	meetingName: text('meeting_name').notNull(), // 会議名
-	issueNumber: text('issue_number'), // 号数
-	meetingDate: date('meeting_date'), // 開催日付
-
-	// Speaker info
-	speakerName: text('speaker_name').notNull(),
-	speakerGroup: text('speaker_group'), // 所属会派
-	speakerPosition: text('speaker_position'), // 肩書き
-	speakerRole: text('speaker_role'), // 役割 (証人/参考人/公述人)
-
-	// Speech content
-	speechOrder: integer('speech_order'), // 発言番号
-	speechContent: text('speech_content').notNull(), // Full speech text
-	speechUrl: text('speech_url'), // Link to speech on Kokkai site
-
-	// Classification (determined by analysis)
-	speechType: text('speech_type'), // 'pro', 'con', 'neutral', 'explanation', 'question'
+		// Meeting info from Kokkai API
+		meetingId: text('meeting_id').notNull(), // issueID from API
+		speechId: text('speech_id').notNull().unique(), // speechID from API
+		session: integer('session')
+			.notNull()
+			.references(() => congressSession.sessionNumber), // 国会回次
+		house: text('house').notNull(), // 院名 (衆議院/参議院)
+		meetingName: text('meeting_name').notNull(), // 会議名
+		issueNumber: text('issue_number'), // 号数
+		meetingDate: date('meeting_date'), // 開催日付
+
+		// Speaker info
+		speakerName: text('speaker_name').notNull(),
+		speakerGroup: text('speaker_group'), // 所属会派
+		speakerPosition: text('speaker_position'), // 肩書き
+		speakerRole: text('speaker_role'), // 役割 (証人/参考人/公述人)
+
+		// Speech content
+		speechOrder: integer('speech_order'), // 発言番号
+		speechContent: text('speech_content').notNull(), // Full speech text
+		speechUrl: text('speech_url'), // Link to speech on Kokkai site
+
+		// Classification (determined by analysis)
+		speechType: text('speech_type'), // 'pro', 'con', 'neutral', 'explanation', 'question'
 
-	createdAt: timestamp('created_at').notNull().defaultNow()
-});
+		createdAt: timestamp('created_at').notNull().defaultNow()
+	},
+	(table) => [index('idx_bill_debates_bill_id').on(table.billId)]
+);
 
 export type BillDebate = typeof billDebates.$inferSelect;
 export type NewBillDebate = typeof billDebates.$inferInsert;
 
 // Bill debate summary table - LLM-generated summaries of debates
-export const billDebateSummary = pgTable('bill_debate_summary', {
-	billId: integer('bill_id')
-		.primaryKey()
-		.references(() => bill.id, { onDelete: 'cascade' }),
+export const billDebateSummary = pgTable(
+	'bill_debate_summary',
+	{
+		billId: integer('bill_id')
+			.primaryKey()
+			.references(() => bill.id, { onDelete: 'cascade' }),
 
-	// Summary of pro arguments (JSON array of strings)
-	proArgumentsSummary: text('pro_arguments_summary'),
+		// Summary of pro arguments (JSON array of strings)
+		proArgumentsSummary: text('pro_arguments_summary'),
 
-	// Summary of con arguments (JSON array of strings)
-	conArgumentsSummary: text('con_arguments_summary'),
+		// Summary of con arguments (JSON array of strings)
+		conArgumentsSummary: text('con_arguments_summary'),
 
-	// Key questions raised during debates
-	keyQuestions: text('key_questions'),
+		// Key questions raised during debates
+		keyQuestions: text('key_questions'),
 
-	// Government explanations/responses
-	governmentExplanations: text('government_explanations'),
+		// Government explanations/responses
+		governmentExplanations: text('government_explanations'),
 
-	// Total number of debate records
-	debateCount: integer('debate_count').notNull().default(0),
+		// Total number of debate records
+		debateCount: integer('debate_count').notNull().default(0),
 
-	// Processing metadata
-	status: enrichmentStatusEnum('status').notNull().default('pending'),
-	llmModel: text('llm_model'),
-	errorMessage: text('error_message'),
+		// Processing metadata
+		status: enrichmentStatusEnum('status').notNull().default('pending'),
+		llmModel: text('llm_model'),
+		inputHash: text('input_hash'), // Hash of model, prompt version and speeches, for result reuse
+		errorMessage: text('error_message'),
 
-	createdAt: timestamp('created_at').notNull().defaultNow(),
-	updatedAt: timestamp('updated_at').notNull().defaultNow()
-});
+		createdAt: timestamp('created_at').notNull().defaultNow(),
+		updatedAt: timestamp('updated_at').notNull().defaultNow()
+	},
+	(table) => [index('idx_bill_debate_summary_input_hash').on(table.inputHash)]
+);
 
 export type BillDebateSummary = typeof billDebateSummary.$inferSelect;
 export type NewBillDebateSummary = typeof billDebateSummary.$inferInsert;